@@ -13,5 +13,6 @@ from django.core.asgi import get_asgi_application
 
 # TODO: change this in production
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.django.local")
+os.environ.setdefault("DJANGO_ASYNC_VIEWS", "true")
 
 application = get_asgi_application()
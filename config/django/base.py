@@ -15,6 +15,9 @@ ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=["*"])
 LOCAL_APPS = [
     "portfolio.apps.PortfolioConfig",
     "submissions.apps.SubmissionsConfig",
+    "jobs.apps.JobsConfig",
+    "metrics.apps.MetricsConfig",
+    "ingestion.apps.IngestionConfig",
 ]
 
 THIRD_PARTY_APPS = [
@@ -39,6 +42,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "metrics.middleware.RequestMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
@@ -67,6 +71,10 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
+
+# Serve the portfolio read endpoints with async views (enabled by config.asgi).
+PORTFOLIO_ASYNC_VIEWS = env.bool("DJANGO_ASYNC_VIEWS", default=False)
 
 DATABASES = {"default": env.db("DATABASE_URL")}
 
@@ -144,7 +152,13 @@ LOGGING = {
     "loggers": {"": {"handlers": ["console"], "level": "DEBUG"}},
 }
 
+from config.settings.cache import *  # noqa
 from config.settings.ckeditor import *  # noqa
 from config.settings.cors import *  # noqa
+from config.settings.ingestion import *  # noqa
+from config.settings.jobs import *  # noqa
+from config.settings.metrics import *  # noqa
 from config.settings.rest import *  # noqa
 from config.settings.swagger import *  # noqa
+from config.settings.throttling import *  # noqa
+from config.settings.uploads import *  # noqa
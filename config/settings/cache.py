@@ -0,0 +1,9 @@
+from config.env import env
+
+CACHES = {"default": env.cache("DJANGO_CACHE_URL", default="locmemcache://")}
+
+PORTFOLIO_RESPONSE_CACHE_TIMEOUT = env.int(
+    "PORTFOLIO_RESPONSE_CACHE_TIMEOUT", default=60 * 60 * 24
+)
+
+PORTFOLIO_BACKGROUND_TASKS = env.bool("PORTFOLIO_BACKGROUND_TASKS", default=True)
@@ -0,0 +1,16 @@
+import os
+
+from config.env import BASE_DIR, env
+
+# Accept comments, contacts and orders into a local spool and insert them in
+# batches with ``python manage.py flush_ingestion`` instead of one by one.
+INGESTION_BUFFERED = env.bool("INGESTION_BUFFERED", default=False)
+
+INGESTION_SPOOL_PATH = env.str(
+    "INGESTION_SPOOL_PATH", default=os.path.join(BASE_DIR, "spool", "ingestion.sqlite3")
+)
+
+INGESTION_BATCH_SIZE = env.int("INGESTION_BATCH_SIZE", default=500)
+
+# Seconds between flushes of the spool.
+INGESTION_FLUSH_INTERVAL = env.float("INGESTION_FLUSH_INTERVAL", default=2)
@@ -0,0 +1,9 @@
+from config.env import env
+
+JOBS_MAX_ATTEMPTS = env.int("JOBS_MAX_ATTEMPTS", default=5)
+
+# Seconds before the first retry, doubled after every failed attempt.
+JOBS_RETRY_BACKOFF = env.int("JOBS_RETRY_BACKOFF", default=30)
+
+# Seconds after which a running job is considered abandoned by its worker.
+JOBS_LOCK_TIMEOUT = env.int("JOBS_LOCK_TIMEOUT", default=60 * 10)
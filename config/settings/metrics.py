@@ -0,0 +1,9 @@
+from config.env import env
+
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=True)
+
+# Requests running more queries than this are logged; 0 disables the check.
+METRICS_QUERY_BUDGET = env.int("METRICS_QUERY_BUDGET", default=0)
+
+# Requests slower than this many milliseconds are logged; 0 disables the check.
+METRICS_LATENCY_BUDGET = env.int("METRICS_LATENCY_BUDGET", default=0)
@@ -1,3 +1,8 @@
+from config.env import env
+
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Reverse proxies in front of the app whose X-Forwarded-For entries are
+    # trusted; 0 identifies clients by REMOTE_ADDR only.
+    "NUM_PROXIES": env.int("REST_NUM_PROXIES", default=0),
 }
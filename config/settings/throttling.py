@@ -0,0 +1,12 @@
+from config.env import env
+
+THROTTLE_ENABLED = env.bool("THROTTLE_ENABLED", default=True)
+
+# Token buckets: requests allowed in a burst, refilled at a steady rate.
+THROTTLE_IP_BURST = env.int("THROTTLE_IP_BURST", default=10)
+THROTTLE_IP_PER_MINUTE = env.float("THROTTLE_IP_PER_MINUTE", default=6)
+THROTTLE_EMAIL_BURST = env.int("THROTTLE_EMAIL_BURST", default=3)
+THROTTLE_EMAIL_PER_MINUTE = env.float("THROTTLE_EMAIL_PER_MINUTE", default=1)
+
+# Seconds during which an identical submission is rejected.
+THROTTLE_DUPLICATE_WINDOW = env.int("THROTTLE_DUPLICATE_WINDOW", default=60 * 10)
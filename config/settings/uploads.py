@@ -0,0 +1,19 @@
+import os
+import tempfile
+
+from config.env import env
+
+# Chunks of resumable resume uploads are appended here until complete.
+RESUME_UPLOAD_TEMP_DIR = env.str(
+    "RESUME_UPLOAD_TEMP_DIR",
+    default=os.path.join(tempfile.gettempdir(), "resume_uploads"),
+)
+
+RESUME_UPLOAD_MAX_SIZE = env.int("RESUME_UPLOAD_MAX_SIZE", default=10 * 1024 * 1024)
+
+RESUME_UPLOAD_CHUNK_SIZE = env.int("RESUME_UPLOAD_CHUNK_SIZE", default=1024 * 1024)
+
+RESUME_MAX_PAGES = env.int("RESUME_MAX_PAGES", default=10)
+
+# Bytes read from the start and end of a resume to check its header and pages.
+RESUME_SNIFF_SIZE = env.int("RESUME_SNIFF_SIZE", default=4 * 1024)
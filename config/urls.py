@@ -41,6 +41,7 @@ urlpatterns += i18n_patterns(
                 path(
                     "submissions/", include("submissions.api.urls"), name="submissions"
                 ),
+                path("internal/metrics/", include("metrics.api.urls")),
                 path(
                     "docs/",
                     include(
@@ -1,7 +1,20 @@
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
 
 @pytest.fixture
 def api_client():
     return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def on_commit(settings, django_capture_on_commit_callbacks):
+    """Run on-commit callbacks, including background tasks, in the test."""
+    settings.PORTFOLIO_BACKGROUND_TASKS = False
+    return lambda: django_capture_on_commit_callbacks(execute=True)
@@ -0,0 +1,33 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...spool import flush_spool
+
+
+class Command(BaseCommand):
+    help = "Insert spooled submissions in batches, flushing until interrupted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true", help="Exit once the spool is empty."
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.INGESTION_FLUSH_INTERVAL,
+            help="Seconds to wait between flushes.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            count = flush_spool()
+            if count:
+                self.stdout.write(self.style.SUCCESS(f"Inserted {count} entries."))
+            if options["once"]:
+                return
+
+            close_old_connections()
+            time.sleep(options["interval"])
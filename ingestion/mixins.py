@@ -0,0 +1,33 @@
+from django.conf import settings
+from rest_framework import status
+from rest_framework.response import Response
+
+from .spool import buffer_submission
+
+
+class BufferedCreateMixin:
+    """
+    With ``INGESTION_BUFFERED`` on, validate a submission and spool it
+    instead of inserting it, answering 202 with the spool entry id. The row
+    is inserted by the next ``flush_ingestion`` run, together with the
+    view's ``post_processing_tasks``.
+    """
+
+    def create(self, request, *args, **kwargs):
+        if not settings.INGESTION_BUFFERED:
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        entry_id = buffer_submission(
+            serializer.Meta.model,
+            self.get_buffered_data(serializer),
+            tasks=getattr(self, "post_processing_tasks", []),
+        )
+        return Response(
+            {**serializer.data, "id": entry_id}, status=status.HTTP_202_ACCEPTED
+        )
+
+    def get_buffered_data(self, serializer) -> dict:
+        """Return the model field values to spool for a valid ``serializer``."""
+        return dict(serializer.validated_data)
@@ -0,0 +1,233 @@
+"""
+A durable local spool for submissions waiting to be inserted.
+
+Entries are appended to a SQLite file next to the application, separate from
+the main database, so accepting a submission costs one local fsync instead
+of a transaction on the main database. ``flush_spool`` moves them into their
+tables with ``bulk_create``; see ``python manage.py flush_ingestion``.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cache
+
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import router, transaction
+from django.db.models.signals import post_save
+
+from jobs.queue import enqueue_many
+from jobs.queue import registry as task_registry
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        id TEXT PRIMARY KEY,
+        model TEXT NOT NULL,
+        data TEXT NOT NULL,
+        tasks TEXT NOT NULL,
+        created_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS failed_entries (
+        id TEXT PRIMARY KEY,
+        model TEXT NOT NULL,
+        data TEXT NOT NULL,
+        tasks TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        error TEXT NOT NULL
+    )
+    """,
+]
+
+
+@dataclass
+class SpoolEntry:
+    id: str
+    model: str
+    data: dict
+    tasks: list
+    created_at: float
+
+
+class Spool:
+    """Entries in a SQLite file, with one connection per thread."""
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+
+    @property
+    def connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=FULL")
+            for statement in SCHEMA:
+                connection.execute(statement)
+            self.local.connection = connection
+        return connection
+
+    def append(self, model, data, tasks=()) -> str:
+        entry_id = uuid.uuid4().hex
+        self.connection.execute(
+            "INSERT INTO entries (id, model, data, tasks, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                entry_id,
+                model,
+                json.dumps(data, cls=DjangoJSONEncoder),
+                json.dumps(list(tasks)),
+                time.time(),
+            ),
+        )
+        return entry_id
+
+    def read(self, limit) -> list:
+        rows = self.connection.execute(
+            "SELECT id, model, data, tasks, created_at FROM entries "
+            "ORDER BY rowid LIMIT ?",
+            (limit,),
+        )
+        return [
+            SpoolEntry(entry_id, model, json.loads(data), json.loads(tasks), created)
+            for entry_id, model, data, tasks, created in rows
+        ]
+
+    @contextmanager
+    def atomic(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def delete(self, entries):
+        with self.atomic():
+            self.connection.executemany(
+                "DELETE FROM entries WHERE id = ?", [(entry.id,) for entry in entries]
+            )
+
+    def fail(self, entry, error):
+        """Set ``entry`` aside so it no longer blocks the rest of the spool."""
+        with self.atomic():
+            self.connection.execute(
+                "INSERT OR REPLACE INTO failed_entries "
+                "(id, model, data, tasks, created_at, error) "
+                "SELECT id, model, data, tasks, created_at, ? FROM entries "
+                "WHERE id = ?",
+                (error, entry.id),
+            )
+            self.connection.execute("DELETE FROM entries WHERE id = ?", (entry.id,))
+
+    def count(self, table="entries") -> int:
+        return self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@cache
+def open_spool(path) -> Spool:
+    return Spool(path)
+
+
+def get_spool() -> Spool:
+    return open_spool(settings.INGESTION_SPOOL_PATH)
+
+
+def buffer_submission(model, data, tasks=()) -> str:
+    """
+    Spool the validated ``data`` of a ``model`` row and return the entry id.
+    ``tasks`` are job queue tasks enqueued with the row once it is inserted.
+    """
+    return get_spool().append(
+        model._meta.label, data, [task.job_name for task in tasks]
+    )
+
+
+def insert_entries(entries):
+    """
+    Insert ``entries`` with one ``bulk_create`` per model and send the
+    ``post_save`` signals ``bulk_create`` skips, in one transaction.
+    """
+    groups = {}
+    for entry in entries:
+        groups.setdefault(entry.model, []).append(entry)
+    jobs = {}
+
+    with transaction.atomic():
+        for label, group in groups.items():
+            model = apps.get_model(label)
+            using = router.db_for_write(model)
+            instances = model.objects.bulk_create(
+                [model(**entry.data) for entry in group]
+            )
+            for instance in instances:
+                post_save.send(
+                    sender=model,
+                    instance=instance,
+                    created=True,
+                    update_fields=None,
+                    raw=False,
+                    using=using,
+                )
+            for entry, instance in zip(group, instances):
+                for name in entry.tasks:
+                    jobs.setdefault(name, []).append(
+                        {"model": label, "pk": instance.pk}
+                    )
+
+        for name, payloads in jobs.items():
+            enqueue_many(task_registry[name], payloads)
+
+
+def flush_spool(batch_size=None) -> int:
+    """
+    Insert spooled entries in batches until the spool is empty and return
+    how many were inserted.
+
+    A batch that fails is retried one entry at a time, and entries that
+    still fail are moved to ``failed_entries``. Entries are deleted from
+    the spool after their batch commits, so a crash in between inserts them
+    again on the next flush.
+    """
+    spool = get_spool()
+    batch_size = batch_size or settings.INGESTION_BATCH_SIZE
+    count = 0
+    while entries := spool.read(batch_size):
+        try:
+            insert_entries(entries)
+        except Exception:
+            logger.exception("Flushing %d spooled entries failed.", len(entries))
+            count += insert_one_by_one(spool, entries)
+        else:
+            spool.delete(entries)
+            count += len(entries)
+    return count
+
+
+def insert_one_by_one(spool, entries) -> int:
+    count = 0
+    for entry in entries:
+        try:
+            insert_entries([entry])
+        except Exception:
+            spool.fail(entry, traceback.format_exc())
+        else:
+            spool.delete([entry])
+            count += 1
+    return count
@@ -0,0 +1,113 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from jobs.models import Job
+from portfolio.models import Comment
+from portfolio.tests.factories import BlogFactory, CommentFactory
+from submissions.models import Contact
+
+from ..spool import flush_spool, get_spool
+
+
+@pytest.fixture(autouse=True)
+def buffered(settings, tmp_path):
+    settings.INGESTION_BUFFERED = True
+    settings.INGESTION_SPOOL_PATH = str(tmp_path / "spool.sqlite3")
+
+
+@pytest.mark.django_db
+class TestBufferedIngestion:
+    url = reverse("create-contact")
+    data = {
+        "first_name": "test first name",
+        "last_name": "test last name",
+        "email": "test@email.com",
+        "phone_number": "test phone",
+        "message": "test message",
+    }
+
+    def test_submission_is_spooled_and_accepted(self, api_client):
+        response = api_client.post(self.url, self.data)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["id"]
+        assert response.data["email"] == "test@email.com"
+        assert get_spool().count() == 1
+        assert not Contact.objects.exists()
+
+    def test_flush_inserts_rows_and_enqueues_post_processing(self, api_client):
+        for index in range(3):
+            api_client.post(self.url, {**self.data, "message": f"message {index}"})
+
+        assert flush_spool(batch_size=2) == 3
+
+        assert Contact.objects.count() == 3
+        assert Job.objects.count() == 3
+        assert get_spool().count() == 0
+
+    def test_invalid_submission_is_not_spooled(self, api_client):
+        response = api_client.post(self.url, {})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert get_spool().count() == 0
+
+    def test_reply_is_spooled_with_its_blog(self, api_client):
+        parent = CommentFactory()
+        url = reverse("blog-comment-create", args=[parent.blog.slug])
+
+        response = api_client.post(
+            url,
+            {
+                "name": "name",
+                "email": "reply@email.com",
+                "text": "reply",
+                "parent": parent.pk,
+            },
+        )
+        flush_spool()
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        reply = Comment.objects.get(parent=parent)
+        assert reply.blog_id == parent.blog_id
+
+    def test_comment_on_missing_blog_is_not_spooled(self, api_client):
+        url = reverse("blog-comment-create", args=["missing"])
+
+        response = api_client.post(
+            url, {"name": "name", "email": "a@email.com", "text": "text"}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert get_spool().count() == 0
+
+    def test_failing_entry_is_set_aside(self, api_client):
+        blog = BlogFactory()
+        comments = blog.comments.count()
+        get_spool().append("portfolio.Comment", {"unknown_field": 1})
+        api_client.post(
+            reverse("blog-comment-create", args=[blog.slug]),
+            {"name": "name", "email": "a@email.com", "text": "text"},
+        )
+
+        assert flush_spool() == 1
+
+        assert blog.comments.count() == comments + 1
+        assert get_spool().count() == 0
+        assert get_spool().count("failed_entries") == 1
+
+    def test_flush_command(self, api_client):
+        api_client.post(self.url, self.data)
+
+        call_command("flush_ingestion", "--once")
+
+        assert Contact.objects.count() == 1
+
+    def test_unbuffered_submission_is_inserted(self, api_client, settings):
+        settings.INGESTION_BUFFERED = False
+
+        response = api_client.post(self.url, self.data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Contact.objects.count() == 1
@@ -0,0 +1,27 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+
+from .models import DeadJob, Job
+from .queue import requeue_dead_job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ["name", "attempts", "run_at", "locked_at", "created_at"]
+    list_per_page = 20
+    list_filter = ["name"]
+    readonly_fields = ["attempts", "locked_at", "last_error", "created_at"]
+
+
+@admin.register(DeadJob)
+class DeadJobAdmin(admin.ModelAdmin):
+    list_display = ["name", "attempts", "created_at", "failed_at"]
+    list_per_page = 20
+    list_filter = ["name"]
+    readonly_fields = ["name", "payload", "attempts", "error", "created_at"]
+    actions = ["requeue"]
+
+    @admin.action(description=_("اجرای دوباره کارهای انتخاب شده"))
+    def requeue(self, request, queryset):
+        for dead_job in queryset:
+            requeue_dead_job(dead_job)
@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...queue import run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = "Run queued jobs, polling for new ones until interrupted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true", help="Exit once no job is due."
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1.0,
+            help="Seconds to wait between polls when the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            count = run_pending_jobs()
+            if count:
+                self.stdout.write(self.style.SUCCESS(f"Ran {count} jobs."))
+            if options["once"]:
+                return
+
+            close_old_connections()
+            if not count:
+                time.sleep(options["sleep"])
@@ -0,0 +1,42 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class Job(models.Model):
+    name = models.CharField(verbose_name=_("نام کار"), max_length=255)
+    payload = models.JSONField(verbose_name=_("ورودی"), default=dict)
+    attempts = models.PositiveSmallIntegerField(verbose_name=_("تعداد تلاش"), default=0)
+    max_attempts = models.PositiveSmallIntegerField(verbose_name=_("حداکثر تلاش"))
+    run_at = models.DateTimeField(verbose_name=_("زمان اجرا"), default=timezone.now)
+    locked_at = models.DateTimeField(
+        verbose_name=_("زمان شروع اجرا"), null=True, blank=True
+    )
+    last_error = models.TextField(verbose_name=_("آخرین خطا"), blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("کار")
+        verbose_name_plural = _("کارها")
+        ordering = ["run_at", "id"]
+        indexes = [models.Index(fields=["run_at", "id"], name="job_run_at_idx")]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk}"
+
+
+class DeadJob(models.Model):
+    name = models.CharField(verbose_name=_("نام کار"), max_length=255)
+    payload = models.JSONField(verbose_name=_("ورودی"), default=dict)
+    attempts = models.PositiveSmallIntegerField(verbose_name=_("تعداد تلاش"))
+    error = models.TextField(verbose_name=_("خطا"))
+    created_at = models.DateTimeField(verbose_name=_("زمان ثبت کار"))
+    failed_at = models.DateTimeField(verbose_name=_("زمان شکست"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("کار ناموفق")
+        verbose_name_plural = _("کارهای ناموفق")
+        ordering = ["-failed_at"]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk}"
@@ -0,0 +1,128 @@
+"""
+A small database-backed job queue.
+
+Tasks are plain functions registered with :func:`task` and enqueued with
+JSON-serializable keyword arguments. ``python manage.py run_jobs`` claims
+due jobs and runs them; failures are retried with exponential backoff and
+moved to :class:`DeadJob` after ``JOBS_MAX_ATTEMPTS`` attempts.
+"""
+
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import DeadJob, Job
+
+registry = {}
+
+
+def task(func):
+    """Register ``func`` so it can be enqueued and run by the worker."""
+    func.job_name = f"{func.__module__}.{func.__name__}"
+    registry[func.job_name] = func
+    return func
+
+
+def enqueue(func, **payload) -> Job:
+    return Job.objects.create(
+        name=func.job_name, payload=payload, max_attempts=settings.JOBS_MAX_ATTEMPTS
+    )
+
+
+def enqueue_many(func, payloads) -> list:
+    """Enqueue ``func`` once per payload with a single insert."""
+    return Job.objects.bulk_create(
+        Job(
+            name=func.job_name, payload=payload, max_attempts=settings.JOBS_MAX_ATTEMPTS
+        )
+        for payload in payloads
+    )
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=settings.JOBS_RETRY_BACKOFF * 2 ** (attempts - 1))
+
+
+def claim_job():
+    """
+    Lock the next due job for this worker, or return ``None``.
+
+    Claiming is a conditional update on ``locked_at``, so concurrent workers
+    never run the same job. Jobs locked for longer than ``JOBS_LOCK_TIMEOUT``
+    belong to a crashed worker and are claimed again.
+    """
+    while True:
+        now = timezone.now()
+        stale = now - timedelta(seconds=settings.JOBS_LOCK_TIMEOUT)
+        job = (
+            Job.objects.filter(run_at__lte=now)
+            .filter(Q(locked_at__isnull=True) | Q(locked_at__lt=stale))
+            .first()
+        )
+        if job is None:
+            return None
+
+        claimed = Job.objects.filter(pk=job.pk, locked_at=job.locked_at).update(
+            locked_at=now, attempts=F("attempts") + 1
+        )
+        if claimed:
+            job.refresh_from_db()
+            return job
+
+
+def fail_job(job: Job, error: str):
+    if job.attempts < job.max_attempts:
+        job.run_at = timezone.now() + get_retry_delay(job.attempts)
+        job.locked_at = None
+        job.last_error = error
+        job.save(update_fields=["run_at", "locked_at", "last_error"])
+        return
+
+    with transaction.atomic():
+        DeadJob.objects.create(
+            name=job.name,
+            payload=job.payload,
+            attempts=job.attempts,
+            error=error,
+            created_at=job.created_at,
+        )
+        job.delete()
+
+
+def run_job(job: Job):
+    try:
+        func = registry.get(job.name)
+        if func is None:
+            raise LookupError(f"Task {job.name} is not registered.")
+        func(**job.payload)
+    except Exception:
+        fail_job(job, traceback.format_exc())
+    else:
+        job.delete()
+
+
+def run_pending_jobs(limit=None) -> int:
+    """Run due jobs until none is left or ``limit`` is reached."""
+    count = 0
+    while limit is None or count < limit:
+        job = claim_job()
+        if job is None:
+            break
+        run_job(job)
+        count += 1
+    return count
+
+
+def requeue_dead_job(dead_job: DeadJob) -> Job:
+    with transaction.atomic():
+        job = Job.objects.create(
+            name=dead_job.name,
+            payload=dead_job.payload,
+            max_attempts=settings.JOBS_MAX_ATTEMPTS,
+        )
+        dead_job.delete()
+    return job
@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from ..models import DeadJob, Job
+from ..queue import claim_job, enqueue, requeue_dead_job, run_pending_jobs, task
+
+calls = []
+
+
+@task
+def record(value):
+    calls.append(value)
+
+
+@task
+def explode():
+    raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+@pytest.mark.django_db
+class TestJobQueue:
+
+    def test_run_pending_jobs_runs_and_deletes_jobs(self):
+        enqueue(record, value=1)
+        enqueue(record, value=2)
+
+        assert run_pending_jobs() == 2
+        assert calls == [1, 2]
+        assert not Job.objects.exists()
+
+    def test_failed_job_is_retried_with_backoff(self, settings):
+        settings.JOBS_RETRY_BACKOFF = 10
+        job = enqueue(explode)
+
+        run_pending_jobs()
+        job.refresh_from_db()
+        first_run_at = job.run_at
+
+        assert job.attempts == 1
+        assert job.locked_at is None
+        assert "RuntimeError: boom" in job.last_error
+        assert first_run_at > timezone.now() + timedelta(seconds=9)
+        assert run_pending_jobs() == 0
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        run_pending_jobs()
+        job.refresh_from_db()
+
+        assert job.attempts == 2
+        assert job.run_at > timezone.now() + timedelta(seconds=19)
+
+    def test_job_moves_to_dead_letter_after_max_attempts(self, settings):
+        settings.JOBS_MAX_ATTEMPTS = 1
+        enqueue(explode)
+
+        run_pending_jobs()
+
+        dead_job = DeadJob.objects.get()
+        assert not Job.objects.exists()
+        assert dead_job.name == explode.job_name
+        assert dead_job.attempts == 1
+
+    def test_unknown_task_fails(self, settings):
+        settings.JOBS_MAX_ATTEMPTS = 1
+        Job.objects.create(name="missing.task", max_attempts=1)
+
+        run_pending_jobs()
+
+        assert "missing.task is not registered" in DeadJob.objects.get().error
+
+    def test_claim_job_skips_locked_and_reclaims_stale_jobs(self, settings):
+        settings.JOBS_LOCK_TIMEOUT = 60
+        job = enqueue(record, value=1)
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now())
+
+        assert claim_job() is None
+
+        Job.objects.filter(pk=job.pk).update(
+            locked_at=timezone.now() - timedelta(seconds=61)
+        )
+        assert claim_job().pk == job.pk
+
+    def test_requeue_dead_job_creates_new_job(self):
+        dead_job = DeadJob.objects.create(
+            name=record.job_name,
+            payload={"value": 3},
+            attempts=5,
+            error="",
+            created_at=timezone.now(),
+        )
+
+        requeue_dead_job(dead_job)
+        run_pending_jobs()
+
+        assert calls == [3]
+        assert not DeadJob.objects.exists()
+
+    def test_run_jobs_command_with_once_drains_queue(self):
+        enqueue(record, value=1)
+
+        call_command("run_jobs", once=True)
+
+        assert calls == [1]
@@ -0,0 +1,16 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..registry import registry
+
+
+@extend_schema(exclude=True)
+class MetricsView(APIView):
+    """Request histograms per endpoint of the process serving the request."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(registry.snapshot())
@@ -0,0 +1,377 @@
+"""
+In-process benchmarks of the public API.
+
+``seed_dataset`` fills the database with the bulk test data generator and
+``run_scenarios`` drives every endpoint with the test client, recording the
+latency, query count and peak allocation of each request. Results are
+stored as JSON per commit so ``compare_results`` can flag regressions.
+``run_serializer_benchmarks`` times the serializers of the read endpoints
+alone, without the database, and ``run_comment_tree_benchmark`` times
+building the reply tree of a blog with many comments.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import time
+import timeit
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connections
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.request import Request
+
+from portfolio import bulk
+from portfolio.api.comment_tree import build_comment_tree, group_comments_by_parent
+from portfolio.api.views import BlogViewSet, HistoryViewSet, ProjectViewSet
+from portfolio.models import Blog, Comment, Project
+
+from .middleware import QueryRecorder
+
+DEFAULT_SCALE = {
+    "projects": 200,
+    "gallery_items": 3,
+    "blogs": 100,
+    "comments": 20,
+    "replies": 2,
+    "histories": 100,
+}
+
+RESUME_CONTENT = b"%PDF-1.4 benchmark resume " * 40
+
+SERIALIZER_CASES = {
+    "projects-list": (ProjectViewSet, "list"),
+    "projects-detail": (ProjectViewSet, "retrieve"),
+    "blogs-list": (BlogViewSet, "list"),
+    "blogs-detail": (BlogViewSet, "retrieve"),
+    "history-list": (HistoryViewSet, "list"),
+}
+
+
+@dataclass
+class Scenario:
+    name: str
+    path: str
+    method: str = "get"
+    data: dict = field(default_factory=dict)
+    format: str = None
+
+    def send(self, client):
+        data = self.data() if callable(self.data) else self.data
+        if self.method == "get":
+            return client.get(self.path, data)
+        if self.format == "multipart":
+            return client.post(self.path, data)
+        return client.post(self.path, data, content_type="application/json")
+
+
+def seed_dataset(scale=None) -> dict:
+    """Create a dataset of ``scale`` rows, ``comments`` being per blog."""
+    scale = {**DEFAULT_SCALE, **(scale or {})}
+    bulk.seed(**scale)
+    return scale
+
+
+def get_scenarios() -> list:
+    """Return a scenario for every public endpoint of the seeded dataset."""
+    project = Project.objects.order_by("pk").first()
+    blog = Blog.objects.order_by("pk").first()
+    comment = Comment.objects.filter(blog=blog, parent__isnull=True).first()
+
+    return [
+        Scenario("projects-list", reverse("projects-list")),
+        Scenario(
+            "projects-list-search", reverse("projects-list"), data={"search": "project"}
+        ),
+        Scenario("projects-detail", reverse("projects-detail", args=[project.slug])),
+        Scenario("blogs-list", reverse("blogs-list")),
+        Scenario("blogs-detail", reverse("blogs-detail", args=[blog.slug])),
+        Scenario(
+            "blogs-detail-depth",
+            reverse("blogs-detail", args=[blog.slug]),
+            data={"depth": 2},
+        ),
+        Scenario("blog-comments-list", reverse("blog-comments-list", args=[blog.slug])),
+        Scenario(
+            "blog-comments-replies",
+            reverse("blog-comments-replies", args=[blog.slug, comment.pk]),
+        ),
+        Scenario("history-list", reverse("history-list")),
+        Scenario(
+            "blog-comment-create",
+            reverse("blog-comment-create", args=[blog.slug]),
+            method="post",
+            data={
+                "name": "Benchmark",
+                "email": "benchmark@example.com",
+                "text": "Benchmark comment",
+                "parent": comment.pk,
+            },
+        ),
+        Scenario(
+            "create-contact",
+            reverse("create-contact"),
+            method="post",
+            data={
+                "first_name": "Benchmark",
+                "last_name": "Client",
+                "email": "benchmark@example.com",
+                "phone_number": "0990000000",
+                "message": "Benchmark message",
+            },
+        ),
+        Scenario(
+            "create-order",
+            reverse("create-order"),
+            method="post",
+            data={
+                "company_name": "Benchmark",
+                "activity_area": "it",
+                "email": "benchmark@example.com",
+                "contact_number": "0990000000",
+                "explanation": "Benchmark order",
+            },
+        ),
+        Scenario(
+            "create-apply-application",
+            reverse("create-apply-application"),
+            method="post",
+            format="multipart",
+            data=lambda: {
+                "first_name": "Benchmark",
+                "last_name": "Applicant",
+                "email": "benchmark@example.com",
+                "phone_number": "0990000000",
+                "education_degree": "BSc",
+                "study_field": "Architecture",
+                "cover_letter": "Benchmark cover letter",
+                "resume": SimpleUploadedFile(
+                    "resume.pdf", RESUME_CONTENT, content_type="application/pdf"
+                ),
+            },
+        ),
+    ]
+
+
+def run_scenario(client, scenario, requests, warm_cache=False) -> dict:
+    """
+    Send ``scenario`` ``requests`` times and summarize the samples.
+
+    The response cache is cleared before every request unless ``warm_cache``
+    is set. Allocations are traced in a separate request so tracing does not
+    skew the latencies.
+    """
+    latencies = []
+    queries = []
+    for _ in range(requests):
+        if not warm_cache:
+            cache.clear()
+        recorder = QueryRecorder()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            started = time.perf_counter()
+            response = scenario.send(client)
+            latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            raise RuntimeError(
+                f"{scenario.name} returned {response.status_code}: {response.content!r}"
+            )
+        queries.append(recorder.queries)
+
+    if not warm_cache:
+        cache.clear()
+    tracemalloc.start()
+    try:
+        scenario.send(client)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return summarize(latencies, queries, peak)
+
+
+def summarize(latencies, queries, peak_allocation) -> dict:
+    if len(latencies) > 1:
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
+    else:
+        p50 = p95 = p99 = latencies[0]
+
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(p95, 3),
+        "p99_ms": round(p99, 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "queries": round(statistics.fmean(queries), 2),
+        "peak_allocation_kib": round(peak_allocation / 1024, 1),
+    }
+
+
+def run_scenarios(scenarios, requests, warm_cache=False, on_result=None) -> dict:
+    client = Client()
+    results = {}
+    for scenario in scenarios:
+        results[scenario.name] = run_scenario(
+            client, scenario, requests, warm_cache=warm_cache
+        )
+        if on_result is not None:
+            on_result(scenario.name, results[scenario.name])
+    return results
+
+
+def run_serializer_benchmark(viewset_class, action, objects=50, number=200) -> dict:
+    """
+    Time building the serializer of ``action`` and representing each of up
+    to ``objects`` rows, in microseconds. Rows and image srcsets are loaded
+    beforehand so only serializer work is measured.
+    """
+    viewset = viewset_class(
+        action=action,
+        request=Request(RequestFactory().get("/")),
+        args=(),
+        kwargs={},
+        format_kwarg=None,
+    )
+    instances = list(viewset.filter_queryset(viewset.get_queryset())[:objects])
+    serializer_class = viewset.get_serializer_class()
+    context = {**viewset.get_serializer_context(), "image_srcsets": {}}
+
+    construct = timeit.timeit(
+        lambda: serializer_class(context=context).fields, number=number
+    )
+    serializer = serializer_class(context=context)
+    represent = timeit.timeit(
+        lambda: [serializer.to_representation(obj) for obj in instances],
+        number=number,
+    )
+    return {
+        "serializer": serializer_class.__name__,
+        "objects": len(instances),
+        "construct_us": round(construct / number * 1e6, 2),
+        "represent_us": round(represent / number / max(len(instances), 1) * 1e6, 2),
+    }
+
+
+def run_serializer_benchmarks(number=200, on_result=None) -> dict:
+    results = {}
+    for name, (viewset_class, action) in SERIALIZER_CASES.items():
+        results[name] = run_serializer_benchmark(viewset_class, action, number=number)
+        if on_result is not None:
+            on_result(name, results[name])
+    return results
+
+
+def build_synthetic_comments(count, replies_per_comment) -> list:
+    """
+    Build ``count`` unsaved comments of one blog, each replying to an
+    earlier one so every comment has ``replies_per_comment`` replies.
+    """
+    comments = []
+    for index in range(1, count + 1):
+        parent_index = (index - 2) // replies_per_comment
+        comments.append(
+            Comment(
+                pk=index,
+                blog_id=1,
+                parent_id=comments[parent_index].pk if index > 1 else None,
+                name=f"Commenter {index}",
+                email=f"commenter{index}@example.com",
+                text=f"Comment {index}",
+            )
+        )
+    return comments
+
+
+def run_comment_tree_benchmark(
+    comments=10_000, replies_per_comment=3, number=5
+) -> dict:
+    """
+    Time grouping ``comments`` synthetic comments by parent and building
+    their reply tree, in milliseconds per run.
+    """
+    synthetic_comments = build_synthetic_comments(comments, replies_per_comment)
+    group = timeit.timeit(
+        lambda: group_comments_by_parent(synthetic_comments), number=number
+    )
+    comments_by_parent = group_comments_by_parent(synthetic_comments)
+    build = timeit.timeit(lambda: build_comment_tree(comments_by_parent), number=number)
+    return {
+        "comments": comments,
+        "replies_per_comment": replies_per_comment,
+        "group_ms": round(group / number * 1000, 3),
+        "build_ms": round(build / number * 1000, 3),
+    }
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def save_results(
+    directory,
+    results,
+    scale,
+    requests,
+    warm_cache,
+    serializers=None,
+    comment_tree=None,
+) -> str:
+    commit = get_commit()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{commit}.json")
+    with open(path, "w") as file:
+        json.dump(
+            {
+                "commit": commit,
+                "created_at": timezone.now().isoformat(),
+                "scale": scale,
+                "requests": requests,
+                "warm_cache": warm_cache,
+                "results": results,
+                "serializers": serializers,
+                "comment_tree": comment_tree,
+            },
+            file,
+            indent=2,
+        )
+    return path
+
+
+def load_results(path) -> dict:
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def compare_results(baseline, results, threshold) -> list:
+    """
+    Return ``(scenario, metric, before, after)`` for every scenario whose
+    p95 latency grew by more than ``threshold`` percent or that runs more
+    queries than in ``baseline``.
+    """
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result["p95_ms"] > before["p95_ms"] * (1 + threshold / 100):
+            regressions.append((name, "p95_ms", before["p95_ms"], result["p95_ms"]))
+        if result["queries"] > before["queries"]:
+            regressions.append((name, "queries", before["queries"], result["queries"]))
+    return regressions
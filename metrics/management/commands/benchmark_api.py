@@ -0,0 +1,175 @@
+import tempfile
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+from ...benchmarks import (
+    DEFAULT_SCALE,
+    compare_results,
+    get_scenarios,
+    load_results,
+    run_comment_tree_benchmark,
+    run_scenarios,
+    run_serializer_benchmarks,
+    save_results,
+    seed_dataset,
+)
+
+SCALE_HELP = {
+    "projects": "Projects to seed",
+    "gallery_items": "Gallery items per project",
+    "blogs": "Blogs to seed",
+    "comments": "Top-level comments per blog",
+    "replies": "Replies per top-level comment",
+    "histories": "History events to seed",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database and benchmark every public API endpoint "
+        "in-process."
+    )
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_SCALE.items():
+            parser.add_argument(
+                f"--{name.replace('_', '-')}",
+                type=int,
+                default=default,
+                help=f"{SCALE_HELP[name]} (default {default})",
+            )
+        parser.add_argument(
+            "--requests", type=int, default=50, help="Requests per endpoint."
+        )
+        parser.add_argument(
+            "--warm-cache",
+            action="store_true",
+            help="Keep the response cache between requests.",
+        )
+        parser.add_argument(
+            "--serializers",
+            action="store_true",
+            help="Also time serializer construction and representation per object.",
+        )
+        parser.add_argument(
+            "--comment-tree",
+            type=int,
+            metavar="COMMENTS",
+            help="Also time building the reply tree of this many comments, "
+            "e.g. 10000.",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=".benchmarks",
+            help="Directory results are stored in, one JSON file per commit.",
+        )
+        parser.add_argument(
+            "--compare", help="Results file to compare against, e.g. of main."
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=10.0,
+            help="Allowed p95 latency growth in percent when comparing.",
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1:
+            raise CommandError("--requests must be at least 1.")
+        baseline = load_results(options["compare"]) if options["compare"] else None
+
+        setup_test_environment(debug=False)
+        # Create the tables from the models, like ``pytest --no-migrations``.
+        with override_settings(
+            MIGRATION_MODULES={app.label: None for app in apps.get_app_configs()}
+        ):
+            old_config = setup_databases(
+                verbosity=0, interactive=False, serialized_aliases=[]
+            )
+        try:
+            with tempfile.TemporaryDirectory() as media_root, override_settings(
+                MEDIA_ROOT=media_root,
+                PORTFOLIO_BACKGROUND_TASKS=False,
+                THROTTLE_ENABLED=False,
+            ):
+                scale = self.seed(options)
+                results = run_scenarios(
+                    get_scenarios(),
+                    options["requests"],
+                    warm_cache=options["warm_cache"],
+                    on_result=self.report,
+                )
+                serializers = None
+                if options["serializers"]:
+                    serializers = run_serializer_benchmarks(
+                        on_result=self.report_serializer
+                    )
+                comment_tree = None
+                if options["comment_tree"]:
+                    comment_tree = run_comment_tree_benchmark(
+                        comments=options["comment_tree"]
+                    )
+                    self.report_comment_tree(comment_tree)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        path = save_results(
+            options["output_dir"],
+            results,
+            scale,
+            options["requests"],
+            options["warm_cache"],
+            serializers=serializers,
+            comment_tree=comment_tree,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Results saved to {path}."))
+
+        if baseline is not None:
+            self.compare(baseline, results, options["threshold"])
+
+    def seed(self, options):
+        started = time.perf_counter()
+        scale = seed_dataset({name: options[name] for name in DEFAULT_SCALE})
+        self.stdout.write(f"Seeded {scale} in {time.perf_counter() - started:.1f}s.")
+        return scale
+
+    def report(self, name, result):
+        self.stdout.write(
+            f"{name:<28} p50 {result['p50_ms']:>8.2f} ms  "
+            f"p95 {result['p95_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms  "
+            f"{result['queries']:>6.1f} queries  "
+            f"{result['peak_allocation_kib']:>8.1f} KiB"
+        )
+
+    def report_serializer(self, name, result):
+        self.stdout.write(
+            f"{name:<28} {result['serializer']:<28} "
+            f"construct {result['construct_us']:>8.1f} us  "
+            f"represent {result['represent_us']:>8.1f} us/object"
+        )
+
+    def report_comment_tree(self, result):
+        self.stdout.write(
+            f"{'comment-tree':<28} {result['comments']} comments  "
+            f"group {result['group_ms']:>8.2f} ms  build {result['build_ms']:>8.2f} ms"
+        )
+
+    def compare(self, baseline, results, threshold):
+        regressions = compare_results(baseline, results, threshold)
+        for name, metric, before, after in regressions:
+            self.stdout.write(
+                self.style.ERROR(f"{name}: {metric} went from {before} to {after}.")
+            )
+        if regressions:
+            raise CommandError(f"{len(regressions)} regressions found.")
+        self.stdout.write(self.style.SUCCESS("No regressions found."))
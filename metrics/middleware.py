@@ -0,0 +1,151 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from .registry import registry
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRecorder:
+    """Count the queries run on a connection and the time spent in them."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries += 1
+
+
+class RequestMetricsMiddleware:
+    """
+    Record the queries, database time, serialization time, duration and
+    response size of every request under its URL name, e.g.
+    ``projects-list``, and log requests over the configured budgets.
+
+    Serialization time is the time spent outside the database from the view
+    being called until the response is rendered, which for these API views
+    is serializer and renderer work.
+
+    Queries are counted with ``connection.execute_wrapper``, so this works
+    with ``DEBUG`` off. Under ASGI the middleware stays async so async views
+    are not run through a thread; the wrappers are installed in the thread
+    that runs the request's ORM calls.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        request._metrics_recorder = recorder
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            wrap_connections(stack, recorder)
+            response = self.get_response(request)
+        finished = time.perf_counter()
+
+        self.finish(request, response, recorder, started, finished)
+        return response
+
+    async def __acall__(self, request):
+        if not settings.METRICS_ENABLED:
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        request._metrics_recorder = recorder
+        stack = ExitStack()
+        await sync_to_async(wrap_connections)(stack, recorder)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            finished = time.perf_counter()
+            await sync_to_async(stack.close)()
+
+        self.finish(request, response, recorder, started, finished)
+        return response
+
+    def finish(self, request, response, recorder, started, finished):
+        match = request.resolver_match
+        if match is not None and match.view_name:
+            self.record(request, response, match.view_name, recorder, started, finished)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        recorder = getattr(request, "_metrics_recorder", None)
+        if recorder is not None:
+            request._metrics_view_started = (time.perf_counter(), recorder.db_time)
+
+    def record(self, request, response, endpoint, recorder, started, finished):
+        serialize_time = None
+        view_started = getattr(request, "_metrics_view_started", None)
+        if view_started is not None:
+            view_started, db_time = view_started
+            serialize_time = max(
+                finished - view_started - (recorder.db_time - db_time), 0
+            )
+
+        sample = {
+            "queries": recorder.queries,
+            "db_time": recorder.db_time * 1000,
+            "serialize_time": (
+                serialize_time * 1000 if serialize_time is not None else None
+            ),
+            "duration": (finished - started) * 1000,
+            "response_size": get_response_size(response),
+        }
+        registry.record(endpoint, sample)
+
+        if is_over_budget(sample):
+            logger.warning(
+                "%s %s (%s) ran %d queries in %.1f ms and took %.1f ms.",
+                request.method,
+                request.path,
+                endpoint,
+                sample["queries"],
+                sample["db_time"],
+                sample["duration"],
+            )
+
+
+def wrap_connections(stack, recorder):
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(recorder))
+
+
+def get_response_size(response):
+    if response.has_header("Content-Length"):
+        return int(response["Content-Length"])
+    if response.streaming:
+        return None
+    return len(response.content)
+
+
+def is_over_budget(sample) -> bool:
+    query_budget = settings.METRICS_QUERY_BUDGET
+    latency_budget = settings.METRICS_LATENCY_BUDGET
+    return bool(
+        (query_budget and sample["queries"] > query_budget)
+        or (latency_budget and sample["duration"] > latency_budget)
+    )
@@ -0,0 +1,80 @@
+"""
+In-process histograms of request metrics, keyed by endpoint.
+
+Each worker process aggregates its own requests; the metrics endpoint
+reports the process that serves it, identified by its pid.
+"""
+
+import os
+import threading
+from bisect import bisect_left
+
+# Upper bounds of the buckets, in queries, milliseconds and bytes.
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+TIME_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+SIZE_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 * 1024, 10 * 1024 * 1024)
+
+METRIC_BUCKETS = {
+    "queries": QUERY_BUCKETS,
+    "db_time": TIME_BUCKETS,
+    "serialize_time": TIME_BUCKETS,
+    "duration": TIME_BUCKETS,
+    "response_size": SIZE_BUCKETS,
+}
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self) -> dict:
+        """Return cumulative bucket counts, like Prometheus' ``le`` labels."""
+        buckets = {}
+        total = 0
+        for bound, count in zip([*self.buckets, "+Inf"], self.counts):
+            total += count
+            buckets[str(bound)] = total
+        return {"buckets": buckets, "count": self.count, "sum": round(self.sum, 3)}
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints = {}
+
+    def record(self, endpoint, sample: dict):
+        """Add ``sample``, a mapping of metric name to value, to ``endpoint``."""
+        with self.lock:
+            histograms = self.endpoints.get(endpoint)
+            if histograms is None:
+                histograms = self.endpoints[endpoint] = {
+                    name: Histogram(buckets) for name, buckets in METRIC_BUCKETS.items()
+                }
+            for name, value in sample.items():
+                if value is not None:
+                    histograms[name].observe(value)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            endpoints = {
+                endpoint: {
+                    name: histogram.as_dict() for name, histogram in histograms.items()
+                }
+                for endpoint, histograms in sorted(self.endpoints.items())
+            }
+        return {"pid": os.getpid(), "endpoints": endpoints}
+
+    def reset(self):
+        with self.lock:
+            self.endpoints.clear()
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from ..benchmarks import (
+    compare_results,
+    get_scenarios,
+    load_results,
+    run_comment_tree_benchmark,
+    run_scenarios,
+    run_serializer_benchmarks,
+    save_results,
+    seed_dataset,
+    summarize,
+)
+
+SMALL_SCALE = {
+    "projects": 2,
+    "gallery_items": 1,
+    "blogs": 1,
+    "comments": 2,
+    "replies": 1,
+    "histories": 2,
+}
+
+
+class TestSummaries:
+
+    def test_summarize_reports_percentiles(self):
+        result = summarize(list(range(1, 101)), [2] * 100, 2048)
+
+        assert result["requests"] == 100
+        assert result["p50_ms"] == 50.5
+        assert result["p95_ms"] == pytest.approx(95.05)
+        assert result["p99_ms"] == pytest.approx(99.01)
+        assert result["queries"] == 2
+        assert result["peak_allocation_kib"] == 2
+
+    def test_compare_results_flags_slower_and_chattier_scenarios(self):
+        baseline = {
+            "projects-list": {"p95_ms": 10.0, "queries": 5},
+            "blogs-list": {"p95_ms": 10.0, "queries": 4},
+        }
+        results = {
+            "projects-list": {"p95_ms": 10.5, "queries": 6},
+            "blogs-list": {"p95_ms": 12.0, "queries": 4},
+            "history-list": {"p95_ms": 50.0, "queries": 2},
+        }
+
+        assert compare_results(baseline, results, threshold=10) == [
+            ("projects-list", "queries", 5, 6),
+            ("blogs-list", "p95_ms", 10.0, 12.0),
+        ]
+
+
+class TestCommentTreeBenchmark:
+
+    def test_run_comment_tree_benchmark_times_10k_comments(self):
+        result = run_comment_tree_benchmark(comments=10_000, number=1)
+
+        assert result["comments"] == 10_000
+        assert result["group_ms"] > 0
+        assert result["build_ms"] > 0
+
+
+@pytest.mark.django_db
+class TestBenchmarks:
+
+    def test_run_scenarios_covers_every_endpoint(self, tmp_path, settings):
+        settings.PORTFOLIO_BACKGROUND_TASKS = False
+        settings.THROTTLE_ENABLED = False
+        seed_dataset(SMALL_SCALE)
+        scenarios = get_scenarios()
+
+        results = run_scenarios(scenarios, requests=2)
+        path = save_results(tmp_path, results, SMALL_SCALE, 2, False)
+
+        assert set(results) == {scenario.name for scenario in scenarios}
+        assert all(result["queries"] > 0 for result in results.values())
+        assert load_results(path) == results
+        with open(path) as file:
+            assert json.load(file)["scale"] == SMALL_SCALE
+
+    def test_run_serializer_benchmarks_times_every_read_serializer(self, settings):
+        settings.PORTFOLIO_BACKGROUND_TASKS = False
+        seed_dataset(SMALL_SCALE)
+
+        results = run_serializer_benchmarks(number=2)
+
+        assert results["projects-list"]["serializer"] == "ProjectListSerializer"
+        assert results["projects-list"]["objects"] == 2
+        assert all(result["construct_us"] > 0 for result in results.values())
+        assert all(result["represent_us"] > 0 for result in results.values())
@@ -0,0 +1,120 @@
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+
+from portfolio.tests.factories import ProjectFactory
+
+from .. import middleware
+from ..registry import Histogram, registry
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+@pytest.fixture
+def admin_api_client(api_client, django_user_model):
+    admin = django_user_model.objects.create_superuser("admin", "admin@x.com", "pass")
+    api_client.force_authenticate(admin)
+    return api_client
+
+
+class TestHistogram:
+
+    def test_observe_counts_values_into_cumulative_buckets(self):
+        histogram = Histogram((1, 5, 10))
+
+        for value in (0, 1, 3, 7, 50):
+            histogram.observe(value)
+
+        assert histogram.as_dict() == {
+            "buckets": {"1": 2, "5": 3, "10": 4, "+Inf": 5},
+            "count": 5,
+            "sum": 61,
+        }
+
+
+@pytest.mark.django_db
+class TestRequestMetricsMiddleware:
+
+    def test_request_is_recorded_under_url_name(self, api_client):
+        ProjectFactory.create_batch(2, gallery_items=1)
+
+        response = api_client.get(reverse("projects-list"))
+
+        metrics = registry.snapshot()["endpoints"]["projects-list"]
+        assert metrics["queries"]["count"] == 1
+        assert metrics["queries"]["sum"] > 0
+        assert metrics["serialize_time"]["count"] == 1
+        assert metrics["response_size"]["sum"] == len(response.content)
+
+    def test_asgi_request_is_recorded(self):
+        ProjectFactory.create_batch(2, gallery_items=1)
+
+        response = async_to_sync(AsyncClient().get)(reverse("projects-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        metrics = registry.snapshot()["endpoints"]["projects-list"]
+        assert metrics["queries"]["count"] == 1
+        assert metrics["queries"]["sum"] > 0
+
+    def test_middleware_stays_async_under_asgi(self):
+        async def get_response(request):
+            pass
+
+        assert iscoroutinefunction(middleware.RequestMetricsMiddleware(get_response))
+
+    def test_unresolved_request_is_not_recorded(self, api_client):
+        api_client.get("/fa/api/v1/missing/")
+
+        assert registry.snapshot()["endpoints"] == {}
+
+    def test_disabled_metrics_are_not_recorded(self, api_client, settings):
+        settings.METRICS_ENABLED = False
+
+        api_client.get(reverse("projects-list"))
+
+        assert registry.snapshot()["endpoints"] == {}
+
+    def test_request_over_query_budget_is_logged(self, api_client, settings):
+        settings.METRICS_QUERY_BUDGET = 1
+        ProjectFactory.create_batch(2, gallery_items=1)
+
+        with mock.patch.object(middleware.logger, "warning") as warning:
+            api_client.get(reverse("projects-list"))
+
+        warning.assert_called_once()
+        assert "projects-list" in warning.call_args.args
+
+    def test_request_within_budgets_is_not_logged(self, api_client, settings):
+        settings.METRICS_QUERY_BUDGET = 100
+        settings.METRICS_LATENCY_BUDGET = 60 * 1000
+
+        with mock.patch.object(middleware.logger, "warning") as warning:
+            api_client.get(reverse("projects-list"))
+
+        warning.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+
+    def test_get_metrics_returns_histograms(self, admin_api_client):
+        admin_api_client.get(reverse("history-list"))
+
+        response = admin_api_client.get(reverse("metrics"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["endpoints"]["history-list"]["duration"]["count"] == 1
+
+    def test_get_metrics_as_anonymous_is_forbidden(self, api_client):
+        response = api_client.get(reverse("metrics"))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -27,7 +27,7 @@ class GalleryItemInline(admin.TabularInline):
 @admin.register(Project)
 class ProjectAdmin(TranslationAdmin):
     autocomplete_fields = ["category"]
-    readonly_fields = ["slug", "created_at"]
+    readonly_fields = ["created_at"]
     list_display = ["title", "slug", "get_category_title", "status", "created_at"]
     list_editable = ["status"]
     list_filter = ["status", "category"]
@@ -70,7 +70,7 @@ class BlogAdmin(TranslationAdmin):
         "created_at",
         "updated_at",
     ]
-    readonly_fields = ["slug", "created_at", "updated_at"]
+    readonly_fields = ["created_at", "updated_at"]
     list_filter = ["status"]
     list_editable = ["status"]
     list_per_page = 20
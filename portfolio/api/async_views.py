@@ -0,0 +1,282 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponsePermanentRedirect, JsonResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from ..cache import get_request_cache_key
+from ..images import aload_image_srcsets
+from ..models import RenderedBlog
+from ..slugs import aget_redirect_slug
+from .comment_tree import (
+    aload_comment_threads,
+    build_comment_tree,
+    group_comments_by_parent,
+)
+from .conditions import (
+    get_blogs_state,
+    get_histories_state,
+    get_projects_state,
+    get_validators,
+)
+from .paginations import CommentCursorPagination
+from .serializers import ImageSrcsetMixin
+from .views import (
+    BlogViewSet,
+    HistoryViewSet,
+    ProjectViewSet,
+    absolutize_rendered_blog,
+    get_approved_comments,
+    get_comments_max_depth,
+    get_redirect_url,
+)
+
+
+class AsyncViewSetView(View):
+    """
+    Serve a read action of a sync viewset with the async ORM.
+
+    The viewset is only used for its queryset, filters and serializer, so
+    responses match the WSGI endpoints and share their response cache. Like
+    ``conditional_response``, ``get_state`` answers matching conditional
+    GETs with 304 before anything is serialized.
+    """
+
+    viewset_class = None
+    action = None
+    get_state = None
+
+    async def get(self, request, *args, **kwargs):
+        etag = None
+        if self.get_state is not None:
+            validators = await sync_to_async(get_validators)(
+                request, self.get_state, **kwargs
+            )
+            if validators["etag"] is not None:
+                etag = quote_etag(validators["etag"])
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = await self.get_response(request, kwargs)
+        if etag is not None:
+            response.headers.setdefault("ETag", etag)
+        return response
+
+    async def get_response(self, request, kwargs):
+        cache_key = get_request_cache_key(request)
+        data = await cache.aget(cache_key)
+
+        if data is None:
+            try:
+                data = await self.get_data(self.get_viewset(Request(request), kwargs))
+            except APIException as exc:
+                return self.render(exc.detail, status=exc.status_code)
+
+            await cache.aset(
+                cache_key, data, timeout=settings.PORTFOLIO_RESPONSE_CACHE_TIMEOUT
+            )
+
+        return self.render(data)
+
+    def get_viewset(self, request, kwargs):
+        return self.viewset_class(
+            action=self.action,
+            request=request,
+            args=(),
+            kwargs=kwargs,
+            format_kwarg=None,
+        )
+
+    async def get_data(self, viewset):
+        """
+        Return the response data of the action. By default the sync action
+        runs in a thread; subclasses query with the async ORM instead.
+        """
+        action = getattr(viewset, self.action)
+        response = await sync_to_async(action)(viewset.request, **viewset.kwargs)
+        return response.data
+
+    async def serialize(self, viewset, instance, many=False, context=None):
+        """
+        Serialize ``instance`` after preloading what the serializer would
+        otherwise query from the event loop.
+        """
+        serializer_class = viewset.get_serializer_class()
+        if context is None:
+            context = viewset.get_serializer_context()
+
+        if issubclass(serializer_class, ImageSrcsetMixin):
+            objects = instance if many else [instance]
+            context["image_srcsets"] = await aload_image_srcsets(
+                source
+                for obj in objects
+                for source in serializer_class.get_image_sources(obj)
+            )
+
+        return viewset.get_serializer(instance, many=many, context=context).data
+
+    def render(self, data, status=200):
+        return JsonResponse(
+            data,
+            status=status,
+            safe=False,
+            encoder=JSONEncoder,
+            json_dumps_params={"ensure_ascii": False},
+        )
+
+
+class AsyncListView(AsyncViewSetView):
+    action = "list"
+
+    async def get_data(self, viewset):
+        queryset = await sync_to_async(viewset.filter_queryset)(viewset.get_queryset())
+        paginator = viewset.paginator
+
+        if paginator.is_cursor_requested(viewset.request):
+            page = await sync_to_async(paginator.paginate_queryset)(
+                queryset, viewset.request, view=viewset
+            )
+            data = await self.serialize(viewset, page, many=True)
+            return paginator.get_paginated_response(data).data
+
+        if not paginator.page_size:
+            objects = [obj async for obj in queryset.aiterator()]
+            return await self.serialize(viewset, objects, many=True)
+
+        return await self.paginate(viewset, queryset, paginator)
+
+    async def paginate(self, viewset, queryset, paginator):
+        request = viewset.request
+        page_size = paginator.page_size
+        page_number = request.query_params.get(paginator.page_query_param, "1")
+        if not page_number.isdigit() or int(page_number) < 1:
+            raise NotFound(paginator.invalid_page_message)
+
+        page_number = int(page_number)
+        count = await queryset.acount()
+        offset = (page_number - 1) * page_size
+        if offset and offset >= count:
+            raise NotFound(paginator.invalid_page_message)
+
+        end = offset + page_size
+        page = queryset[offset:end]
+        objects = [obj async for obj in page.aiterator()]
+
+        url = request.build_absolute_uri()
+        next_url = None
+        if end < count:
+            next_url = replace_query_param(
+                url, paginator.page_query_param, page_number + 1
+            )
+        previous_url = None
+        if page_number == 2:
+            previous_url = remove_query_param(url, paginator.page_query_param)
+        elif page_number > 2:
+            previous_url = replace_query_param(
+                url, paginator.page_query_param, page_number - 1
+            )
+
+        return {
+            "count": count,
+            "next": next_url,
+            "previous": previous_url,
+            "results": await self.serialize(viewset, objects, many=True),
+        }
+
+
+class AsyncRetrieveView(AsyncViewSetView):
+    action = "retrieve"
+    url_name = None
+
+    async def get(self, request, *args, **kwargs):
+        response = await super().get(request, *args, **kwargs)
+        if response.status_code == 404:
+            model = self.viewset_class.serializer_class.Meta.model
+            slug = await aget_redirect_slug(model, get_language(), kwargs["slug"])
+            if slug is not None:
+                return HttpResponsePermanentRedirect(
+                    get_redirect_url(request, self.url_name, slug)
+                )
+        return response
+
+    async def get_data(self, viewset):
+        instance = await self.get_object(viewset)
+        return await self.serialize(viewset, instance)
+
+    async def get_object(self, viewset):
+        lookup = {viewset.lookup_field: viewset.kwargs[viewset.lookup_field]}
+        queryset = await sync_to_async(viewset.filter_queryset)(viewset.get_queryset())
+        try:
+            return await queryset.aget(**lookup)
+        except queryset.model.DoesNotExist:
+            raise NotFound()
+
+
+class AsyncProjectListView(AsyncListView):
+    viewset_class = ProjectViewSet
+    get_state = staticmethod(get_projects_state)
+
+
+class AsyncProjectRetrieveView(AsyncRetrieveView):
+    viewset_class = ProjectViewSet
+    get_state = staticmethod(get_projects_state)
+    url_name = "projects-detail"
+
+
+class AsyncBlogListView(AsyncListView):
+    viewset_class = BlogViewSet
+    get_state = staticmethod(get_blogs_state)
+
+
+class AsyncBlogRetrieveView(AsyncRetrieveView):
+    viewset_class = BlogViewSet
+    get_state = staticmethod(get_blogs_state)
+    url_name = "blogs-detail"
+
+    async def get_data(self, viewset):
+        request = viewset.request
+        if not request.query_params:
+            key = RenderedBlog.get_key(get_language(), viewset.kwargs["slug"])
+            document = (
+                await RenderedBlog.objects.filter(pk=key)
+                .values_list("document", flat=True)
+                .afirst()
+            )
+            if document is not None:
+                return absolutize_rendered_blog(document, request)
+
+        blog = await self.get_object(viewset)
+        if "comments" not in viewset.get_serializer_class().Meta.fields:
+            return await self.serialize(viewset, blog)
+
+        max_depth = get_comments_max_depth(request)
+
+        paginator = CommentCursorPagination()
+        queryset = get_approved_comments().filter(blog=blog)
+        roots = await sync_to_async(paginator.paginate_queryset)(
+            queryset.filter(parent__isnull=True), request, view=viewset
+        )
+        comments = await aload_comment_threads(queryset, roots, max_depth=max_depth)
+        paginator.base_url = request.build_absolute_uri(
+            reverse("blog-comments-list", args=[blog.slug])
+        )
+
+        context = viewset.get_serializer_context()
+        context["comments"] = build_comment_tree(
+            group_comments_by_parent(comments), max_depth=max_depth
+        )
+        context["comments_next"] = paginator.get_next_link()
+        return await self.serialize(viewset, blog, context=context)
+
+
+class AsyncHistoryListView(AsyncListView):
+    viewset_class = HistoryViewSet
+    get_state = staticmethod(get_histories_state)
@@ -0,0 +1,86 @@
+from collections import defaultdict
+
+from ..models import Comment
+
+
+def group_comments_by_parent(comments) -> dict:
+    comments_by_parent = defaultdict(list)
+    for comment in comments:
+        comments_by_parent[comment.parent_id].append(comment)
+    return comments_by_parent
+
+
+def serialize_comment(comment: Comment, replies_count: int) -> dict:
+    return {
+        "id": comment.id,
+        "name": comment.name,
+        "email": comment.email,
+        "text": comment.text,
+        "parent": comment.parent_id,
+        "replies_count": replies_count,
+        "replies": [],
+    }
+
+
+def load_comment_threads(queryset, roots, max_depth=None) -> list:
+    """
+    Return ``roots`` followed by their replies from ``queryset``, loading one
+    level per query until ``max_depth`` levels have been collected.
+    """
+    comments = list(roots)
+    parent_ids = [comment.id for comment in comments]
+    depth = 1
+
+    while parent_ids and (max_depth is None or depth < max_depth):
+        replies = list(queryset.filter(parent_id__in=parent_ids))
+        comments.extend(replies)
+        parent_ids = [reply.id for reply in replies]
+        depth += 1
+
+    return comments
+
+
+async def aload_comment_threads(queryset, roots, max_depth=None) -> list:
+    comments = list(roots)
+    parent_ids = [comment.id for comment in comments]
+    depth = 1
+
+    while parent_ids and (max_depth is None or depth < max_depth):
+        replies = [reply async for reply in queryset.filter(parent_id__in=parent_ids)]
+        comments.extend(replies)
+        parent_ids = [reply.id for reply in replies]
+        depth += 1
+
+    return comments
+
+
+def build_comment_tree(comments_by_parent, root_id=None, max_depth=None) -> list:
+    """
+    Serialize the replies of ``root_id`` (top-level comments when ``None``)
+    from a ``parent_id`` index in a single pass.
+
+    ``max_depth`` limits how many levels are serialized; deeper replies are
+    left out and their parent gets an empty ``replies`` list. A
+    ``replies_count`` annotation is preferred over counting the index, so
+    truncated threads still report how many replies can be loaded.
+    """
+    tree = []
+    stack = [
+        (comment, tree, 1) for comment in reversed(comments_by_parent.get(root_id, []))
+    ]
+
+    while stack:
+        comment, siblings, depth = stack.pop()
+        replies = comments_by_parent.get(comment.id, [])
+        node = serialize_comment(
+            comment, getattr(comment, "replies_count", len(replies))
+        )
+        siblings.append(node)
+
+        if max_depth is not None and depth >= max_depth:
+            continue
+
+        for reply in reversed(replies):
+            stack.append((reply, node["replies"], depth + 1))
+
+    return tree
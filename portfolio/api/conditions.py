@@ -0,0 +1,93 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.views.decorators.http import condition
+
+from ..cache import get_content_version, get_request_cache_key
+from ..models import Blog, Comment, GalleryItem, History, Project
+
+
+def aggregate_state(queryset, timestamp_field) -> tuple:
+    state = queryset.aggregate(latest=Max(timestamp_field), count=Count("pk"))
+    return state["latest"], state["count"]
+
+
+def get_projects_state(slug=None):
+    projects = Project.objects.all()
+    gallery_items = GalleryItem.objects.all()
+    if slug is not None:
+        projects = projects.filter(slug=slug)
+        gallery_items = gallery_items.filter(project__slug=slug)
+
+    projects_state = aggregate_state(projects, "created_at")
+    if slug is not None and not projects_state[1]:
+        return None
+
+    return projects_state, aggregate_state(gallery_items, "created_at")
+
+
+def get_blogs_state(slug=None):
+    if slug is None:
+        return aggregate_state(
+            Blog.objects.filter(status=Blog.BlogStatus.PUBLISHED), "updated_at"
+        )
+
+    blogs_state = aggregate_state(Blog.objects.filter(slug=slug), "updated_at")
+    if not blogs_state[1]:
+        return None
+
+    comments_state = aggregate_state(
+        Comment.objects.filter(
+            blog__slug=slug, status=Comment.CommentStatusChoice.APPROVED
+        ),
+        "created_at",
+    )
+    return blogs_state, comments_state
+
+
+def get_histories_state():
+    return aggregate_state(History.objects.all(), "created_at")
+
+
+def get_validators(request, get_state, **kwargs) -> dict:
+    """
+    Return the ETag of a request from aggregate queries, reusing it for as
+    long as the content version does not change.
+
+    There is no Last-Modified: the newest timestamp of the rows shown does
+    not move when a row is deleted or a comment is unapproved, while the
+    content version does.
+    """
+    if hasattr(request, "portfolio_validators"):
+        return request.portfolio_validators
+
+    cache_key = get_request_cache_key(request, prefix="validators")
+    validators = cache.get(cache_key)
+    if validators is None:
+        validators = {"etag": None}
+        aggregates = get_state(**kwargs)
+        if aggregates is not None:
+            version = get_content_version()
+            validators["etag"] = hashlib.md5(
+                f"{version}:{request.build_absolute_uri()}:{aggregates}".encode()
+            ).hexdigest()
+
+        cache.set(
+            cache_key, validators, timeout=settings.PORTFOLIO_RESPONSE_CACHE_TIMEOUT
+        )
+
+    request.portfolio_validators = validators
+    return validators
+
+
+def conditional_response(get_state):
+    """
+    Answer conditional GETs with 304 before the view builds a serializer.
+    """
+
+    def etag_func(request, *args, **kwargs):
+        return get_validators(request, get_state, **kwargs)["etag"]
+
+    return condition(etag_func=etag_func)
@@ -0,0 +1,97 @@
+"""
+Per-action serializer classes and ``?fields=`` sparse fieldsets.
+
+Narrowed serializers are subclasses built once and cached, instead of
+serializers that build every field and drop some on each instantiation.
+Since ``LanguageProjectionMixin`` projects querysets onto the serializer's
+fields, a sparse fieldset also narrows the columns that are fetched.
+"""
+
+import copy
+from functools import lru_cache
+
+from django.utils.translation import gettext as _
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import ValidationError
+
+FIELDS_QUERY_PARAM = "fields"
+# Each ``?fields=`` combination builds a class, so keep only the recent ones.
+FIELD_SUBSETS_CACHE_SIZE = 256
+
+FIELDS_PARAMETER = OpenApiParameter(
+    FIELDS_QUERY_PARAM,
+    OpenApiTypes.STR,
+    description="Comma separated fields to return, e.g. `title,slug`.",
+)
+
+
+class CachedFieldsMixin:
+    """
+    Build the fields of a model serializer once per class and copy them for
+    every instance, instead of introspecting the model each time.
+    """
+
+    def get_fields(self):
+        serializer_class = type(self)
+        if "_cached_fields" not in serializer_class.__dict__:
+            serializer_class._cached_fields = super().get_fields()
+        return copy.deepcopy(serializer_class._cached_fields)
+
+
+@lru_cache(maxsize=FIELD_SUBSETS_CACHE_SIZE)
+def get_field_subset(serializer_class, fields, name=None):
+    """
+    Return a subclass of ``serializer_class`` showing only ``fields``, a
+    tuple of its field names.
+    """
+    attrs = {
+        field: None
+        for field in serializer_class._declared_fields
+        if field not in fields
+    }
+    attrs["Meta"] = type("Meta", (serializer_class.Meta,), {"fields": list(fields)})
+    attrs["__module__"] = serializer_class.__module__
+    return type(
+        name or f"Sparse{serializer_class.__name__}", (serializer_class,), attrs
+    )
+
+
+def get_requested_fields(request, serializer_class) -> tuple | None:
+    """
+    Return the fields of ``serializer_class`` named in ``?fields=``, in
+    serializer order, or ``None`` if the parameter is missing.
+    """
+    value = request.query_params.get(FIELDS_QUERY_PARAM)
+    if value is None:
+        return None
+
+    requested = {field.strip() for field in value.split(",") if field.strip()}
+    available = serializer_class.Meta.fields
+    unknown = requested.difference(available)
+    if unknown or not requested:
+        raise ValidationError(
+            {
+                FIELDS_QUERY_PARAM: _("فیلدهای معتبر: %(fields)s")
+                % {"fields": ", ".join(available)}
+            }
+        )
+    return tuple(field for field in available if field in requested)
+
+
+class SparseFieldsetMixin:
+    """
+    Serialize with ``serializer_classes[action]``, falling back to
+    ``serializer_class``, narrowed to the fields requested in ``?fields=``.
+    """
+
+    serializer_classes = {}
+
+    def get_serializer_class(self):
+        serializer_class = self.serializer_classes.get(
+            self.action, self.serializer_class
+        )
+        fields = get_requested_fields(self.request, serializer_class)
+        if fields is None or list(fields) == serializer_class.Meta.fields:
+            return serializer_class
+        return get_field_subset(serializer_class, fields)
@@ -0,0 +1,41 @@
+from django.utils.translation import get_language
+from rest_framework.filters import BaseFilterBackend
+
+from ..search import get_search_rank
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Filter by the precomputed search documents of the active language and
+    order the matches by rank.
+    """
+
+    search_param = "search"
+    search_description = "A search term matched against titles and content."
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "")
+        if not query.strip():
+            return queryset
+
+        rank = get_search_rank(queryset.model, query, get_language())
+        if rank is None:
+            return queryset.none()
+
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return (
+            queryset.annotate(search_rank=rank)
+            .filter(search_rank__isnull=False)
+            .order_by("-search_rank", *ordering)
+        )
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": self.search_description,
+                "schema": {"type": "string"},
+            }
+        ]
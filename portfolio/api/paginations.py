@@ -1,5 +1,72 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class DefaultPageNumberPagination(PageNumberPagination):
     page_size = 10
+
+
+class CommentCursorPagination(CursorPagination):
+    page_size = 10
+    ordering = ["-created_at", "-id"]
+
+
+class QuerysetOrderingCursorPagination(CursorPagination):
+    page_size = 10
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(queryset.query.order_by or queryset.model._meta.ordering)
+
+
+class OptionalCursorPagination(DefaultPageNumberPagination):
+    """
+    Page number pagination that switches to keyset pagination over the
+    queryset ordering when the client asks for ``?pagination=cursor`` or
+    follows a ``cursor`` link. With ``page_size = None`` lists stay
+    unpaginated unless a cursor is requested.
+    """
+
+    pagination_mode_query_param = "pagination"
+    cursor_pagination_class = QuerysetOrderingCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+
+        if self.is_cursor_requested(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def is_cursor_requested(self, request):
+        cursor_query_param = self.cursor_pagination_class.cursor_query_param
+        return (
+            request.query_params.get(self.pagination_mode_query_param) == "cursor"
+            or cursor_query_param in request.query_params
+        )
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.pagination_mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to `cursor` to use keyset pagination.",
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            *self.cursor_pagination_class().get_schema_operation_parameters(view),
+        ]
+
+
+class HistoryPagination(OptionalCursorPagination):
+    page_size = None
@@ -0,0 +1,122 @@
+"""
+Load only the columns a serializer shows, in the active language.
+
+modeltranslation adds a column per language for every translated field and
+selects all of them, so a page of blogs would load both copies of ``body``
+although the list shows neither. ``project_queryset`` restricts a queryset
+with ``only()`` to the fields its serializer reads, replacing translated
+fields by their columns for the active language and its fallbacks.
+
+Serializer method fields read arbitrary attributes, so a serializer lists
+the model fields each of them needs in ``Meta.projection_sources``. When a
+field cannot be mapped to model fields the queryset is left untouched
+rather than risk a query per row for deferred columns.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Field
+from modeltranslation.manager import append_fallback
+from modeltranslation.translator import translator
+from rest_framework.fields import SerializerMethodField
+
+
+def get_localized_names(model, name) -> set:
+    """Return the columns read for ``name`` in the active language."""
+    if model not in translator.get_registered_models():
+        return {name}
+    return append_fallback(model, [name])[0]
+
+
+def get_projected_fields(model, path) -> list | None:
+    """
+    Return the ``only()`` arguments needed to read the ``__`` separated
+    ``path`` of ``model``, or ``None`` if it does not lead to a concrete
+    field through forward relations.
+    """
+    *relations, name = path.split("__")
+    prefix = []
+    fields = []
+    try:
+        for relation in relations:
+            field = model._meta.get_field(relation)
+            if not (field.many_to_one or field.one_to_one) or field.auto_created:
+                return None
+            prefix.append(field.name)
+            fields.append("__".join(prefix))
+            model = field.related_model
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+    if not isinstance(field, Field) or not field.concrete or field.many_to_many:
+        return None
+    return fields + [
+        "__".join([*prefix, localized])
+        for localized in sorted(get_localized_names(model, field.name))
+    ]
+
+
+def get_serializer_sources(serializer) -> list | None:
+    """
+    Return the model paths ``serializer`` reads, or ``None`` if some field
+    reads something else.
+    """
+    projection_sources = getattr(serializer.Meta, "projection_sources", {})
+    sources = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if name in projection_sources:
+            sources.extend(projection_sources[name])
+        elif isinstance(field, SerializerMethodField) or field.source == "*":
+            return None
+        else:
+            sources.append("__".join(field.source_attrs))
+    return sources
+
+
+def get_ordering_sources(queryset) -> list:
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return [name.lstrip("-") for name in ordering if isinstance(name, str)]
+
+
+def get_select_related_sources(select_related, prefix="") -> list:
+    if not isinstance(select_related, dict):
+        return []
+    sources = []
+    for name, nested in select_related.items():
+        sources.append(f"{prefix}{name}")
+        sources.extend(get_select_related_sources(nested, f"{prefix}{name}__"))
+    return sources
+
+
+def project_queryset(queryset, serializer):
+    sources = get_serializer_sources(serializer)
+    if sources is None:
+        return queryset
+
+    fields = set()
+    for source in sources:
+        projected = get_projected_fields(queryset.model, source)
+        if projected is None:
+            return queryset
+        fields.update(projected)
+
+    # Cursor pagination reads the ordering fields from the last row, and
+    # ``only()`` refuses to defer relations that are ``select_related``.
+    for source in get_ordering_sources(queryset) + get_select_related_sources(
+        queryset.query.select_related
+    ):
+        fields.update(get_projected_fields(queryset.model, source) or [])
+    return queryset.only(*sorted(fields))
+
+
+class LanguageProjectionMixin:
+    """
+    Load only the active language's columns of the fields shown by the
+    serializer of the current action.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return project_queryset(queryset, self.get_serializer())
@@ -0,0 +1,85 @@
+"""
+Materialized blog detail documents.
+
+Every blog is rendered once per language into a :class:`RenderedBlog` row
+keyed by language and slug, so ``BlogViewSet.retrieve`` can answer with a
+single primary-key lookup. The transaction that changes a blog or its
+comments deletes its documents, and they are rebuilt on the background
+thread after it commits.
+"""
+
+from django.db import transaction
+from django.http import HttpRequest
+from django.utils import translation
+from modeltranslation.settings import AVAILABLE_LANGUAGES
+from modeltranslation.utils import build_localized_fieldname
+from rest_framework.request import Request
+
+from ..background import run_after_commit
+from ..cache import bump_content_version
+from ..models import Blog, RenderedBlog
+from .views import BlogViewSet
+
+
+class RelativeURLRequest(HttpRequest):
+    """
+    An empty GET request that leaves URLs relative, so rendered documents do
+    not depend on the host they are later served from.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.method = "GET"
+
+    def build_absolute_uri(self, location=None):
+        return self.get_full_path() if location is None else location
+
+
+def build_blog_document(blog: Blog) -> dict:
+    viewset = BlogViewSet(
+        action="retrieve",
+        request=Request(RelativeURLRequest()),
+        args=(),
+        kwargs={},
+        format_kwarg=None,
+    )
+    return viewset.get_blog_detail(blog)
+
+
+def render_blog_documents(blog_id):
+    blog = Blog.objects.filter(pk=blog_id).first()
+    if blog is None:
+        return
+
+    documents = {}
+    for language in AVAILABLE_LANGUAGES:
+        slug = getattr(blog, build_localized_fieldname("slug", language))
+        if not slug:
+            continue
+        with translation.override(language):
+            documents[RenderedBlog.get_key(language, slug)] = (
+                language,
+                build_blog_document(blog),
+            )
+
+    with transaction.atomic():
+        RenderedBlog.objects.filter(blog=blog).exclude(key__in=documents).delete()
+        for key, (language, document) in documents.items():
+            RenderedBlog.objects.update_or_create(
+                key=key,
+                defaults={"blog": blog, "language": language, "document": document},
+            )
+        # Responses cached while the old document was served are stale now.
+        transaction.on_commit(bump_content_version)
+
+
+def schedule_blog_render(blog_id):
+    """
+    Rebuild the documents of ``blog_id`` once the current transaction commits.
+
+    The old documents are deleted in the transaction, so ``retrieve``
+    serializes the blog live until the rebuild lands, even if it fails or
+    never runs.
+    """
+    RenderedBlog.objects.filter(blog_id=blog_id).delete()
+    run_after_commit(render_blog_documents, blog_id)
@@ -1,13 +1,50 @@
 from rest_framework import serializers
 
-from ..models import Blog, Comment, History, Project
-
-
-class ProjectSerializer(serializers.ModelSerializer):
+from ..images import load_image_srcsets
+from ..models import Blog, Comment, GalleryItem, History, Project
+from .fieldsets import CachedFieldsMixin, get_field_subset
+
+
+class ImageSrcsetMixin:
+    """
+    Look up responsive image srcsets for every object being serialized with
+    a single query. Async views preload them into ``image_srcsets``.
+
+    Subclasses return the image names ``obj`` shows from
+    ``get_image_sources``.
+    """
+
+    @classmethod
+    def get_image_sources(cls, obj) -> list:
+        return []
+
+    def get_image_srcset(self, source):
+        if not source:
+            return None
+
+        srcsets = self.context.get("image_srcsets")
+        if srcsets is None:
+            root = self.root
+            if isinstance(root, serializers.ListSerializer):
+                instances = root.instance
+            else:
+                instances = [root.instance]
+            srcsets = load_image_srcsets(
+                source for obj in instances for source in self.get_image_sources(obj)
+            )
+            self.context["image_srcsets"] = srcsets
+        return srcsets.get(source)
+
+
+class ProjectSerializer(
+    ImageSrcsetMixin, CachedFieldsMixin, serializers.ModelSerializer
+):
 
     category = serializers.ReadOnlyField(source="category.title")
     banner_image = serializers.SerializerMethodField()
+    banner_image_srcset = serializers.SerializerMethodField()
     gallery_items = serializers.SerializerMethodField()
+    gallery_items_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Project
@@ -21,51 +58,84 @@ class ProjectSerializer(serializers.ModelSerializer):
             "creation_year",
             "scale",
             "banner_image",
+            "banner_image_srcset",
             "gallery_items",
+            "gallery_items_srcset",
         ]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        if hasattr(self, "context") and self.context.get("view"):
-            view = self.context["view"]
-            if hasattr(view, "action"):
-                if view.action == "list":
-
-                    allowed_fields = {
-                        "title",
-                        "slug",
-                        "category",
-                        "creation_year",
-                        "banner_image",
-                    }
-
-                    existing_fields = set(self.fields)
-
-                    for field_name in existing_fields - allowed_fields:
-                        self.fields.pop(field_name)
-                elif view.action == "retrieve":
-
-                    not_allowed_fields = ["banner_image", "category"]
-                    for field in not_allowed_fields:
-                        self.fields.pop(field)
-
-    def get_banner_image(self, obj: Project):
-        has_images = obj.gallery_items.exists()
-        if has_images:
-            first_gallery_item = obj.gallery_items.first()
-
-            if first_gallery_item:
-                return first_gallery_item.image.url
+        # Banner and gallery images come from an annotation or a prefetch.
+        projection_sources = {
+            "banner_image": [],
+            "banner_image_srcset": [],
+            "gallery_items": [],
+            "gallery_items_srcset": [],
+        }
+
+    @classmethod
+    def get_image_sources(cls, obj: Project) -> list:
+        if hasattr(obj, "banner_image_name"):
+            return [obj.banner_image_name]
+        return [item.image.name for item in obj.gallery_items.all()]
+
+    def get_banner_image_name(self, obj: Project):
+        if hasattr(obj, "banner_image_name"):
+            return obj.banner_image_name
+
+        first_gallery_item = next(iter(obj.gallery_items.all()), None)
+        return first_gallery_item.image.name if first_gallery_item else None
+
+    def get_banner_image(self, obj: Project) -> str | None:
+        image_name = self.get_banner_image_name(obj)
+        if image_name:
+            return GalleryItem._meta.get_field("image").storage.url(image_name)
         return None
 
-    def get_gallery_items(self, obj: Project):
+    def get_banner_image_srcset(self, obj: Project) -> dict | None:
+        return self.get_image_srcset(self.get_banner_image_name(obj))
+
+    def get_gallery_items(self, obj: Project) -> list[str]:
         return [item.image.url for item in obj.gallery_items.all()]
 
+    def get_gallery_items_srcset(self, obj: Project) -> list:
+        return [
+            self.get_image_srcset(item.image.name) for item in obj.gallery_items.all()
+        ]
 
-class BlogSerializer(serializers.ModelSerializer):
 
+ProjectListSerializer = get_field_subset(
+    ProjectSerializer,
+    (
+        "title",
+        "slug",
+        "category",
+        "creation_year",
+        "banner_image",
+        "banner_image_srcset",
+    ),
+    name="ProjectListSerializer",
+)
+
+ProjectDetailSerializer = get_field_subset(
+    ProjectSerializer,
+    (
+        "title",
+        "slug",
+        "description",
+        "size",
+        "dimensions",
+        "creation_year",
+        "scale",
+        "gallery_items",
+        "gallery_items_srcset",
+    ),
+    name="ProjectDetailSerializer",
+)
+
+
+class BlogSerializer(ImageSrcsetMixin, CachedFieldsMixin, serializers.ModelSerializer):
+
+    cover_srcset = serializers.SerializerMethodField()
     comments = serializers.SerializerMethodField()
+    comments_next = serializers.SerializerMethodField()
 
     class Meta:
         model = Blog
@@ -76,69 +146,72 @@ class BlogSerializer(serializers.ModelSerializer):
             "summary",
             "body",
             "cover",
+            "cover_srcset",
             "comments",
+            "comments_next",
         ]
+        projection_sources = {
+            "cover_srcset": ["cover"],
+            "comments": [],
+            "comments_next": [],
+        }
+
+    @classmethod
+    def get_image_sources(cls, obj: Blog) -> list:
+        # ``cover`` is deferred when a sparse fieldset leaves out the srcset.
+        if "cover_srcset" not in cls.Meta.fields:
+            return []
+        return [obj.cover.name]
+
+    def get_cover_srcset(self, obj: Blog) -> dict | None:
+        return self.get_image_srcset(obj.cover.name)
 
     def get_comments(self, obj: Blog) -> list:
-        all_approved_comments = getattr(obj, "all_approved_comments", [])
-
-        top_level_comments = [
-            comment for comment in all_approved_comments if comment.parent is None
-        ]
-
-        context = self.context.copy()
-        context["all_approved_comments"] = all_approved_comments
-
-        return CommentSerializer(
-            top_level_comments,
-            many=True,
-            context=context,
-        ).data
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        if hasattr(self, "context") and self.context.get("view"):
-            view = self.context.get("view")
-            if hasattr(view, "action"):
-                if view.action == "list":
-                    allowed_fields = {
-                        "title",
-                        "slug",
-                        "description",
-                        "summary",
-                        "cover",
-                    }
-                    all_fields = set(self.fields)
-
-                    for field in all_fields - allowed_fields:
-                        self.fields.pop(field)
-                if view.action == "retrieve":
-
-                    not_allowed_fields = ["description"]
-
-                    for field in not_allowed_fields:
-                        self.fields.pop(field)
+        return self.context.get("comments", [])
+
+    def get_comments_next(self, obj: Blog) -> str | None:
+        return self.context.get("comments_next")
+
+
+BlogListSerializer = get_field_subset(
+    BlogSerializer,
+    ("title", "slug", "description", "summary", "cover", "cover_srcset"),
+    name="BlogListSerializer",
+)
+
+BlogDetailSerializer = get_field_subset(
+    BlogSerializer,
+    (
+        "title",
+        "slug",
+        "summary",
+        "body",
+        "cover",
+        "cover_srcset",
+        "comments",
+        "comments_next",
+    ),
+    name="BlogDetailSerializer",
+)
 
 
 class CommentSerializer(serializers.ModelSerializer):
-    parent = serializers.PrimaryKeyRelatedField(
-        queryset=Comment.objects.all(), allow_null=True, required=False
+    # A plain id; the view checks it belongs to the blog when resolving it.
+    parent = serializers.IntegerField(
+        source="parent_id", min_value=1, allow_null=True, required=False
     )
+    replies_count = serializers.SerializerMethodField()
     replies = serializers.SerializerMethodField()
 
     class Meta:
         model = Comment
-        fields = ["id", "name", "email", "text", "parent", "replies"]
-
-    def get_replies(self, obj: Comment) -> list:
-        all_approved_comments = self.context.get("all_approved_comments", [])
+        fields = ["id", "name", "email", "text", "parent", "replies_count", "replies"]
 
-        replies = [
-            comment for comment in all_approved_comments if comment.parent_id == obj.id
-        ]
+    def get_replies_count(self, obj: Comment) -> int:
+        return getattr(obj, "replies_count", 0)
 
-        return CommentSerializer(replies, many=True, context=self.context).data
+    def get_replies(self, obj: Comment) -> list:
+        return []
 
 
 class HistorySerializer(serializers.ModelSerializer):
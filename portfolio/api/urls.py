@@ -1,7 +1,8 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework_nested import routers
 
-from . import views
+from . import async_views, views
 
 router = routers.DefaultRouter()
 router.register("projects", views.ProjectViewSet, basename="projects")
@@ -9,6 +10,8 @@ router.register("blogs", views.BlogViewSet, basename="blogs")
 router.register("history", views.HistoryViewSet, basename="history")
 
 blog_router = routers.NestedDefaultRouter(router, "blogs", lookup="blog")
+blog_router.register("comments", views.BlogCommentViewSet, basename="blog-comments")
+
 urlpatterns = [
     *router.urls,
     *blog_router.urls,
@@ -18,3 +21,31 @@ urlpatterns = [
         name="blog-comment-create",
     ),
 ]
+
+# Under ASGI the read endpoints are served by async views on the same paths.
+async_urlpatterns = [
+    path(
+        "projects/",
+        async_views.AsyncProjectListView.as_view(),
+        name="async-projects-list",
+    ),
+    path(
+        "projects/<str:slug>/",
+        async_views.AsyncProjectRetrieveView.as_view(),
+        name="async-projects-detail",
+    ),
+    path("blogs/", async_views.AsyncBlogListView.as_view(), name="async-blogs-list"),
+    path(
+        "blogs/<str:slug>/",
+        async_views.AsyncBlogRetrieveView.as_view(),
+        name="async-blogs-detail",
+    ),
+    path(
+        "history/",
+        async_views.AsyncHistoryListView.as_view(),
+        name="async-history-list",
+    ),
+]
+
+if settings.PORTFOLIO_ASYNC_VIEWS:
+    urlpatterns = [*async_urlpatterns, *urlpatterns]
@@ -1,55 +1,142 @@
-from django.db.models import Prefetch
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from django.http import Http404, HttpResponsePermanentRedirect
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, ValidationError
-from rest_framework.filters import SearchFilter
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 
-from ..models import Blog, Comment, GalleryItem, History, Project
-from .paginations import DefaultPageNumberPagination
+from ingestion.mixins import BufferedCreateMixin
+from throttling.throttles import ThrottledSubmissionMixin
+
+from ..cache import cache_versioned_response
+from ..models import Blog, Comment, GalleryItem, History, Project, RenderedBlog
+from ..slugs import get_redirect_slug
+from .comment_tree import (
+    build_comment_tree,
+    group_comments_by_parent,
+    load_comment_threads,
+)
+from .conditions import (
+    conditional_response,
+    get_blogs_state,
+    get_histories_state,
+    get_projects_state,
+)
+from .fieldsets import FIELDS_PARAMETER, SparseFieldsetMixin
+from .filters import FullTextSearchFilter
+from .paginations import (
+    CommentCursorPagination,
+    HistoryPagination,
+    OptionalCursorPagination,
+)
+from .projection import LanguageProjectionMixin
 from .serializers import (
+    BlogDetailSerializer,
+    BlogListSerializer,
     BlogSerializer,
     CommentSerializer,
     HistorySerializer,
+    ProjectDetailSerializer,
+    ProjectListSerializer,
     ProjectSerializer,
 )
 
+DEFAULT_COMMENTS_DEPTH = 1
+
+# Rendered blogs are host independent, so these URLs are stored relative.
+RENDERED_BLOG_URL_FIELDS = ("cover", "comments_next")
+
+
+class SlugRedirectMixin:
+    """
+    Answer the retrieve of a slug that was changed with a permanent redirect
+    to the current one.
+    """
+
+    def handle_exception(self, exc):
+        if isinstance(exc, (Http404, NotFound)) and self.action == "retrieve":
+            slug = get_redirect_slug(
+                self.get_queryset().model,
+                get_language(),
+                self.kwargs[self.lookup_field],
+            )
+            if slug is not None:
+                return HttpResponsePermanentRedirect(
+                    get_redirect_url(self.request, f"{self.basename}-detail", slug)
+                )
+        return super().handle_exception(exc)
+
+
+def get_redirect_url(request, url_name, slug) -> str:
+    url = reverse(url_name, args=[slug])
+    query_string = request.META.get("QUERY_STRING")
+    return f"{url}?{query_string}" if query_string else url
+
 
 @extend_schema_view(
     list=extend_schema(
         tags=["Projects"],
         summary="Get List of all projects",
         description="Retrieve a paginated list of projects with advanced filtering and search capabilities.",
+        parameters=[FIELDS_PARAMETER],
     ),
     retrieve=extend_schema(
         tags=["Projects"],
         summary="Get Details of a project",
         description="Retrieve a project with its details.",
+        parameters=[FIELDS_PARAMETER],
     ),
 )
+@method_decorator(conditional_response(get_projects_state), name="list")
+@method_decorator(conditional_response(get_projects_state), name="retrieve")
+@method_decorator(cache_versioned_response, name="list")
+@method_decorator(cache_versioned_response, name="retrieve")
 class ProjectViewSet(
-    mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+    SlugRedirectMixin,
+    SparseFieldsetMixin,
+    LanguageProjectionMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
 ):
     serializer_class = ProjectSerializer
+    serializer_classes = {
+        "list": ProjectListSerializer,
+        "retrieve": ProjectDetailSerializer,
+    }
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, SearchFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter]
     filterset_fields = {"category__title": ["iexact"], "status": ["iexact"]}
-    search_fields = {"title": ["icontains"], "category__title": ["icontains"]}
-    pagination_class = DefaultPageNumberPagination
+    pagination_class = OptionalCursorPagination
     lookup_field = "slug"
 
     def get_queryset(self):
-        return (
-            Project.objects.select_related("category")
-            .prefetch_related(
-                Prefetch(
-                    "gallery_items", queryset=GalleryItem.objects.order_by("created_at")
-                )
+        queryset = Project.objects.select_related("category").order_by(
+            "-created_at", "title"
+        )
+
+        if self.action == "list":
+            first_gallery_image = GalleryItem.objects.filter(
+                project=OuterRef("pk")
+            ).order_by("created_at", "pk")
+            return queryset.annotate(
+                banner_image_name=Subquery(first_gallery_image.values("image")[:1])
+            )
+
+        return queryset.prefetch_related(
+            Prefetch(
+                "gallery_items",
+                queryset=GalleryItem.objects.order_by("created_at", "pk"),
             )
-            .order_by("-created_at", "title")
         )
 
 
@@ -58,77 +145,231 @@ class ProjectViewSet(
         tags=["Blogs"],
         summary="Get List of all blogs",
         description="Retrieve a paginated list of blogs.",
+        parameters=[FIELDS_PARAMETER],
     ),
     retrieve=extend_schema(
         tags=["Projects"],
         summary="Get Details of a project.",
         description="Retrieve a project with its details.",
+        parameters=[FIELDS_PARAMETER],
     ),
 )
+@method_decorator(conditional_response(get_blogs_state), name="list")
+@method_decorator(conditional_response(get_blogs_state), name="retrieve")
+@method_decorator(cache_versioned_response, name="list")
+@method_decorator(cache_versioned_response, name="retrieve")
 class BlogViewSet(
-    mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+    SlugRedirectMixin,
+    SparseFieldsetMixin,
+    LanguageProjectionMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
 ):
     serializer_class = BlogSerializer
+    serializer_classes = {
+        "list": BlogListSerializer,
+        "retrieve": BlogDetailSerializer,
+    }
     permission_classes = [AllowAny]
-    pagination_class = DefaultPageNumberPagination
+    filter_backends = [FullTextSearchFilter]
+    pagination_class = OptionalCursorPagination
     lookup_field = "slug"
 
     def get_queryset(self):
         if self.action == "list":
             blog = Blog.objects.filter(status=Blog.BlogStatus.PUBLISHED)
         elif self.action == "retrieve":
-
-            blog = Blog.objects.prefetch_related(
-                Prefetch(
-                    "comments",
-                    queryset=Comment.objects.filter(
-                        status=Comment.CommentStatusChoice.APPROVED
-                    ).select_related("parent"),
-                    to_attr="all_approved_comments",
-                )
-            )
+            blog = Blog.objects.all()
         return blog
 
+    def retrieve(self, request, *args, **kwargs):
+        if not request.query_params:
+            document = get_rendered_blog(request, kwargs[self.lookup_field])
+            if document is not None:
+                return Response(document)
+
+        return Response(self.get_blog_detail(self.get_object()))
+
+    def get_blog_detail(self, blog):
+        if "comments" not in self.get_serializer_class().Meta.fields:
+            return self.get_serializer(blog).data
+
+        paginator = CommentCursorPagination()
+        queryset = get_approved_comments().filter(blog=blog)
+        comments = paginate_comment_threads(
+            paginator, queryset, queryset.filter(parent__isnull=True), self
+        )
+        paginator.base_url = self.request.build_absolute_uri(
+            reverse("blog-comments-list", args=[blog.slug])
+        )
+
+        context = self.get_serializer_context()
+        context["comments"] = comments
+        context["comments_next"] = paginator.get_next_link()
+        return self.get_serializer(blog, context=context).data
+
+
+@extend_schema_view(
+    list=extend_schema(
+        tags=["Blogs", "Comments"],
+        summary="Get top-level comments of a blog",
+        description="Retrieve a cursor-paginated list of approved top-level comments "
+        "with their reply counts.",
+    ),
+    replies=extend_schema(
+        tags=["Blogs", "Comments"],
+        summary="Get replies of a comment",
+        description="Retrieve a cursor-paginated list of approved replies to a comment.",
+    ),
+)
+class BlogCommentViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    serializer_class = CommentSerializer
+    permission_classes = [AllowAny]
+    pagination_class = CommentCursorPagination
+
+    def get_queryset(self):
+        return get_approved_comments().filter(blog=self.get_blog())
+
+    def get_blog(self):
+        blog_slug = self.kwargs.get("blog_slug")
+        return get_object_or_404(Blog, slug=blog_slug)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        return self.get_comment_threads_response(
+            queryset, queryset.filter(parent__isnull=True)
+        )
+
+    @action(detail=True)
+    def replies(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        parent = get_object_or_404(queryset, pk=kwargs.get("pk"))
+        return self.get_comment_threads_response(
+            queryset, queryset.filter(parent=parent), root_id=parent.id
+        )
+
+    def get_comment_threads_response(self, queryset, roots, root_id=None):
+        comments = paginate_comment_threads(
+            self.paginator, queryset, roots, self, root_id=root_id
+        )
+        return self.get_paginated_response(comments)
+
+
+def get_rendered_blog(request, slug):
+    """
+    Return the precomputed detail document of a blog in the active language,
+    or ``None`` when it has not been rendered yet.
+    """
+    key = RenderedBlog.get_key(get_language(), slug)
+    document = (
+        RenderedBlog.objects.filter(pk=key).values_list("document", flat=True).first()
+    )
+    if document is not None:
+        return absolutize_rendered_blog(document, request)
+    return None
+
+
+def absolutize_rendered_blog(document, request):
+    for field in RENDERED_BLOG_URL_FIELDS:
+        if document.get(field):
+            document[field] = request.build_absolute_uri(document[field])
+    return document
+
+
+def get_approved_comments():
+    approved = Comment.CommentStatusChoice.APPROVED
+    approved_replies = (
+        Comment.objects.filter(parent=OuterRef("pk"), status=approved)
+        .order_by()
+        .values("parent")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Comment.objects.filter(status=approved).annotate(
+        replies_count=Coalesce(Subquery(approved_replies), 0)
+    )
+
+
+def get_comments_max_depth(request):
+    depth = request.query_params.get("depth")
+    if depth is None:
+        return DEFAULT_COMMENTS_DEPTH
+
+    if not depth.isdigit() or int(depth) < 1:
+        raise ValidationError({"depth": _("عمق باید یک عدد صحیح مثبت باشد.")})
+    return int(depth)
+
+
+def paginate_comment_threads(paginator, queryset, roots, view, root_id=None):
+    max_depth = get_comments_max_depth(view.request)
+    page = paginator.paginate_queryset(roots, view.request, view=view)
+    comments = load_comment_threads(queryset, page, max_depth=max_depth)
+    return build_comment_tree(
+        group_comments_by_parent(comments), root_id=root_id, max_depth=max_depth
+    )
+
 
 @extend_schema(
     tags=["Blogs", "Comments"],
     summary="Create a new comment/reply",
     description="Create a new comment or reply for a given blog and returns response 201",
 )
-class CommentViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
+class CommentViewSet(
+    ThrottledSubmissionMixin,
+    BufferedCreateMixin,
+    mixins.CreateModelMixin,
+    viewsets.GenericViewSet,
+):
     serializer_class = CommentSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "comment"
     queryset = Comment.objects.all()
 
     def perform_create(self, serializer):
-        blog = self.get_blog()
-        parent = self.get_parent()
+        blog_id = self.get_blog_id(serializer.validated_data.get("parent_id"))
+        serializer.save(blog_id=blog_id)
 
-        if parent and parent.blog != blog:
-            raise ValidationError(_("کامنت والد به این بلاگ تعلق ندارد"))
+    def get_buffered_data(self, serializer):
+        data = super().get_buffered_data(serializer)
+        data["blog_id"] = self.get_blog_id(data.get("parent_id"))
+        return data
 
-        serializer.save(blog=blog, parent=parent)
-
-    def get_blog(self):
-        blog_slug = self.kwargs.get("blog_slug")
-        print(blog_slug)
-        return get_object_or_404(Blog, slug=blog_slug)
+    def get_blog_id(self, parent_id=None):
+        """
+        Return the id of the blog in the URL, checking in the same query that
+        ``parent_id`` is one of its comments.
+        """
+        blogs = Blog.objects.filter(slug=self.kwargs.get("blog_slug"))
+        if parent_id is None:
+            blog_id = blogs.values_list("pk", flat=True).first()
+            if blog_id is None:
+                raise Http404
+            return blog_id
 
-    def get_parent(self):
-        parent_pk = self.request.data.get("parent")
-        if parent_pk:
-            try:
-                return Comment.objects.get(pk=parent_pk)
-            except Comment.DoesNotExist:
-                raise NotFound(_("کامنت وجود ندارد."))
-        return None
+        parent = Comment.objects.filter(pk=parent_id, blog_id=OuterRef("pk"))
+        row = (
+            blogs.annotate(parent_pk=Subquery(parent.values("pk")[:1]))
+            .values_list("pk", "parent_pk")
+            .first()
+        )
+        if row is None:
+            raise Http404
+        if row[1] is None:
+            raise ValidationError({"parent": _("کامنت والد به این بلاگ تعلق ندارد")})
+        return row[0]
 
 
 @extend_schema(
     tags=["History"],
     summary="Get list  of all history records",
 )
-class HistoryViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+@method_decorator(conditional_response(get_histories_state), name="list")
+@method_decorator(cache_versioned_response, name="list")
+class HistoryViewSet(
+    LanguageProjectionMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     serializer_class = HistorySerializer
     permission_classes = [AllowAny]
+    pagination_class = HistoryPagination
     queryset = History.objects.all()
@@ -6,3 +6,6 @@ class PortfolioConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "portfolio"
     verbose_name = _("اپلیکیشن نمونه کارها")
+
+    def ready(self):
+        from . import signals  # noqa
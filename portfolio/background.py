@@ -0,0 +1,48 @@
+"""
+Run side effects off the request thread.
+
+Tasks are queued once the current transaction commits and executed in order
+on a single worker thread, so a task always sees the rows that scheduled it.
+Identical calls still waiting in the queue are coalesced.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="portfolio")
+pending_tasks = set()
+pending_lock = threading.Lock()
+
+
+def run_task(func, args):
+    with pending_lock:
+        pending_tasks.discard((func, args))
+    try:
+        func(*args)
+    except Exception:
+        logger.exception("Background task %s%r failed.", func.__name__, args)
+    finally:
+        connections.close_all()
+
+
+def enqueue_task(func, *args):
+    if not settings.PORTFOLIO_BACKGROUND_TASKS:
+        func(*args)
+        return
+
+    with pending_lock:
+        if (func, args) in pending_tasks:
+            return
+        pending_tasks.add((func, args))
+    executor.submit(run_task, func, args)
+
+
+def run_after_commit(func, *args):
+    """Call ``func(*args)`` in the background once the transaction commits."""
+    transaction.on_commit(lambda: enqueue_task(func, *args))
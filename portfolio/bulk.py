@@ -0,0 +1,241 @@
+"""
+Bulk data for performance work.
+
+The factories save one row and write one image file at a time, which is
+fine for tests but far too slow to seed large datasets. These helpers build
+whole object graphs in memory, insert them with ``bulk_create`` and point
+every image at one shared placeholder file.
+
+``bulk_create`` sends no signals, so slugs and search documents are
+created here; rendered blogs and image derivatives are left out.
+"""
+
+import io
+import itertools
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone, translation
+from faker import Faker
+from PIL import Image
+
+from .cache import bump_content_version
+from .imports import batched
+from .models import Blog, Category, Comment, GalleryItem, History, Project
+from .search import index_search_documents
+from .slugs import generate_unique_slugs
+
+BATCH_SIZE = 5000
+PLACEHOLDER_IMAGE = "bulk/placeholder.png"
+TEXT_POOL_SIZE = 100
+
+faker = Faker()
+
+
+def get_placeholder_image() -> str:
+    """Store the shared 1x1 placeholder image once and return its name."""
+    if not default_storage.exists(PLACEHOLDER_IMAGE):
+        buffer = io.BytesIO()
+        Image.new("RGB", (1, 1), "white").save(buffer, format="PNG")
+        default_storage.save(PLACEHOLDER_IMAGE, ContentFile(buffer.getvalue()))
+    return PLACEHOLDER_IMAGE
+
+
+def text_pool(generate, size=TEXT_POOL_SIZE):
+    """Cycle through ``size`` generated values, since faker is slow per row."""
+    return itertools.cycle([generate() for _ in range(size)])
+
+
+def get_taken_slugs(model) -> tuple:
+    taken, taken_en = set(), set()
+    for slug_fa, slug_en in model.objects.values_list("slug_fa", "slug_en"):
+        if slug_fa:
+            taken.add(slug_fa)
+        if slug_en:
+            taken_en.add(slug_en)
+    return taken, taken_en
+
+
+def assign_bulk_slugs(model, objects):
+    titles = [obj.title for obj in objects]
+    taken, taken_en = get_taken_slugs(model)
+    slugs = generate_unique_slugs(model, titles, taken)
+    slugs_en = generate_unique_slugs(model, titles, taken_en)
+    for obj, slug, slug_en in zip(objects, slugs, slugs_en):
+        obj.slug_fa = slug
+        obj.slug_en = slug_en
+
+
+def insert_in_batches(model, objects) -> int:
+    """Insert ``objects`` without holding more than one batch in memory."""
+    count = 0
+    for batch in batched(objects, BATCH_SIZE):
+        model.objects.bulk_create(batch)
+        count += len(batch)
+    return count
+
+
+def bulk_create_projects(count, gallery_items=3, categories=5) -> list:
+    image = get_placeholder_image()
+    descriptions = text_pool(faker.sentence)
+    category_objects = Category.objects.bulk_create(
+        Category(title=f"Bulk category {faker.uuid4()}") for _ in range(categories)
+    )
+    category_cycle = itertools.cycle(category_objects or [None])
+
+    projects = [
+        Project(
+            title=f"Project {faker.word()} {index}",
+            description=next(descriptions),
+            category=next(category_cycle),
+            size="1",
+            dimensions="1*1",
+            creation_year="2024",
+            scale="1:1",
+            status=Project.ProjectStatus.FINISHED,
+        )
+        for index in range(count)
+    ]
+    assign_bulk_slugs(Project, projects)
+
+    with transaction.atomic():
+        Project.objects.bulk_create(projects, batch_size=BATCH_SIZE)
+        insert_in_batches(
+            GalleryItem,
+            (
+                GalleryItem(project=project, image=image)
+                for project in projects
+                for _ in range(gallery_items)
+            ),
+        )
+        index_search_documents(projects, batch_size=BATCH_SIZE)
+    return projects
+
+
+def bulk_create_blogs(count, comments=0, replies=0) -> list:
+    image = get_placeholder_image()
+    summaries = text_pool(faker.sentence)
+
+    blogs = [
+        Blog(
+            title=f"Blog {faker.word()} {index}",
+            description=next(summaries),
+            summary=next(summaries),
+            body="<p>Simple test content</p>",
+            cover=image,
+            status=Blog.BlogStatus.PUBLISHED,
+        )
+        for index in range(count)
+    ]
+    assign_bulk_slugs(Blog, blogs)
+
+    with transaction.atomic():
+        Blog.objects.bulk_create(blogs, batch_size=BATCH_SIZE)
+        index_search_documents(blogs, batch_size=BATCH_SIZE)
+        bulk_create_comments(blogs, comments, replies)
+    return blogs
+
+
+def insert_rows(model, field_names, rows):
+    """
+    Insert ``rows`` of raw column values with ``executemany``, skipping model
+    instances and the per-value preparation ``bulk_create`` does.
+    """
+    quote_name = connection.ops.quote_name
+    columns = [model._meta.get_field(name).column for name in field_names]
+    sql = (
+        f"INSERT INTO {quote_name(model._meta.db_table)} "
+        f"({', '.join(map(quote_name, columns))}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))})"
+    )
+    with connection.cursor() as cursor:
+        for batch in batched(rows, BATCH_SIZE):
+            cursor.executemany(sql, batch)
+
+
+def bulk_create_comments(blogs, count, replies=0) -> int:
+    """
+    Create ``count`` approved top-level comments on each of ``blogs`` with
+    ``replies`` replies each, and return how many rows were inserted.
+
+    Comments are the largest table, so their ids are assigned here and rows
+    are inserted as plain tuples; the id sequence is reset afterwards.
+    """
+    names = text_pool(faker.name)
+    emails = text_pool(faker.email)
+    texts = text_pool(faker.sentence)
+    created_at = Comment._meta.get_field("created_at").get_db_prep_save(
+        timezone.now(), connection
+    )
+    status = Comment.CommentStatusChoice.APPROVED.value
+    first_id = (Comment.objects.aggregate(last_id=Max("id"))["last_id"] or 0) + 1
+    ids = itertools.count(first_id)
+
+    def build_rows():
+        for blog in blogs:
+            for _ in range(count):
+                root_id = next(ids)
+                yield (root_id, None, blog.pk, next(names), next(emails), next(texts))
+                for _ in range(replies):
+                    yield (
+                        next(ids),
+                        root_id,
+                        blog.pk,
+                        next(names),
+                        next(emails),
+                        next(texts),
+                    )
+
+    with transaction.atomic():
+        insert_rows(
+            Comment,
+            ["id", "parent", "blog", "name", "email", "text", "status", "created_at"],
+            (row + (status, created_at) for row in build_rows()),
+        )
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Comment]):
+                cursor.execute(sql)
+    return next(ids) - first_id
+
+
+def bulk_create_histories(count) -> int:
+    events = text_pool(faker.word)
+    dates = text_pool(faker.date_object)
+    return insert_in_batches(
+        History,
+        (
+            History(event=f"Event {next(events)}", date=next(dates))
+            for _ in range(count)
+        ),
+    )
+
+
+def seed(
+    projects=0,
+    gallery_items=3,
+    blogs=0,
+    comments=0,
+    replies=0,
+    histories=0,
+) -> dict:
+    """
+    Seed a whole dataset in the default language and return how many rows
+    of each kind exist now.
+    """
+    with translation.override(settings.LANGUAGE_CODE):
+        bulk_create_projects(projects, gallery_items=gallery_items)
+        bulk_create_blogs(blogs, comments=comments, replies=replies)
+        bulk_create_histories(histories)
+    transaction.on_commit(bump_content_version)
+
+    return {
+        "projects": Project.objects.count(),
+        "gallery_items": GalleryItem.objects.count(),
+        "blogs": Blog.objects.count(),
+        "comments": Comment.objects.count(),
+        "histories": History.objects.count(),
+    }
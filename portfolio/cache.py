@@ -0,0 +1,59 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+from rest_framework import status
+from rest_framework.response import Response
+
+CONTENT_VERSION_KEY = "portfolio:content-version"
+
+
+def get_content_version() -> int:
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        # Start from a timestamp so an evicted version never reuses old keys.
+        cache.add(CONTENT_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(CONTENT_VERSION_KEY)
+    return version
+
+
+def bump_content_version():
+    try:
+        cache.incr(CONTENT_VERSION_KEY)
+    except ValueError:
+        cache.set(CONTENT_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def get_request_cache_key(request, prefix="response") -> str:
+    # Responses hold absolute URLs, so they are cached per scheme and host.
+    url_hash = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    return f"portfolio:{prefix}:{get_content_version()}:{get_language()}:{url_hash}"
+
+
+def cache_versioned_response(view_method):
+    """
+    Cache the data of successful responses per language and query string
+    under the current content version.
+    """
+
+    @wraps(view_method)
+    def wrapper(request, *args, **kwargs):
+        cache_key = get_request_cache_key(request)
+
+        cached_data = cache.get(cache_key)
+        if cached_data is not None:
+            return Response(cached_data)
+
+        response = view_method(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(
+                cache_key,
+                response.data,
+                timeout=settings.PORTFOLIO_RESPONSE_CACHE_TIMEOUT,
+            )
+        return response
+
+    return wrapper
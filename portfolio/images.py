@@ -0,0 +1,122 @@
+"""
+Responsive derivatives of uploaded images.
+
+Every gallery item and blog cover is resized to a few widths in JPEG and
+WebP after upload, and serializers expose them as ``srcset`` strings. The
+derivatives are deleted once no gallery item or blog cover uses the source.
+"""
+
+from collections import defaultdict
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from .cache import bump_content_version
+from .models import Blog, GalleryItem, ImageDerivative
+
+DERIVATIVE_WIDTHS = (320, 640, 1024, 1600)
+DERIVATIVE_QUALITY = 82
+
+
+def get_derivative_widths(original_width: int) -> list:
+    """Return the target widths that do not upscale, or the original width."""
+    widths = [width for width in DERIVATIVE_WIDTHS if width < original_width]
+    return widths or [original_width]
+
+
+def encode_image(image: Image.Image, format: str) -> ContentFile:
+    if format == ImageDerivative.Format.JPEG and image.mode != "RGB":
+        image = image.convert("RGB")
+
+    buffer = BytesIO()
+    image.save(buffer, format=format.upper(), quality=DERIVATIVE_QUALITY)
+    return ContentFile(buffer.getvalue())
+
+
+def generate_image_derivatives(image_field):
+    """
+    Create the derivatives of a stored ``ImageFieldFile`` unless they exist.
+    """
+    source = image_field.name
+    if not source or ImageDerivative.objects.filter(source=source).exists():
+        return
+
+    with image_field.storage.open(source) as file:
+        original = ImageOps.exif_transpose(Image.open(file))
+        original.load()
+
+    stem = PurePosixPath(source).stem
+    derivatives = []
+    for width in get_derivative_widths(original.width):
+        height = max(1, round(original.height * width / original.width))
+        resized = original.resize((width, height), Image.Resampling.LANCZOS)
+
+        for format in ImageDerivative.Format.values:
+            derivative = ImageDerivative(
+                source=source, format=format, width=width, height=height
+            )
+            derivative.image.save(
+                f"{stem}-{width}.{format}", encode_image(resized, format), save=False
+            )
+            derivatives.append(derivative)
+
+    ImageDerivative.objects.bulk_create(derivatives, ignore_conflicts=True)
+    bump_content_version()
+
+
+def is_image_used(source) -> bool:
+    return (
+        GalleryItem.objects.filter(image=source).exists()
+        or Blog.objects.filter(cover=source).exists()
+    )
+
+
+def delete_image_derivatives(source):
+    """
+    Delete the derivatives of the stored image ``source`` and their files,
+    unless a gallery item or blog cover still uses it.
+    """
+    if not source or is_image_used(source):
+        return
+
+    derivatives = list(ImageDerivative.objects.filter(source=source))
+    if not derivatives:
+        return
+
+    ImageDerivative.objects.filter(pk__in=[d.pk for d in derivatives]).delete()
+    for derivative in derivatives:
+        derivative.image.delete(save=False)
+    bump_content_version()
+
+
+def load_image_srcsets(sources) -> dict:
+    return build_image_srcsets(
+        ImageDerivative.objects.filter(source__in=set(sources)).order_by("width")
+    )
+
+
+async def aload_image_srcsets(sources) -> dict:
+    return build_image_srcsets(
+        [
+            derivative
+            async for derivative in ImageDerivative.objects.filter(
+                source__in=set(sources)
+            ).order_by("width")
+        ]
+    )
+
+
+def build_image_srcsets(derivatives) -> dict:
+    """Map each source name to ``{format: srcset}`` of its derivatives."""
+    candidates = defaultdict(lambda: defaultdict(list))
+    for derivative in derivatives:
+        candidates[derivative.source][derivative.format].append(
+            f"{derivative.image.url} {derivative.width}w"
+        )
+
+    return {
+        source: {format: ", ".join(urls) for format, urls in formats.items()}
+        for source, formats in candidates.items()
+    }
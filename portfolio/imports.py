@@ -0,0 +1,217 @@
+"""
+Bulk import of projects and their gallery images from a JSONL manifest.
+
+Each manifest line describes one project::
+
+    {"title": "...", "title_en": "...", "description": "...",
+     "category": "...", "size": "1.5", "dimensions": "2*3",
+     "creation_year": "2024", "scale": "1:5", "status": "F",
+     "images": ["house/front.jpg", "house/back.jpg"]}
+
+``title``, ``description`` and ``category`` are in the default language and
+``images`` are paths relative to the image directory.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import translation
+from PIL import Image
+
+from .background import run_after_commit
+from .cache import bump_content_version
+from .images import generate_image_derivatives
+from .models import Category, GalleryItem, Project
+from .search import index_search_documents
+from .slugs import generate_unique_slugs
+
+PROJECT_FIELDS = {
+    "title",
+    "title_en",
+    "description",
+    "description_en",
+    "size",
+    "dimensions",
+    "creation_year",
+    "scale",
+    "status",
+}
+REQUIRED_FIELDS = {
+    "title",
+    "description",
+    "size",
+    "dimensions",
+    "creation_year",
+    "scale",
+}
+
+
+class ManifestError(ValueError):
+    pass
+
+
+@dataclass
+class ImportStats:
+    projects: int = 0
+    images: int = 0
+    categories: int = 0
+
+
+def read_manifest(path):
+    """Yield the validated rows of a JSONL manifest."""
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ManifestError(f"Line {line_number}: {exc}") from exc
+            validate_row(line_number, row)
+            yield row
+
+
+def validate_row(line_number, row):
+    if not isinstance(row, dict):
+        raise ManifestError(f"Line {line_number}: expected an object.")
+
+    unknown = set(row) - PROJECT_FIELDS - {"category", "images"}
+    missing = REQUIRED_FIELDS - set(row)
+    if unknown or missing:
+        raise ManifestError(
+            f"Line {line_number}: unknown fields {sorted(unknown)}, "
+            f"missing fields {sorted(missing)}."
+        )
+
+
+def store_image(path):
+    """
+    Verify an image file and copy it into gallery storage.
+
+    Runs in worker processes, so it must not touch the database.
+    """
+    with Image.open(path) as image:
+        image.verify()
+
+    field = GalleryItem._meta.get_field("image")
+    with open(path, "rb") as file:
+        name = field.generate_filename(None, os.path.basename(path))
+        return field.storage.save(name, File(file), max_length=field.max_length)
+
+
+def get_categories(titles) -> tuple:
+    """Return categories by title, creating missing ones with one insert."""
+    categories = {
+        category.title: category
+        for category in Category.objects.filter(title__in=titles)
+    }
+    missing = [Category(title=title) for title in titles if title not in categories]
+    for category in Category.objects.bulk_create(missing):
+        categories[category.title] = category
+    return categories, len(missing)
+
+
+def load_taken_slugs() -> tuple:
+    taken, taken_en = set(), set()
+    for slug_fa, slug_en in Project.objects.values_list("slug_fa", "slug_en"):
+        if slug_fa:
+            taken.add(slug_fa)
+        if slug_en:
+            taken_en.add(slug_en)
+    return taken, taken_en
+
+
+def import_batch(rows, stored_names, taken_slugs) -> ImportStats:
+    """
+    Create the categories, projects and gallery items of one manifest batch.
+
+    ``stored_names`` holds the storage names of each row's images, and
+    ``taken_slugs`` is updated with the slugs handed out.
+    """
+    taken, taken_en = taken_slugs
+
+    categories, categories_count = get_categories(
+        {row["category"] for row in rows if row.get("category")}
+    )
+    slugs = generate_unique_slugs(Project, [row["title"] for row in rows], taken)
+    slugs_en = generate_unique_slugs(
+        Project, [row.get("title_en") or row["title"] for row in rows], taken_en
+    )
+
+    projects = []
+    for row, slug, slug_en in zip(rows, slugs, slugs_en):
+        projects.append(
+            Project(
+                **{name: row[name] for name in PROJECT_FIELDS if name in row},
+                category=categories.get(row.get("category")),
+                slug=slug,
+                slug_en=slug_en,
+            )
+        )
+
+    # bulk_create sends no signals, so do what the post_save receivers would.
+    with transaction.atomic():
+        Project.objects.bulk_create(projects)
+        gallery_items = GalleryItem.objects.bulk_create(
+            GalleryItem(project=project, image=name)
+            for project, names in zip(projects, stored_names)
+            for name in names
+        )
+
+        index_search_documents(projects)
+        for gallery_item in gallery_items:
+            run_after_commit(generate_image_derivatives, gallery_item.image)
+        transaction.on_commit(bump_content_version)
+
+    return ImportStats(
+        projects=len(projects), images=len(gallery_items), categories=categories_count
+    )
+
+
+def store_batch_images(rows, image_dir, map_images) -> list:
+    paths = [
+        [os.path.join(image_dir, image) for image in row.get("images", [])]
+        for row in rows
+    ]
+    names = iter(map_images(store_image, [path for row in paths for path in row]))
+    return [[next(names) for _ in row_paths] for row_paths in paths]
+
+
+def import_projects(manifest, image_dir, batch_size=500, map_images=map, on_batch=None):
+    """
+    Import every project of ``manifest`` in batches of ``batch_size``.
+
+    Images are stored through ``map_images``, e.g. a process pool's ``map``,
+    so they are decoded and copied in parallel. ``on_batch`` is called with
+    the running totals after each batch.
+    """
+    total = ImportStats()
+
+    with translation.override(settings.LANGUAGE_CODE):
+        taken_slugs = load_taken_slugs()
+        for rows in batched(read_manifest(manifest), batch_size):
+            stored_names = store_batch_images(rows, image_dir, map_images)
+            stats = import_batch(rows, stored_names, taken_slugs)
+
+            total.projects += stats.projects
+            total.images += stats.images
+            total.categories += stats.categories
+            if on_batch is not None:
+                on_batch(total)
+
+    return total
+
+
+def batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
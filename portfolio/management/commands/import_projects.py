@@ -0,0 +1,71 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from PIL import UnidentifiedImageError
+
+from ...imports import ManifestError, import_projects
+
+
+class Command(BaseCommand):
+    help = "Import projects and gallery images from a JSONL manifest."
+
+    def add_arguments(self, parser):
+        parser.add_argument("manifest", help="JSONL file with one project per line.")
+        parser.add_argument(
+            "image_dir", help="Directory the manifest image paths are relative to."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Projects inserted per transaction.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Processes that store images; 0 stores them in this process.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+
+        def report(total):
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    f"{total.projects} projects, {total.images} images "
+                    f"({time.perf_counter() - started:.1f}s)"
+                )
+
+        import_options = {
+            "manifest": options["manifest"],
+            "image_dir": options["image_dir"],
+            "batch_size": options["batch_size"],
+            "on_batch": report,
+        }
+        try:
+            if options["workers"]:
+                with ProcessPoolExecutor(
+                    max_workers=options["workers"], initializer=django.setup
+                ) as executor:
+                    stats = import_projects(
+                        **import_options, map_images=partial(executor.map, chunksize=8)
+                    )
+            else:
+                stats = import_projects(**import_options)
+        except (ManifestError, OSError, UnidentifiedImageError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {stats.projects} projects, {stats.images} images and "
+                f"{stats.categories} new categories in {elapsed:.2f}s "
+                f"({stats.projects / elapsed:.1f} projects/s, "
+                f"{stats.images / elapsed:.1f} images/s)."
+            )
+        )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from ...models import Blog, Project
+from ...search import get_search_backend, update_search_documents
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search documents of all projects and blogs."
+
+    def handle(self, *args, **options):
+        get_search_backend().create_index()
+
+        for queryset in [Project.objects.select_related("category"), Blog.objects]:
+            count = 0
+            for instance in queryset.iterator(chunk_size=500):
+                update_search_documents(instance)
+                count += 1
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Indexed {count} {queryset.model._meta.verbose_name_plural}."
+                )
+            )
@@ -1,5 +1,6 @@
-from autoslug import AutoSlugField
 from ckeditor_uploader.fields import RichTextUploadingField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -33,11 +34,13 @@ class Project(BaseModel):
         ONGOING = "O", _("در حال انجام")
 
     title = models.CharField(verbose_name=_("عنوان پروژه"), max_length=255)
-    slug = AutoSlugField(
+    # Filled from the title on first save, see ``portfolio.slugs``. Each
+    # translated column has its own unique constraint.
+    slug = models.SlugField(
         verbose_name=_("اسلاگ پروژه"),
-        populate_from="title",
-        unique=True,
-        always_update=True,
+        max_length=255,
+        blank=True,
+        db_index=False,
     )
     description = models.TextField(verbose_name=_("توضیحات پروژه"))
     category = models.ForeignKey(
@@ -62,6 +65,19 @@ class Project(BaseModel):
         verbose_name = _("پروژه")
         verbose_name_plural = _("پروژه‌ها")
         ordering = ["-created_at", "title"]
+        indexes = [
+            models.Index(
+                fields=["-created_at", "title_fa"], name="project_created_title_fa_idx"
+            ),
+            models.Index(
+                fields=["-created_at", "title_en"], name="project_created_title_en_idx"
+            ),
+            models.Index(fields=["status", "-created_at"], name="project_status_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["slug_fa"], name="unique_project_slug_fa"),
+            models.UniqueConstraint(fields=["slug_en"], name="unique_project_slug_en"),
+        ]
 
     def __str__(self):
         return self.title
@@ -84,6 +100,38 @@ class GalleryItem(BaseModel):
         verbose_name = _("آیتم گالری")
         verbose_name_plural = _("آیتم‌های گالری")
         ordering = ["created_at"]
+        indexes = [
+            models.Index(
+                fields=["project", "created_at", "id"], name="gallery_item_project_idx"
+            ),
+        ]
+
+
+class ImageDerivative(models.Model):
+    class Format(models.TextChoices):
+        JPEG = "jpeg", "JPEG"
+        WEBP = "webp", "WebP"
+
+    source = models.CharField(verbose_name=_("تصویر اصلی"), max_length=255)
+    format = models.CharField(
+        verbose_name=_("فرمت"), max_length=4, choices=Format.choices
+    )
+    width = models.PositiveIntegerField(verbose_name=_("عرض"))
+    height = models.PositiveIntegerField(verbose_name=_("ارتفاع"))
+    image = models.ImageField(verbose_name=_("تصویر"), upload_to="derivatives/")
+
+    class Meta:
+        verbose_name = _("نسخه تصویر")
+        verbose_name_plural = _("نسخه‌های تصویر")
+        ordering = ["source", "format", "width"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "format", "width"], name="unique_image_derivative"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.source} ({self.format} {self.width}w)"
 
 
 class Blog(BaseModel):
@@ -92,11 +140,13 @@ class Blog(BaseModel):
         ARCHIVED = "A", _("آرشیو شده")
 
     title = models.CharField(verbose_name=_("عنوان بلاگ"), max_length=255)
-    slug = AutoSlugField(
+    # Filled from the title on first save, see ``portfolio.slugs``. Each
+    # translated column has its own unique constraint.
+    slug = models.SlugField(
         verbose_name=_("اسلاگ بلاگ"),
-        populate_from="title",
-        unique=True,
-        always_update=True,
+        max_length=255,
+        blank=True,
+        db_index=False,
     )
 
     description = models.CharField(verbose_name=_("توضیحات بلاگ"), max_length=255)
@@ -115,6 +165,22 @@ class Blog(BaseModel):
         verbose_name = _("بلاگ")
         verbose_name_plural = _("بلاگ‌ها")
         ordering = ["-updated_at", "-created_at", "title"]
+        indexes = [
+            models.Index(
+                fields=["-updated_at", "-created_at", "title_fa"],
+                name="published_blog_fa_idx",
+                condition=models.Q(status="P"),
+            ),
+            models.Index(
+                fields=["-updated_at", "-created_at", "title_en"],
+                name="published_blog_en_idx",
+                condition=models.Q(status="P"),
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["slug_fa"], name="unique_blog_slug_fa"),
+            models.UniqueConstraint(fields=["slug_en"], name="unique_blog_slug_en"),
+        ]
 
     def __str__(self):
         return self.title
@@ -157,6 +223,21 @@ class Comment(BaseModel):
         verbose_name = _("نظر")
         verbose_name_plural = _("نظرات")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["blog", "status", "-created_at"], name="comment_blog_status_idx"
+            ),
+            models.Index(
+                fields=["blog", "-created_at", "-id"],
+                name="approved_top_comment_idx",
+                condition=models.Q(status="A", parent__isnull=True),
+            ),
+            models.Index(
+                fields=["parent", "-created_at", "-id"],
+                name="approved_reply_idx",
+                condition=models.Q(status="A"),
+            ),
+        ]
 
     def __str__(self):
         return ""
@@ -170,6 +251,35 @@ class Comment(BaseModel):
         return self.parent is not None
 
 
+class RenderedBlog(models.Model):
+    key = models.CharField(primary_key=True, max_length=255, editable=False)
+    blog = models.ForeignKey(
+        Blog,
+        on_delete=models.CASCADE,
+        verbose_name=_("بلاگ"),
+        related_name="rendered_documents",
+    )
+    language = models.CharField(verbose_name=_("زبان"), max_length=7)
+    document = models.JSONField(verbose_name=_("سند"))
+    rendered_at = models.DateTimeField(verbose_name=_("تاریخ ساخت"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("بلاگ آماده")
+        verbose_name_plural = _("بلاگ‌های آماده")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["blog", "language"], name="unique_rendered_blog_language"
+            ),
+        ]
+
+    def __str__(self):
+        return self.key
+
+    @staticmethod
+    def get_key(language, slug):
+        return f"{language}:{slug}"
+
+
 class History(BaseModel):
     event = models.CharField(verbose_name=_("رویداد تاریخ"), max_length=255)
     date = models.DateField(verbose_name=_("تاریخ رویداد"))
@@ -179,6 +289,75 @@ class History(BaseModel):
         verbose_name = _("تاریخچه")
         verbose_name_plural = _("تاریخچه‌ها")
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["-created_at"], name="history_created_at_idx")]
 
     def __str__(self):
         return self.event
+
+
+class SlugRedirect(models.Model):
+    class ObjectType(models.TextChoices):
+        PROJECT = "project", _("پروژه")
+        BLOG = "blog", _("بلاگ")
+
+    object_type = models.CharField(
+        verbose_name=_("نوع شیء"), max_length=10, choices=ObjectType.choices
+    )
+    object_id = models.PositiveBigIntegerField(verbose_name=_("شناسه شیء"))
+    language = models.CharField(verbose_name=_("زبان"), max_length=7)
+    old_slug = models.SlugField(
+        verbose_name=_("اسلاگ قدیمی"), max_length=255, db_index=False
+    )
+    new_slug = models.SlugField(
+        verbose_name=_("اسلاگ جدید"), max_length=255, db_index=False
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("تاریخ ایجاد"))
+
+    class Meta:
+        verbose_name = _("تغییر مسیر اسلاگ")
+        verbose_name_plural = _("تغییر مسیرهای اسلاگ")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["object_type", "language", "old_slug"],
+                name="unique_slug_redirect",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["object_type", "object_id"], name="slug_redirect_object_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.old_slug} -> {self.new_slug}"
+
+
+class SearchDocument(models.Model):
+    class DocumentType(models.TextChoices):
+        PROJECT = "project", _("پروژه")
+        BLOG = "blog", _("بلاگ")
+
+    document_type = models.CharField(
+        verbose_name=_("نوع سند"), max_length=10, choices=DocumentType.choices
+    )
+    object_id = models.PositiveBigIntegerField(verbose_name=_("شناسه شیء"))
+    language = models.CharField(verbose_name=_("زبان"), max_length=7)
+    title = models.TextField(verbose_name=_("عنوان"))
+    content = models.TextField(verbose_name=_("محتوا"))
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        verbose_name = _("سند جستجو")
+        verbose_name_plural = _("اسناد جستجو")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["document_type", "object_id", "language"],
+                name="unique_search_document",
+            )
+        ]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="search_document_vector_idx"),
+        ]
+
+    def __str__(self):
+        return self.title
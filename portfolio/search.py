@@ -0,0 +1,240 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, FloatField, OuterRef, Q, Subquery, Value
+from django.db.models.expressions import RawSQL
+from django.utils import translation
+from django.utils.html import strip_tags
+from modeltranslation.settings import AVAILABLE_LANGUAGES
+
+from .models import Blog, Project, SearchDocument
+
+FTS_TABLE = "portfolio_searchdocument_fts"
+
+PERSIAN_CHARACTERS = str.maketrans(
+    {
+        "ي": "ی",
+        "ى": "ی",
+        "ئ": "ی",
+        "ك": "ک",
+        "ة": "ه",
+        "ۀ": "ه",
+        "أ": "ا",
+        "إ": "ا",
+        "ٱ": "ا",
+        "آ": "ا",
+        "ؤ": "و",
+        "\u200c": " ",
+        "\u0640": "",
+        **{persian: str(digit) for digit, persian in enumerate("۰۱۲۳۴۵۶۷۸۹")},
+        **{arabic: str(digit) for digit, arabic in enumerate("٠١٢٣٤٥٦٧٨٩")},
+    }
+)
+ARABIC_DIACRITICS = re.compile("[\u064b-\u065f\u0670]")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Fold Arabic letter variants, digits, diacritics and zero-width
+    non-joiners to one Persian form so queries match regardless of keyboard.
+    """
+    text = ARABIC_DIACRITICS.sub("", text.translate(PERSIAN_CHARACTERS))
+    return " ".join(text.lower().split())
+
+
+def get_search_terms(query: str) -> list:
+    return re.findall(r"\w+", normalize_text(query))
+
+
+def get_document_type(model) -> str:
+    if model is Project:
+        return SearchDocument.DocumentType.PROJECT
+    if model is Blog:
+        return SearchDocument.DocumentType.BLOG
+    raise ValueError(f"{model.__name__} is not searchable.")
+
+
+def get_document_fields(instance) -> tuple:
+    if isinstance(instance, Project):
+        category_title = instance.category.title if instance.category else ""
+        return instance.title, [instance.description, category_title]
+    return instance.title, [
+        instance.description,
+        instance.summary,
+        strip_tags(instance.body),
+    ]
+
+
+class SearchBackend:
+    def create_index(self):
+        pass
+
+    def update(self, documents):
+        pass
+
+    def remove(self, document_ids):
+        pass
+
+    def get_rank(self, model, document_type, language, terms):
+        """
+        Return an expression for the rank of each ``model`` row matching
+        every term in ``language``, ``NULL`` for the rest.
+        """
+        documents = SearchDocument.objects.filter(
+            document_type=document_type, language=language, object_id=OuterRef("pk")
+        )
+        for term in terms:
+            documents = documents.filter(
+                Q(title__contains=term) | Q(content__contains=term)
+            )
+        return Subquery(
+            documents.annotate(rank=Value(1.0, output_field=FloatField())).values(
+                "rank"
+            )[:1]
+        )
+
+
+class PostgresSearchBackend(SearchBackend):
+    config = "simple"
+
+    def update(self, documents):
+        SearchDocument.objects.filter(pk__in=[doc.pk for doc in documents]).update(
+            search_vector=SearchVector("title", weight="A", config=self.config)
+            + SearchVector("content", weight="B", config=self.config)
+        )
+
+    def get_rank(self, model, document_type, language, terms):
+        query = SearchQuery(
+            " & ".join(f"{term}:*" for term in terms),
+            config=self.config,
+            search_type="raw",
+        )
+        return Subquery(
+            SearchDocument.objects.filter(
+                document_type=document_type,
+                language=language,
+                object_id=OuterRef("pk"),
+                search_vector=query,
+            )
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .values("rank")[:1]
+        )
+
+
+class SQLiteSearchBackend(SearchBackend):
+    def create_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                "title, content, tokenize='unicode61 remove_diacritics 2')"
+            )
+
+    def update(self, documents):
+        self.remove([document.pk for document in documents])
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, content) VALUES (%s, %s, %s)",
+                [(doc.pk, doc.title, doc.content) for doc in documents],
+            )
+
+    def remove(self, document_ids):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid = %s",
+                [(document_id,) for document_id in document_ids],
+            )
+
+    def get_rank(self, model, document_type, language, terms):
+        # FTS5 tables are outside the ORM, so correlate the ranking query
+        # with the outer row by hand.
+        quote_name = connection.ops.quote_name
+        outer_pk = (
+            f"{quote_name(model._meta.db_table)}."
+            f"{quote_name(model._meta.pk.column)}"
+        )
+        return RawSQL(
+            f"SELECT -bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} "
+            f"JOIN {SearchDocument._meta.db_table} AS document "
+            f"ON document.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s "
+            "AND document.document_type = %s AND document.language = %s "
+            f"AND document.object_id = {outer_pk}",
+            [" ".join(f'"{term}"*' for term in terms), document_type, language],
+            output_field=FloatField(),
+        )
+
+
+def get_search_backend() -> SearchBackend:
+    if connection.vendor == "postgresql":
+        return PostgresSearchBackend()
+    if connection.vendor == "sqlite":
+        return SQLiteSearchBackend()
+    return SearchBackend()
+
+
+def update_search_documents(instance):
+    document_type = get_document_type(type(instance))
+    documents = []
+
+    for language in AVAILABLE_LANGUAGES:
+        with translation.override(language):
+            title, content = get_document_fields(instance)
+
+        document, _ = SearchDocument.objects.update_or_create(
+            document_type=document_type,
+            object_id=instance.pk,
+            language=language,
+            defaults={
+                "title": normalize_text(title or ""),
+                "content": normalize_text(" ".join(filter(None, content))),
+            },
+        )
+        documents.append(document)
+
+    get_search_backend().update(documents)
+
+
+def index_search_documents(objects, batch_size=None):
+    """
+    Create the search documents of new ``objects`` with one ``bulk_create``,
+    for rows inserted without the ``post_save`` receivers.
+    """
+    documents = []
+    for obj in objects:
+        for language in AVAILABLE_LANGUAGES:
+            with translation.override(language):
+                title, content = get_document_fields(obj)
+            documents.append(
+                SearchDocument(
+                    document_type=get_document_type(type(obj)),
+                    object_id=obj.pk,
+                    language=language,
+                    title=normalize_text(title or ""),
+                    content=normalize_text(" ".join(filter(None, content))),
+                )
+            )
+    SearchDocument.objects.bulk_create(documents, batch_size=batch_size)
+    get_search_backend().update(documents)
+
+
+def remove_search_documents(instance):
+    documents = SearchDocument.objects.filter(
+        document_type=get_document_type(type(instance)), object_id=instance.pk
+    )
+    get_search_backend().remove(list(documents.values_list("pk", flat=True)))
+    documents.delete()
+
+
+def get_search_rank(model, query: str, language: str):
+    """
+    Return an expression for the rank of each ``model`` row matching every
+    term of ``query`` in ``language``, ``NULL`` for the rest, or ``None``
+    if the query has no terms.
+    """
+    terms = get_search_terms(query)
+    if not terms:
+        return None
+    return get_search_backend().get_rank(
+        model, get_document_type(model), language, terms
+    )
@@ -0,0 +1,142 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+
+from .api.rendered_blogs import schedule_blog_render
+from .background import run_after_commit
+from .cache import bump_content_version
+from .images import delete_image_derivatives, generate_image_derivatives
+from .models import Blog, Category, Comment, GalleryItem, History, Project
+from .search import get_search_backend, remove_search_documents, update_search_documents
+from .slugs import (
+    assign_slugs,
+    delete_slug_redirects,
+    get_saved_slugs,
+    record_slug_redirects,
+)
+
+IMAGE_FIELDS = {GalleryItem: "image", Blog: "cover"}
+
+
+@receiver(pre_save, sender=Project)
+@receiver(pre_save, sender=Blog)
+def generate_slugs(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not any(
+        field.startswith("slug") for field in update_fields
+    ):
+        return
+
+    instance._saved_slugs = get_saved_slugs(instance)
+    assign_slugs(instance)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Blog)
+def redirect_changed_slugs(sender, instance, **kwargs):
+    old_slugs = instance.__dict__.pop("_saved_slugs", None)
+    if old_slugs:
+        record_slug_redirects(instance, old_slugs)
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Blog)
+def remove_slug_redirects(sender, instance, **kwargs):
+    delete_slug_redirects(instance)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=GalleryItem)
+@receiver(post_delete, sender=GalleryItem)
+@receiver(post_save, sender=Blog)
+@receiver(post_delete, sender=Blog)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=History)
+@receiver(post_delete, sender=History)
+def invalidate_cached_responses(sender, **kwargs):
+    # After commit, or a concurrent request could cache the old rows under
+    # the new version.
+    transaction.on_commit(bump_content_version)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Blog)
+def index_search_documents(sender, instance, **kwargs):
+    update_search_documents(instance)
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Blog)
+def unindex_search_documents(sender, instance, **kwargs):
+    remove_search_documents(instance)
+
+
+@receiver(post_save, sender=GalleryItem)
+def generate_gallery_item_derivatives(sender, instance, **kwargs):
+    run_after_commit(generate_image_derivatives, instance.image)
+
+
+# Connected before ``render_blog`` so the rendered document has the srcsets.
+@receiver(post_save, sender=Blog)
+def generate_blog_cover_derivatives(sender, instance, **kwargs):
+    run_after_commit(generate_image_derivatives, instance.cover)
+
+
+@receiver(pre_save, sender=GalleryItem)
+@receiver(pre_save, sender=Blog)
+def remember_saved_image(sender, instance, raw=False, update_fields=None, **kwargs):
+    field_name = IMAGE_FIELDS[sender]
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and field_name not in update_fields:
+        return
+
+    instance._saved_image = (
+        sender._base_manager.filter(pk=instance.pk)
+        .values_list(field_name, flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=GalleryItem)
+@receiver(post_save, sender=Blog)
+def delete_replaced_image_derivatives(sender, instance, **kwargs):
+    saved_image = instance.__dict__.pop("_saved_image", None)
+    if saved_image and saved_image != getattr(instance, IMAGE_FIELDS[sender]).name:
+        run_after_commit(delete_image_derivatives, saved_image)
+
+
+@receiver(post_delete, sender=GalleryItem)
+@receiver(post_delete, sender=Blog)
+def delete_removed_image_derivatives(sender, instance, **kwargs):
+    run_after_commit(
+        delete_image_derivatives, getattr(instance, IMAGE_FIELDS[sender]).name
+    )
+
+
+@receiver(post_save, sender=Blog)
+def render_blog(sender, instance, **kwargs):
+    schedule_blog_render(instance.pk)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def render_comment_blog(sender, instance, **kwargs):
+    schedule_blog_render(instance.blog_id)
+
+
+@receiver(post_save, sender=Category)
+def index_category_projects(sender, instance, **kwargs):
+    for project in instance.projects.select_related("category"):
+        update_search_documents(project)
+
+
+@receiver(post_migrate)
+def create_search_index(sender, **kwargs):
+    if sender.name == "portfolio":
+        get_search_backend().create_index()
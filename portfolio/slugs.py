@@ -0,0 +1,162 @@
+"""
+Slugs of projects and blogs.
+
+A slug is generated once, when a row is saved without one, for every
+translated slug column; editing the title later keeps its URLs stable.
+Collisions are resolved from a single prefix query per column instead of
+probing candidates one by one. A slug changed by hand is kept as a
+``SlugRedirect`` so links to the old one still resolve.
+"""
+
+from django.db.models import Q
+from django.utils.text import slugify
+from modeltranslation.settings import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE
+from modeltranslation.utils import build_localized_fieldname
+
+from .models import Blog, Project, SlugRedirect
+
+SLUG_SEPARATOR = "-"
+
+
+def get_object_type(model) -> str:
+    if model is Project:
+        return SlugRedirect.ObjectType.PROJECT
+    if model is Blog:
+        return SlugRedirect.ObjectType.BLOG
+    raise ValueError(f"{model.__name__} has no slug redirects.")
+
+
+def get_slug_columns() -> dict:
+    return {
+        language: build_localized_fieldname("slug", language)
+        for language in AVAILABLE_LANGUAGES
+    }
+
+
+def get_slug_base(model, value) -> str:
+    max_length = model._meta.get_field("slug").max_length
+    slug = slugify(value or "")[:max_length].strip(SLUG_SEPARATOR)
+    return slug or model._meta.model_name
+
+
+def make_unique_slug(model, base: str, taken: set) -> str:
+    """Number ``base`` as ``base-2``, ``base-3``... until it is not in ``taken``."""
+    max_length = model._meta.get_field("slug").max_length
+    slug = base
+    index = 1
+    while slug in taken:
+        index += 1
+        suffix = f"{SLUG_SEPARATOR}{index}"
+        slug = f"{base[: max_length - len(suffix)]}{suffix}"
+    taken.add(slug)
+    return slug
+
+
+def get_taken_slugs(model, column, base, exclude_pk=None) -> set:
+    """
+    Return the values of ``column`` that ``base`` or one of its numbered
+    forms would collide with, in one query on the column's unique index.
+    """
+    queryset = model._base_manager.filter(
+        Q(**{column: base}) | Q(**{f"{column}__startswith": base + SLUG_SEPARATOR})
+    )
+    if exclude_pk is not None:
+        queryset = queryset.exclude(pk=exclude_pk)
+    return set(queryset.order_by().values_list(column, flat=True))
+
+
+def generate_unique_slugs(model, values, taken: set) -> list:
+    """Slugify ``values`` against a ``taken`` set that is already loaded."""
+    return [
+        make_unique_slug(model, get_slug_base(model, value), taken) for value in values
+    ]
+
+
+def assign_slugs(instance):
+    """
+    Fill the empty translated slugs of ``instance`` from its title in the
+    same language, or the default language's title when it has none.
+    """
+    model = type(instance)
+    default_title = getattr(
+        instance, build_localized_fieldname("title", DEFAULT_LANGUAGE)
+    )
+
+    for language, column in get_slug_columns().items():
+        if getattr(instance, column):
+            continue
+
+        title = getattr(instance, build_localized_fieldname("title", language))
+        base = get_slug_base(model, title or default_title)
+        taken = get_taken_slugs(model, column, base, exclude_pk=instance.pk)
+        setattr(instance, column, make_unique_slug(model, base, taken))
+
+
+def get_saved_slugs(instance) -> dict:
+    """Return the stored slug of ``instance`` in each language."""
+    if instance.pk is None:
+        return {}
+
+    columns = get_slug_columns()
+    saved = (
+        type(instance)
+        ._base_manager.filter(pk=instance.pk)
+        .values(*columns.values())
+        .first()
+    )
+    if saved is None:
+        return {}
+    return {language: saved[column] for language, column in columns.items()}
+
+
+def record_slug_redirects(instance, old_slugs: dict):
+    """
+    Redirect the slugs ``instance`` had before it was saved to the current
+    ones, repointing older redirects so every lookup stays a single hop.
+    """
+    object_type = get_object_type(type(instance))
+
+    for language, column in get_slug_columns().items():
+        old_slug = old_slugs.get(language)
+        new_slug = getattr(instance, column)
+        if not old_slug or old_slug == new_slug:
+            continue
+
+        redirects = SlugRedirect.objects.filter(
+            object_type=object_type, language=language
+        )
+        redirects.filter(object_id=instance.pk).update(new_slug=new_slug)
+        redirects.filter(old_slug=new_slug).delete()
+        SlugRedirect.objects.update_or_create(
+            object_type=object_type,
+            language=language,
+            old_slug=old_slug,
+            defaults={"object_id": instance.pk, "new_slug": new_slug},
+        )
+
+
+def delete_slug_redirects(instance):
+    SlugRedirect.objects.filter(
+        object_type=get_object_type(type(instance)), object_id=instance.pk
+    ).delete()
+
+
+def get_redirect_slug(model, language, slug):
+    """Return the current slug that replaced ``slug``, or ``None``."""
+    return (
+        SlugRedirect.objects.filter(
+            object_type=get_object_type(model), language=language, old_slug=slug
+        )
+        .values_list("new_slug", flat=True)
+        .first()
+    )
+
+
+async def aget_redirect_slug(model, language, slug):
+    return (
+        await SlugRedirect.objects.filter(
+            object_type=get_object_type(model), language=language, old_slug=slug
+        )
+        .values_list("new_slug", flat=True)
+        .afirst()
+    )
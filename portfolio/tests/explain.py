@@ -0,0 +1,42 @@
+import re
+
+from django.db import connection
+
+INDEX_USAGE_PATTERNS = {
+    "sqlite": r"USING (COVERING )?INDEX (?P<index>\w+)|USING INTEGER PRIMARY KEY",
+    "postgresql": r"(Index|Index Only|Bitmap Index) Scan (Backward )?(using|on) "
+    r"(?P<index>\w+)",
+}
+
+FULL_SCAN_PATTERNS = {
+    "sqlite": r"SCAN {table}(?! USING)",
+    "postgresql": r"Seq Scan on {table}",
+}
+
+
+def get_query_plan(queryset) -> str:
+    if connection.vendor == "postgresql":
+        # Test tables are tiny, so let the planner pick an index whenever one
+        # is usable instead of preferring a sequential scan.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+def assert_uses_index(queryset, index_name=None):
+    if connection.vendor not in INDEX_USAGE_PATTERNS:
+        return
+
+    plan = get_query_plan(queryset)
+    used_indexes = [
+        match.group("index")
+        for match in re.finditer(INDEX_USAGE_PATTERNS[connection.vendor], plan)
+    ]
+    table = re.escape(queryset.model._meta.db_table)
+
+    assert used_indexes, plan
+    assert not re.search(
+        FULL_SCAN_PATTERNS[connection.vendor].format(table=table), plan
+    ), plan
+    if index_name is not None:
+        assert index_name in used_indexes, plan
@@ -12,7 +12,7 @@ class CategoryFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Category
 
-    title = factory.LazyAttribute(lambda x: f"Category {faker.word()}")
+    title = factory.Sequence(lambda n: f"Category {faker.word()} {n}")
 
 
 class ProjectFactory(factory.django.DjangoModelFactory):
@@ -0,0 +1,158 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncRequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from ..api import async_views
+from .factories import BlogFactory, HistoryFactory, ProjectFactory
+
+
+def call_async_view(view_class, path, data=None, **kwargs):
+    request = AsyncRequestFactory().get(path, data)
+    response = async_to_sync(view_class.as_view())(request, **kwargs)
+    return response, json.loads(response.content)
+
+
+@pytest.mark.django_db
+class TestAsyncViews:
+
+    def test_get_list_projects_matches_sync_response(self, api_client):
+        ProjectFactory.create_batch(12, gallery_items=2)
+        url = reverse("projects-list")
+
+        response, data = call_async_view(
+            async_views.AsyncProjectListView, url, {"page": 2}
+        )
+
+        cache.clear()
+        assert response.status_code == status.HTTP_200_OK
+        assert data == json.loads(api_client.get(url, {"page": 2}).content)
+
+    def test_get_list_projects_with_matching_etag_returns_304(self, api_client):
+        ProjectFactory.create_batch(2, gallery_items=1)
+        url = reverse("projects-list")
+        etag = api_client.get(url).headers["ETag"]
+
+        response = async_to_sync(async_views.AsyncProjectListView.as_view())(
+            AsyncRequestFactory().get(url, headers={"if-none-match": etag})
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+
+    def test_get_details_blog_sets_etag(self):
+        blog = BlogFactory.create(comments=1)
+
+        response, _ = call_async_view(
+            async_views.AsyncBlogRetrieveView,
+            reverse("blogs-detail", args=[blog.slug]),
+            slug=blog.slug,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "ETag" in response.headers
+
+    def test_get_list_projects_with_invalid_page_returns_404(self):
+        ProjectFactory.create_batch(2, gallery_items=1)
+
+        response, _ = call_async_view(
+            async_views.AsyncProjectListView, reverse("projects-list"), {"page": 5}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_details_project_returns_gallery_items(self):
+        project = ProjectFactory.create(gallery_items=3)
+
+        response, data = call_async_view(
+            async_views.AsyncProjectRetrieveView,
+            reverse("projects-detail", args=[project.slug]),
+            slug=project.slug,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert data["title"] == project.title
+        assert len(data["gallery_items"]) == 3
+
+    def test_get_details_project_if_not_exists_returns_404(self):
+        response, _ = call_async_view(
+            async_views.AsyncProjectRetrieveView,
+            reverse("projects-detail", args=["test-slug"]),
+            slug="test-slug",
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_list_blogs_with_cursor_pagination_returns_200(self):
+        BlogFactory.create_batch(12, comments=0)
+
+        response, data = call_async_view(
+            async_views.AsyncBlogListView,
+            reverse("blogs-list"),
+            {"pagination": "cursor"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(data["results"]) == 10
+        assert data["next"] is not None
+
+    def test_get_details_blog_matches_sync_response(self, api_client):
+        blog = BlogFactory.create(comments=12)
+        url = reverse("blogs-detail", args=[blog.slug])
+
+        response, data = call_async_view(
+            async_views.AsyncBlogRetrieveView, url, slug=blog.slug
+        )
+
+        cache.clear()
+        assert response.status_code == status.HTTP_200_OK
+        assert data == json.loads(api_client.get(url).content)
+
+    def test_get_details_blog_without_comments_skips_comment_queries(self):
+        blog = BlogFactory.create(comments=3)
+
+        with CaptureQueriesContext(connection) as context:
+            response, data = call_async_view(
+                async_views.AsyncBlogRetrieveView,
+                reverse("blogs-detail", args=[blog.slug]),
+                {"fields": "title"},
+                slug=blog.slug,
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert data == {"title": blog.title}
+        assert not [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith('SELECT "portfolio_comment"."id"')
+        ]
+
+    def test_action_without_async_get_data_runs_sync_action(self, api_client):
+        HistoryFactory.create_batch(3)
+        url = reverse("history-list")
+
+        class View(async_views.AsyncViewSetView):
+            viewset_class = async_views.HistoryViewSet
+            action = "list"
+
+        response, data = call_async_view(View, url)
+
+        cache.clear()
+        assert response.status_code == status.HTTP_200_OK
+        assert data == json.loads(api_client.get(url).content)
+
+    def test_get_list_histories_returns_all_histories(self):
+        HistoryFactory.create_batch(5)
+
+        response, data = call_async_view(
+            async_views.AsyncHistoryListView, reverse("history-list")
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(data) == 5
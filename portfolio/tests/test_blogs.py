@@ -24,3 +24,18 @@ class TestBlogs:
         assert response.status_code == status.HTTP_200_OK
         assert response.data.get("title") == blog.title
         assert len(response.data.get("comments")) == 5
+
+    def test_get_list_of_blogs_with_cursor_pagination_returns_200(self, api_client):
+        blogs = BlogFactory.create_batch(12, comments=0)
+
+        response = api_client.get(reverse("blogs-list"), {"pagination": "cursor"})
+        first_page = response.data.get("results")
+        response = api_client.get(response.data.get("next"))
+        second_page = response.data.get("results")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(first_page) == 10
+        assert len(second_page) == 2
+        assert {blog["slug"] for blog in first_page + second_page} == {
+            blog.slug for blog in blogs
+        }
@@ -0,0 +1,62 @@
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from .. import bulk
+from ..models import Comment, GalleryItem, Project, SearchDocument
+
+
+@pytest.mark.django_db
+class TestBulkData:
+
+    def test_seed_creates_object_graph(self):
+        counts = bulk.seed(
+            projects=3, gallery_items=2, blogs=2, comments=3, replies=2, histories=4
+        )
+
+        assert counts == {
+            "projects": 3,
+            "gallery_items": 6,
+            "blogs": 2,
+            "comments": 18,
+            "histories": 4,
+        }
+        assert Comment.objects.filter(parent__isnull=False).count() == 12
+        assert SearchDocument.objects.count() == 10
+
+    def test_seed_shares_one_placeholder_image(self):
+        bulk.seed(projects=2, gallery_items=2, blogs=1)
+
+        images = set(GalleryItem.objects.values_list("image", flat=True))
+        assert images == {bulk.PLACEHOLDER_IMAGE}
+
+    def test_seed_numbers_slugs_after_existing_rows(self):
+        bulk.seed(projects=2)
+        bulk.seed(projects=2)
+
+        slugs = list(Project.objects.values_list("slug_fa", flat=True))
+        assert len(set(slugs)) == 4
+        assert all(slugs)
+
+    def test_seed_numbers_english_slugs_after_existing_rows(self):
+        with mock.patch.object(bulk.faker, "word", return_value="villa"):
+            bulk.seed(projects=1)
+            Project.objects.update(slug_fa="renamed")
+
+            bulk.seed(projects=1)
+
+        slugs_en = list(Project.objects.values_list("slug_en", flat=True))
+        assert len(set(slugs_en)) == 2
+
+    def test_seeded_data_is_served_by_api(self, api_client):
+        bulk.seed(projects=2, blogs=1, comments=2, replies=1)
+        blog_slug = Comment.objects.first().blog.slug
+
+        projects = api_client.get(reverse("projects-list"))
+        blog = api_client.get(reverse("blogs-detail", args=[blog_slug]))
+
+        assert projects.status_code == status.HTTP_200_OK
+        assert blog.status_code == status.HTTP_200_OK
+        assert len(blog.data["comments"]) == 2
@@ -0,0 +1,93 @@
+import pytest
+from django.urls import reverse
+from django.utils import translation
+from rest_framework import status
+
+from .factories import BlogFactory, CommentFactory, HistoryFactory, ProjectFactory
+
+
+@pytest.mark.django_db
+class TestVersionedResponseCache:
+
+    def test_get_list_projects_twice_serves_cached_response(
+        self, api_client, django_assert_num_queries
+    ):
+        ProjectFactory.create_batch(3, gallery_items=1)
+        url = reverse("projects-list")
+        first_response = api_client.get(url)
+
+        with django_assert_num_queries(0):
+            second_response = api_client.get(url)
+
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.data == first_response.data
+
+    def test_get_list_histories_after_save_returns_fresh_response(
+        self, api_client, on_commit
+    ):
+        HistoryFactory.create_batch(2)
+        url = reverse("history-list")
+        api_client.get(url)
+
+        with on_commit():
+            HistoryFactory.create()
+        response = api_client.get(url)
+
+        assert len(response.data) == 3
+
+    def test_get_details_blog_after_comment_save_returns_fresh_response(
+        self, api_client, on_commit
+    ):
+        blog = BlogFactory.create(comments=1)
+        url = reverse("blogs-detail", args=[blog.slug])
+        api_client.get(url)
+
+        with on_commit():
+            CommentFactory.create(blog=blog)
+        response = api_client.get(url)
+
+        assert len(response.data.get("comments")) == 2
+
+    def test_get_list_projects_after_delete_returns_fresh_response(
+        self, api_client, on_commit
+    ):
+        projects = ProjectFactory.create_batch(2, gallery_items=1)
+        url = reverse("projects-list")
+        api_client.get(url)
+
+        with on_commit():
+            projects[0].delete()
+        response = api_client.get(url)
+
+        assert response.data.get("count") == 1
+
+    def test_get_list_projects_is_cached_per_query_string(self, api_client):
+        ProjectFactory.create_batch(11, gallery_items=1)
+        url = reverse("projects-list")
+        api_client.get(url)
+
+        response = api_client.get(url, {"page": 2})
+
+        assert len(response.data.get("results")) == 1
+
+    def test_get_list_projects_is_cached_per_host(self, api_client):
+        ProjectFactory.create_batch(11, gallery_items=1)
+        url = reverse("projects-list")
+        api_client.get(url, HTTP_HOST="internal.local")
+
+        response = api_client.get(url, HTTP_HOST="public.example")
+
+        assert response.data.get("next").startswith("http://public.example/")
+
+    def test_get_list_histories_is_cached_per_language(
+        self, api_client, django_assert_num_queries
+    ):
+        HistoryFactory.create_batch(2)
+        with translation.override("fa"):
+            api_client.get(reverse("history-list"))
+
+        with translation.override("en"):
+            with django_assert_num_queries(2):
+                response = api_client.get(reverse("history-list"))
+
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,81 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from ..models import Comment
+from .factories import BlogFactory, CommentFactory
+
+
+@pytest.mark.django_db
+class TestCommentThreads:
+
+    def test_get_list_comments_returns_first_page_with_cursor(self, api_client):
+        blog = BlogFactory.create(comments=15)
+
+        response = api_client.get(reverse("blog-comments-list", args=[blog.slug]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data.get("results")) == 10
+        assert "cursor=" in response.data.get("next")
+
+        response = api_client.get(response.data.get("next"))
+
+        assert len(response.data.get("results")) == 5
+        assert response.data.get("next") is None
+
+    def test_get_list_comments_returns_top_level_with_replies_count(self, api_client):
+        blog = BlogFactory.create(comments=1)
+        comment = blog.comments.first()
+        CommentFactory.create_batch(3, blog=blog, parent=comment)
+        CommentFactory.create(
+            blog=blog, parent=comment, status=Comment.CommentStatusChoice.REJECTED
+        )
+
+        response = api_client.get(reverse("blog-comments-list", args=[blog.slug]))
+
+        results = response.data.get("results")
+        assert [result["id"] for result in results] == [comment.id]
+        assert results[0]["replies_count"] == 3
+        assert results[0]["replies"] == []
+
+    def test_get_list_comments_if_blog_not_exists_returns_404(self, api_client):
+        response = api_client.get(reverse("blog-comments-list", args=["test-slug"]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_replies_of_comment_returns_200(self, api_client):
+        blog = BlogFactory.create(comments=1)
+        comment = blog.comments.first()
+        replies = CommentFactory.create_batch(2, blog=blog, parent=comment)
+
+        url = reverse("blog-comments-replies", args=[blog.slug, comment.id])
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {result["id"] for result in response.data.get("results")} == {
+            reply.id for reply in replies
+        }
+
+    def test_get_replies_of_other_blog_comment_returns_404(self, api_client):
+        blog = BlogFactory.create(comments=0)
+        other_comment = CommentFactory.create()
+
+        url = reverse("blog-comments-replies", args=[blog.slug, other_comment.id])
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_details_blog_embeds_only_first_page(self, api_client):
+        blog = BlogFactory.create(comments=15)
+
+        response = api_client.get(reverse("blogs-detail", args=[blog.slug]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data.get("comments")) == 10
+        assert reverse("blog-comments-list", args=[blog.slug]) in response.data.get(
+            "comments_next"
+        )
+
+        response = api_client.get(response.data.get("comments_next"))
+
+        assert len(response.data.get("results")) == 5
@@ -0,0 +1,83 @@
+import sys
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from ..api.comment_tree import build_comment_tree, group_comments_by_parent
+from .factories import BlogFactory, CommentFactory
+
+
+def build_synthetic_comments(count, replies_per_comment=3):
+    blog = BlogFactory.build(pk=1)
+    comments = CommentFactory.build_batch(count, blog=blog)
+
+    for index, comment in enumerate(comments, start=1):
+        comment.pk = index
+        parent_index = (index - 2) // replies_per_comment
+        comment.parent_id = comments[parent_index].pk if index > 1 else None
+
+    return comments
+
+
+class TestCommentTree:
+
+    def test_build_comment_tree_nests_replies_in_order(self):
+        comments = build_synthetic_comments(7, replies_per_comment=2)
+
+        tree = build_comment_tree(group_comments_by_parent(comments))
+
+        assert len(tree) == 1
+        assert [reply["id"] for reply in tree[0]["replies"]] == [2, 3]
+        assert [reply["id"] for reply in tree[0]["replies"][0]["replies"]] == [4, 5]
+        assert [reply["id"] for reply in tree[0]["replies"][1]["replies"]] == [6, 7]
+
+    def test_build_comment_tree_stops_at_max_depth(self):
+        comments = build_synthetic_comments(7, replies_per_comment=2)
+
+        tree = build_comment_tree(group_comments_by_parent(comments), max_depth=2)
+
+        assert len(tree[0]["replies"]) == 2
+        assert all(reply["replies"] == [] for reply in tree[0]["replies"])
+
+    def test_build_comment_tree_handles_chains_deeper_than_recursion_limit(self):
+        count = sys.getrecursionlimit() * 2
+        comments = build_synthetic_comments(count, replies_per_comment=1)
+
+        tree = build_comment_tree(group_comments_by_parent(comments))
+
+        depth = 0
+        while tree:
+            [node] = tree
+            depth += 1
+            assert node["id"] == depth
+            tree = node["replies"]
+        assert depth == count
+
+
+@pytest.mark.django_db
+class TestBlogCommentTree:
+
+    def test_get_details_blog_with_depth_limits_replies(self, api_client):
+        blog = BlogFactory.create(comments=1)
+        comment = blog.comments.first()
+        reply = CommentFactory.create(blog=blog, parent=comment)
+        CommentFactory.create(blog=blog, parent=reply)
+
+        response = api_client.get(
+            reverse("blogs-detail", args=[blog.slug]), {"depth": 2}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        top_level_comment = response.data.get("comments")[0]
+        assert top_level_comment["replies"][0]["id"] == reply.id
+        assert top_level_comment["replies"][0]["replies"] == []
+
+    def test_get_details_blog_with_invalid_depth_returns_400(self, api_client):
+        blog = BlogFactory.create(comments=1)
+
+        response = api_client.get(
+            reverse("blogs-detail", args=[blog.slug]), {"depth": "zero"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
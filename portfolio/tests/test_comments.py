@@ -112,3 +112,41 @@ class TestCommentCreation:
         url = reverse(self.url_name, args=[blog1.slug])
         response = api_client.post(url, valid_data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_create_reply_if_parent_not_exists_returns_400(self, api_client):
+        blog = BlogFactory.create(comments=0)
+
+        valid_data = {
+            "name": "test name",
+            "email": "test@email.com",
+            "text": "test text",
+            "parent": 10**6,
+        }
+
+        url = reverse(self.url_name, args=[blog.slug])
+        response = api_client.post(url, valid_data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "parent" in response.data
+
+    def test_create_reply_runs_one_lookup_one_insert_and_one_delete(
+        self, api_client, django_assert_num_queries
+    ):
+        blog = BlogFactory.create(comments=1)
+        comment = blog.comments.first()
+
+        valid_data = {
+            "name": "test name",
+            "email": "test@email.com",
+            "text": "test text",
+            "parent": comment.id,
+        }
+
+        url = reverse(self.url_name, args=[blog.slug])
+        # The delete drops the blog's stale rendered documents.
+        with django_assert_num_queries(3):
+            response = api_client.post(url, valid_data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data.get("parent") == comment.id
+        assert response.data.get("id") == comment.replies.get().id
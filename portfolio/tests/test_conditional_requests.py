@@ -0,0 +1,95 @@
+import pytest
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import status
+
+from ..models import Comment
+from .factories import (
+    BlogFactory,
+    CommentFactory,
+    GalleryItemFactory,
+    HistoryFactory,
+    ProjectFactory,
+)
+
+
+@pytest.mark.django_db
+class TestConditionalRequests:
+
+    def test_get_list_projects_with_matching_etag_returns_304(self, api_client):
+        ProjectFactory.create_batch(2, gallery_items=1)
+        url = reverse("projects-list")
+        etag = api_client.get(url).headers["ETag"]
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_get_details_project_after_gallery_item_added_returns_200(
+        self, api_client, on_commit
+    ):
+        project = ProjectFactory.create(gallery_items=1)
+        url = reverse("projects-detail", args=[project.slug])
+        etag = api_client.get(url).headers["ETag"]
+
+        with on_commit():
+            GalleryItemFactory.create(project=project)
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data.get("gallery_items")) == 2
+
+    def test_get_details_blog_after_comment_unapproved_returns_200(
+        self, api_client, on_commit
+    ):
+        blog = BlogFactory.create(comments=2)
+        url = reverse("blogs-detail", args=[blog.slug])
+        api_client.get(url)
+
+        with on_commit():
+            comment = blog.comments.first()
+            comment.status = Comment.CommentStatusChoice.REJECTED
+            comment.save()
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=http_date())
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data.get("comments")) == 1
+
+    def test_get_details_blog_after_new_comment_returns_200(
+        self, api_client, on_commit
+    ):
+        blog = BlogFactory.create(comments=1)
+        url = reverse("blogs-detail", args=[blog.slug])
+        etag = api_client.get(url).headers["ETag"]
+
+        with on_commit():
+            CommentFactory.create(blog=blog)
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data.get("comments")) == 2
+
+    def test_get_list_histories_with_stale_etag_returns_200(self, api_client):
+        HistoryFactory.create_batch(2)
+
+        response = api_client.get(reverse("history-list"), HTTP_IF_NONE_MATCH='"stale"')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != '"stale"'
+        assert "Last-Modified" not in response.headers
+
+    def test_get_list_blogs_ignores_if_modified_since(self, api_client):
+        BlogFactory.create_batch(2, comments=0)
+
+        response = api_client.get(
+            reverse("blogs-list"), HTTP_IF_MODIFIED_SINCE=http_date()
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "Last-Modified" not in response.headers
+
+    def test_get_details_blog_if_not_exists_returns_404(self, api_client):
+        response = api_client.get(reverse("blogs-detail", args=["test-slug"]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "ETag" not in response.headers
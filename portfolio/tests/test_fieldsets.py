@@ -0,0 +1,77 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from ..api.fieldsets import FIELD_SUBSETS_CACHE_SIZE, get_field_subset
+from ..api.serializers import ProjectListSerializer, ProjectSerializer
+from .factories import BlogFactory, ProjectFactory
+
+
+def get_row_queries(context, table):
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith(f'SELECT "{table}"."id"')
+    ]
+
+
+class TestSerializerClasses:
+
+    def test_list_serializer_declares_only_list_fields(self):
+        assert list(ProjectListSerializer().fields) == [
+            "title",
+            "slug",
+            "category",
+            "creation_year",
+            "banner_image",
+            "banner_image_srcset",
+        ]
+
+    def test_field_subsets_are_built_once(self):
+        fields = ("title", "slug")
+
+        assert get_field_subset(ProjectSerializer, fields) is get_field_subset(
+            ProjectSerializer, fields
+        )
+
+    def test_field_subsets_cache_is_bounded(self):
+        assert get_field_subset.cache_info().maxsize == FIELD_SUBSETS_CACHE_SIZE
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+
+    def test_requested_fields_are_returned_and_fetched(self, api_client):
+        ProjectFactory.create_batch(2, gallery_items=1)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(
+                reverse("projects-list"), {"fields": "slug,title"}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [set(result) for result in response.data["results"]] == [
+            {"title", "slug"}
+        ] * 2
+        [sql] = get_row_queries(context, "portfolio_project")
+        assert '"creation_year"' not in sql
+
+    def test_unknown_field_returns_400(self, api_client):
+        response = api_client.get(reverse("projects-list"), {"fields": "title,body"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "fields" in response.data
+
+    def test_blog_detail_without_comments_skips_comment_queries(self, api_client):
+        blog = BlogFactory.create(comments=3)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(
+                reverse("blogs-detail", args=[blog.slug]), {"fields": "title"}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"title": blog.title}
+        assert not get_row_queries(context, "portfolio_comment")
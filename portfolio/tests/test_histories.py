@@ -14,3 +14,12 @@ class TestHistories:
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 5
+
+    def test_get_list_histories_with_cursor_pagination_returns_200(self, api_client):
+        HistoryFactory.create_batch(12)
+
+        response = api_client.get(reverse("history-list"), {"pagination": "cursor"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data.get("results")) == 10
+        assert response.data.get("next") is not None
@@ -0,0 +1,113 @@
+import pytest
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+
+from ..images import generate_image_derivatives, get_derivative_widths
+from ..models import ImageDerivative
+from .factories import BlogFactory, GalleryItemFactory, ProjectFactory
+
+
+@pytest.fixture
+def run_tasks_on_commit(settings, django_capture_on_commit_callbacks):
+    settings.PORTFOLIO_BACKGROUND_TASKS = False
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+@pytest.mark.django_db
+class TestImageDerivatives:
+
+    def test_generate_derivatives_stores_resized_jpeg_and_webp(self):
+        gallery_item = GalleryItemFactory.create(image__width=1200, image__height=600)
+
+        generate_image_derivatives(gallery_item.image)
+
+        derivatives = ImageDerivative.objects.filter(source=gallery_item.image.name)
+        assert {(d.format, d.width, d.height) for d in derivatives} == {
+            (format, width, width // 2)
+            for format in ImageDerivative.Format.values
+            for width in (320, 640, 1024)
+        }
+        with Image.open(derivatives.get(format="webp", width=640).image) as image:
+            assert image.format == "WEBP"
+            assert image.size == (640, 320)
+
+    def test_generate_derivatives_does_not_upscale_small_images(self):
+        assert get_derivative_widths(100) == [100]
+        assert get_derivative_widths(700) == [320, 640]
+
+    def test_generate_derivatives_is_idempotent(self):
+        blog = BlogFactory.create(comments=0)
+
+        generate_image_derivatives(blog.cover)
+        generate_image_derivatives(blog.cover)
+
+        assert ImageDerivative.objects.filter(source=blog.cover.name).count() == 2
+
+    def test_uploaded_images_get_derivatives_after_commit(self, run_tasks_on_commit):
+        with run_tasks_on_commit():
+            project = ProjectFactory.create(gallery_items=1)
+            blog = BlogFactory.create(comments=0)
+
+        sources = set(ImageDerivative.objects.values_list("source", flat=True))
+        assert sources == {project.gallery_items.get().image.name, blog.cover.name}
+
+    def test_deleted_gallery_item_derivatives_are_removed(self, run_tasks_on_commit):
+        with run_tasks_on_commit():
+            gallery_item = GalleryItemFactory.create()
+        derivative = ImageDerivative.objects.get(
+            source=gallery_item.image.name, format="jpeg"
+        )
+
+        with run_tasks_on_commit():
+            gallery_item.delete()
+
+        assert not ImageDerivative.objects.filter(source=derivative.source).exists()
+        assert not default_storage.exists(derivative.image.name)
+
+    def test_replaced_blog_cover_derivatives_are_removed(self, run_tasks_on_commit):
+        with run_tasks_on_commit():
+            blog = BlogFactory.create(comments=0)
+        old_cover = blog.cover.name
+
+        with run_tasks_on_commit():
+            blog.cover = GalleryItemFactory.build().image
+            blog.save()
+
+        assert not ImageDerivative.objects.filter(source=old_cover).exists()
+        assert ImageDerivative.objects.filter(source=blog.cover.name).exists()
+
+    def test_shared_image_derivatives_are_kept(self, run_tasks_on_commit):
+        with run_tasks_on_commit():
+            gallery_item = GalleryItemFactory.create()
+            GalleryItemFactory.create(image=gallery_item.image.name)
+
+        with run_tasks_on_commit():
+            gallery_item.delete()
+
+        assert ImageDerivative.objects.filter(source=gallery_item.image.name).exists()
+
+    def test_get_list_projects_returns_banner_srcset(
+        self, api_client, run_tasks_on_commit
+    ):
+        with run_tasks_on_commit():
+            ProjectFactory.create(gallery_items=2)
+
+        response = api_client.get(reverse("projects-list"))
+
+        srcset = response.data.get("results")[0].get("banner_image_srcset")
+        assert response.status_code == status.HTTP_200_OK
+        assert set(srcset) == {"jpeg", "webp"}
+        assert srcset["webp"].endswith(" 100w")
+
+    def test_get_details_blog_returns_cover_srcset(
+        self, api_client, run_tasks_on_commit
+    ):
+        with run_tasks_on_commit():
+            blog = BlogFactory.create(comments=0)
+
+        response = api_client.get(reverse("blogs-detail", args=[blog.slug]))
+
+        assert response.data.get("cover_srcset") is not None
+        assert ".jpeg 100w" in response.data["cover_srcset"]["jpeg"]
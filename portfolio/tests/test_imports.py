@@ -0,0 +1,145 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from PIL import Image
+
+from ..models import Category, GalleryItem, Project, SearchDocument
+from ..search import get_search_rank
+from .factories import CategoryFactory, ProjectFactory
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    directory = tmp_path / "images"
+    directory.mkdir()
+    for name in ["front.jpg", "back.png"]:
+        Image.new("RGB", (40, 30), "red").save(directory / name)
+    return directory
+
+
+def write_manifest(tmp_path, rows):
+    manifest = tmp_path / "projects.jsonl"
+    manifest.write_text(
+        "\n".join(json.dumps(row, ensure_ascii=False) for row in rows),
+        encoding="utf-8",
+    )
+    return str(manifest)
+
+
+def project_row(title="Imported project", **kwargs):
+    return {
+        "title": title,
+        "description": "توضیحات",
+        "category": "Imported category",
+        "size": "1.5",
+        "dimensions": "2*3",
+        "creation_year": "2024",
+        "scale": "1:5",
+        "images": ["front.jpg", "back.png"],
+        **kwargs,
+    }
+
+
+@pytest.mark.django_db
+class TestImportProjects:
+
+    def test_import_creates_projects_categories_and_gallery_items(
+        self, tmp_path, image_dir
+    ):
+        CategoryFactory.create(title="Imported category")
+        manifest = write_manifest(
+            tmp_path,
+            [project_row("First"), project_row("Second", category="New", images=[])],
+        )
+        out = StringIO()
+
+        call_command("import_projects", manifest, str(image_dir), workers=0, stdout=out)
+
+        assert Project.objects.count() == 2
+        assert Category.objects.count() == 2
+        assert GalleryItem.objects.filter(project__slug="first").count() == 2
+        assert "Imported 2 projects, 2 images and 1 new categories" in out.getvalue()
+        assert "projects/s" in out.getvalue()
+
+    def test_import_numbers_duplicate_slugs_without_per_row_queries(
+        self, tmp_path, image_dir
+    ):
+        ProjectFactory.create(title="Same title", gallery_items=0)
+        manifest = write_manifest(
+            tmp_path,
+            [project_row("Same title", title_en="Same title", images=[])] * 3,
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            call_command(
+                "import_projects", manifest, str(image_dir), workers=0, batch_size=2
+            )
+
+        slug_lookups = [
+            query["sql"]
+            for query in context.captured_queries
+            if '"portfolio_project"."slug" =' in query["sql"]
+        ]
+        assert not slug_lookups
+        assert sorted(Project.objects.values_list("slug", flat=True)) == [
+            "same-title",
+            "same-title-2",
+            "same-title-3",
+            "same-title-4",
+        ]
+        slugs_en = list(Project.objects.values_list("slug_en", flat=True))
+        assert len(set(slugs_en)) == len(slugs_en)
+
+    def test_import_indexes_search_documents_in_one_insert_per_batch(
+        self, tmp_path, image_dir
+    ):
+        manifest = write_manifest(
+            tmp_path,
+            [project_row(f"Searchable {index}", images=[]) for index in range(3)],
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            call_command("import_projects", manifest, str(image_dir), workers=0)
+
+        inserts = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith('INSERT INTO "portfolio_searchdocument"')
+        ]
+        assert len(inserts) == 1
+        assert SearchDocument.objects.count() == 6
+        rank = get_search_rank(Project, "searchable", "fa")
+        assert (
+            Project.objects.annotate(rank=rank).filter(rank__isnull=False).count() == 3
+        )
+
+    def test_import_stores_images_in_process_pool(self, tmp_path, image_dir):
+        manifest = write_manifest(tmp_path, [project_row("Pooled")])
+
+        call_command("import_projects", manifest, str(image_dir), workers=2)
+
+        gallery_items = GalleryItem.objects.filter(project__slug="pooled")
+        assert gallery_items.count() == 2
+        assert all(item.image.storage.exists(item.image.name) for item in gallery_items)
+
+    def test_import_with_invalid_manifest_raises_command_error(
+        self, tmp_path, image_dir
+    ):
+        manifest = write_manifest(tmp_path, [{"title": "Missing fields"}])
+
+        with pytest.raises(CommandError, match="missing fields"):
+            call_command("import_projects", manifest, str(image_dir), workers=0)
+
+        assert not Project.objects.exists()
+
+    def test_import_with_missing_image_raises_command_error(self, tmp_path, image_dir):
+        manifest = write_manifest(tmp_path, [project_row(images=["missing.jpg"])])
+
+        with pytest.raises(CommandError):
+            call_command("import_projects", manifest, str(image_dir), workers=0)
+
+        assert not Project.objects.exists()
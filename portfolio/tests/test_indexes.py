@@ -0,0 +1,74 @@
+import pytest
+from django.utils import translation
+
+from ..api.views import BlogViewSet, ProjectViewSet, get_approved_comments
+from ..models import Blog, Comment, GalleryItem, History, Project
+from .explain import assert_uses_index
+
+
+@pytest.mark.django_db
+class TestIndexes:
+
+    def test_list_projects_uses_ordering_index(self):
+        queryset = ProjectViewSet(action="list").get_queryset()[:10]
+
+        assert_uses_index(queryset, "project_created_title_fa_idx")
+
+    def test_list_projects_by_status_uses_status_index(self):
+        queryset = Project.objects.filter(status=Project.ProjectStatus.ONGOING)
+
+        assert_uses_index(queryset, "project_status_idx")
+
+    def test_retrieve_project_uses_slug_index(self):
+        queryset = ProjectViewSet(action="retrieve").get_queryset().filter(slug="x")
+
+        assert_uses_index(queryset)
+
+    def test_project_gallery_items_use_index(self):
+        queryset = GalleryItem.objects.filter(project_id__in=[1, 2])
+
+        assert_uses_index(queryset)
+
+    def test_list_blogs_uses_published_partial_index(self):
+        queryset = BlogViewSet(action="list").get_queryset()[:10]
+
+        assert_uses_index(queryset, "published_blog_fa_idx")
+
+    def test_list_blogs_for_english_uses_english_partial_index(self):
+        with translation.override("en"):
+            queryset = Blog.objects.filter(status=Blog.BlogStatus.PUBLISHED)[:10]
+
+            assert_uses_index(queryset, "published_blog_en_idx")
+
+    def test_retrieve_blog_uses_slug_index(self):
+        queryset = BlogViewSet(action="retrieve").get_queryset().filter(slug="x")
+
+        assert_uses_index(queryset)
+
+    def test_top_level_comments_use_partial_index(self):
+        queryset = (
+            get_approved_comments()
+            .filter(blog_id=1, parent__isnull=True)
+            .order_by("-created_at", "-id")[:10]
+        )
+
+        assert_uses_index(queryset, "approved_top_comment_idx")
+
+    def test_approved_comments_of_blog_use_blog_status_index(self):
+        queryset = Comment.objects.filter(
+            blog_id=1, status=Comment.CommentStatusChoice.APPROVED
+        )
+
+        assert_uses_index(queryset, "comment_blog_status_idx")
+
+    def test_approved_replies_use_index(self):
+        queryset = Comment.objects.filter(
+            parent_id__in=[1, 2], status=Comment.CommentStatusChoice.APPROVED
+        )
+
+        assert_uses_index(queryset)
+
+    def test_list_histories_uses_ordering_index(self):
+        queryset = History.objects.all()[:10]
+
+        assert_uses_index(queryset, "history_created_at_idx")
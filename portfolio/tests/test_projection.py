@@ -0,0 +1,77 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import translation
+from rest_framework import status
+
+from ..api.projection import get_projected_fields, project_queryset
+from ..api.serializers import CommentSerializer
+from ..models import Blog, Comment, Project
+from .factories import BlogFactory, ProjectFactory
+
+
+def get_row_queries(context, table):
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith(f'SELECT "{table}"."id"')
+    ]
+
+
+@pytest.mark.django_db
+class TestLanguageProjection:
+
+    def test_blog_list_skips_body_and_other_languages(self, api_client):
+        BlogFactory.create_batch(3, comments=0)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(reverse("blogs-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        [sql] = get_row_queries(context, "portfolio_blog")
+        assert '"summary_fa"' in sql
+        assert '"body_fa"' not in sql
+        assert '"body_en"' not in sql
+        assert '"title_en"' not in sql
+
+    def test_blog_detail_loads_active_language_and_fallback(self, api_client):
+        blog = BlogFactory.create(comments=0)
+
+        with translation.override("en"), CaptureQueriesContext(connection) as context:
+            response = api_client.get(
+                reverse("blogs-detail", args=[blog.slug_en]), {"depth": 1}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["body"] == blog.body_fa
+        [sql] = get_row_queries(context, "portfolio_blog")
+        assert '"body_en"' in sql
+        assert '"body_fa"' in sql
+        assert '"description_en"' not in sql
+
+    def test_project_list_loads_no_deferred_columns(self, api_client):
+        ProjectFactory.create_batch(3, gallery_items=1)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(reverse("projects-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"][0]["category"]
+        [sql] = get_row_queries(context, "portfolio_project")
+        assert '"description_fa"' not in sql
+        assert '"portfolio_category"."title_fa"' in sql
+
+    def test_related_translated_field_is_localized(self):
+        with translation.override("en"):
+            fields = get_projected_fields(Project, "category__title")
+
+        assert fields == ["category", "category__title_en", "category__title_fa"]
+
+    def test_unmapped_method_field_leaves_queryset_untouched(self):
+        queryset = Comment.objects.all()
+
+        assert project_queryset(queryset, CommentSerializer()) is queryset
+
+    def test_unknown_path_is_not_projected(self):
+        assert get_projected_fields(Blog, "comments__text") is None
@@ -23,3 +23,39 @@ class TestProjects:
         assert response.status_code == status.HTTP_200_OK
         assert response.data.get("title") == project.title
         assert len(response.data.get("gallery_items")) == 3
+
+    @pytest.mark.parametrize("projects_count", [1, 10])
+    def test_get_list_projects_query_count_is_constant(
+        self, api_client, django_assert_num_queries, projects_count
+    ):
+        ProjectFactory.create_batch(projects_count, gallery_items=3)
+
+        # Two aggregate queries for the validators, count, page and srcsets.
+        with django_assert_num_queries(5):
+            response = api_client.get(reverse("projects-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data.get("results")) == projects_count
+
+    def test_get_list_projects_returns_first_gallery_item_as_banner(self, api_client):
+        project = ProjectFactory.create(gallery_items=3)
+        first_gallery_item = project.gallery_items.order_by("created_at", "pk").first()
+
+        response = api_client.get(reverse("projects-list"))
+
+        banner_image = response.data.get("results")[0].get("banner_image")
+        assert banner_image == first_gallery_item.image.url
+
+    def test_get_list_projects_with_cursor_pagination_returns_200(self, api_client):
+        ProjectFactory.create_batch(12, gallery_items=1)
+
+        response = api_client.get(reverse("projects-list"), {"pagination": "cursor"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert len(response.data.get("results")) == 10
+
+        response = api_client.get(response.data.get("next"))
+
+        assert len(response.data.get("results")) == 2
+        assert response.data.get("next") is None
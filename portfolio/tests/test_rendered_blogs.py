@@ -0,0 +1,111 @@
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from ..api import rendered_blogs
+from ..api.rendered_blogs import render_blog_documents
+from ..models import Blog, Comment, RenderedBlog
+from .factories import BlogFactory, CommentFactory
+
+
+@pytest.fixture
+def render_on_commit(settings, django_capture_on_commit_callbacks):
+    settings.PORTFOLIO_BACKGROUND_TASKS = False
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+@pytest.mark.django_db
+class TestRenderedBlogs:
+
+    def test_get_details_blog_serves_rendered_document(
+        self, api_client, render_on_commit
+    ):
+        with render_on_commit():
+            blog = BlogFactory.create(comments=12)
+        url = reverse("blogs-detail", args=[blog.slug])
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url)
+
+        queries = [query["sql"] for query in context.captured_queries]
+        assert response.status_code == status.HTTP_200_OK
+        assert [RenderedBlog._meta.db_table in sql for sql in queries].count(True) == 1
+        assert not [sql for sql in queries if '"portfolio_comment"."text"' in sql]
+        assert not [sql for sql in queries if '"portfolio_blog"."body_fa"' in sql]
+        assert response.data == api_client.get(url, {"depth": 1}).data
+
+    def test_get_details_blog_without_rendered_document_falls_back(self, api_client):
+        blog = BlogFactory.create(comments=3)
+
+        response = api_client.get(reverse("blogs-detail", args=[blog.slug]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not RenderedBlog.objects.exists()
+        assert len(response.data.get("comments")) == 3
+
+    def test_approved_comment_rebuilds_rendered_document(
+        self, api_client, render_on_commit
+    ):
+        with render_on_commit():
+            blog = BlogFactory.create(comments=1)
+        comment = CommentFactory.create(
+            blog=blog, status=Comment.CommentStatusChoice.REJECTED
+        )
+
+        with render_on_commit():
+            comment.status = Comment.CommentStatusChoice.APPROVED
+            comment.save()
+        response = api_client.get(reverse("blogs-detail", args=[blog.slug]))
+
+        assert len(response.data.get("comments")) == 2
+
+    def test_changed_slug_replaces_rendered_document(self, render_on_commit):
+        with render_on_commit():
+            blog = BlogFactory.create(title="First title", comments=0)
+        old_keys = set(blog.rendered_documents.values_list("key", flat=True))
+
+        with render_on_commit():
+            blog.slug_fa = "second-title"
+            blog.slug_en = "second-title"
+            blog.save()
+        blog.refresh_from_db()
+
+        keys = set(blog.rendered_documents.values_list("key", flat=True))
+        assert keys
+        assert not keys & old_keys
+        assert RenderedBlog.objects.filter(
+            pk=RenderedBlog.get_key("fa", blog.slug_fa)
+        ).exists()
+
+    def test_rebuilt_document_invalidates_cached_responses(
+        self, api_client, render_on_commit
+    ):
+        with render_on_commit():
+            blog = BlogFactory.create(comments=0)
+        url = reverse("blogs-detail", args=[blog.slug])
+        api_client.get(url)
+        Blog.objects.filter(pk=blog.pk).update(body_fa="<p>New body</p>")
+
+        with render_on_commit():
+            render_blog_documents(blog.pk)
+
+        assert api_client.get(url).data["body"] == "<p>New body</p>"
+
+    def test_changed_blog_is_not_served_stale_until_rebuilt(
+        self, api_client, render_on_commit
+    ):
+        with render_on_commit():
+            blog = BlogFactory.create(comments=0)
+        url = reverse("blogs-detail", args=[blog.slug])
+
+        with mock.patch.object(rendered_blogs, "render_blog_documents"):
+            with render_on_commit():
+                blog.body = "<p>New body</p>"
+                blog.save()
+
+        assert not RenderedBlog.objects.filter(blog=blog).exists()
+        assert api_client.get(url).data["body"] == "<p>New body</p>"
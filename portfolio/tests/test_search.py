@@ -0,0 +1,124 @@
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import translation
+from rest_framework import status
+
+from ..models import SearchDocument
+from ..search import normalize_text
+from .factories import BlogFactory, CategoryFactory, ProjectFactory
+
+
+class TestNormalizeText:
+
+    def test_normalize_text_folds_arabic_characters(self):
+        assert normalize_text("كتاب علي") == normalize_text("کتاب علی")
+
+    def test_normalize_text_folds_digits_and_zero_width_non_joiner(self):
+        assert normalize_text("می‌خواهم ۱۴۰۲") == "می خواهم 1402"
+
+    def test_normalize_text_removes_diacritics(self):
+        assert normalize_text("کِتاب") == "کتاب"
+
+
+@pytest.mark.django_db
+class TestSearch:
+
+    def test_search_projects_returns_ranked_matches(self, api_client):
+        title_match = ProjectFactory.create(title="Villa design", gallery_items=0)
+        description_match = ProjectFactory.create(
+            title="Office", description="A villa renovation", gallery_items=0
+        )
+        ProjectFactory.create(title="Museum", description="Hall", gallery_items=0)
+
+        response = api_client.get(reverse("projects-list"), {"search": "villa"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [project["slug"] for project in response.data.get("results")] == [
+            title_match.slug,
+            description_match.slug,
+        ]
+
+    def test_search_projects_ranks_in_the_listing_query(self, api_client):
+        ProjectFactory.create_batch(3, title="Villa", gallery_items=0)
+
+        with CaptureQueriesContext(connection) as queries:
+            api_client.get(reverse("projects-list"), {"search": "villa"})
+
+        search_queries = [
+            query["sql"] for query in queries if "searchdocument" in query["sql"]
+        ]
+        assert search_queries
+        assert all('"portfolio_project"' in sql for sql in search_queries)
+        assert not any("CASE WHEN" in sql for sql in search_queries)
+
+    def test_search_projects_matches_category_title(self, api_client):
+        category = CategoryFactory.create(title="Sculpture")
+        project = ProjectFactory.create(category=category, gallery_items=0)
+        ProjectFactory.create(gallery_items=0)
+
+        response = api_client.get(reverse("projects-list"), {"search": "sculp"})
+
+        assert [result["slug"] for result in response.data.get("results")] == [
+            project.slug
+        ]
+
+    def test_search_projects_after_category_rename_returns_project(self, api_client):
+        category = CategoryFactory.create(title="Sculpture")
+        project = ProjectFactory.create(category=category, gallery_items=0)
+
+        category.title = "Installation"
+        category.save()
+        response = api_client.get(reverse("projects-list"), {"search": "installation"})
+
+        assert response.data.get("count") == 1
+        assert response.data.get("results")[0]["slug"] == project.slug
+
+    def test_search_blogs_normalizes_persian_query(self, api_client):
+        blog = BlogFactory.create(title="Library", body="<p>طراحی کتابخانه</p>")
+        BlogFactory.create(title="Sculpture", body="<p>سنگ</p>")
+
+        response = api_client.get(reverse("blogs-list"), {"search": "كتابخانه"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["slug"] for result in response.data.get("results")] == [
+            blog.slug
+        ]
+
+    def test_search_blogs_uses_active_language_columns(self, api_client):
+        with translation.override("en"):
+            blog = BlogFactory.create(title="Gallery", body="<p>Bronze</p>")
+            response = api_client.get(reverse("blogs-list"), {"search": "bronze"})
+
+        assert response.data.get("count") == 1
+        assert response.data.get("results")[0]["slug"] == blog.slug_en
+
+    def test_search_with_no_matches_returns_empty_list(self, api_client):
+        ProjectFactory.create(title="Villa", gallery_items=0)
+
+        response = api_client.get(reverse("projects-list"), {"search": "museum"})
+
+        assert response.data.get("count") == 0
+
+    def test_delete_project_removes_search_documents(self):
+        project = ProjectFactory.create(gallery_items=0)
+        project_id = project.id
+
+        project.delete()
+
+        assert not SearchDocument.objects.filter(object_id=project_id).exists()
+
+    def test_rebuild_search_index_command_indexes_all_rows(self):
+        ProjectFactory.create_batch(2, gallery_items=0)
+        SearchDocument.objects.all().delete()
+
+        call_command("rebuild_search_index", stdout=StringIO())
+
+        assert SearchDocument.objects.filter(
+            document_type=SearchDocument.DocumentType.PROJECT
+        ).count() == 2 * len(settings.LANGUAGES)
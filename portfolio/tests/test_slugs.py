@@ -0,0 +1,118 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncRequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from ..api import async_views
+from ..models import SlugRedirect
+from .factories import BlogFactory, ProjectFactory
+
+
+@pytest.mark.django_db
+class TestSlugs:
+
+    def test_create_project_generates_slug_for_each_language(self):
+        project = ProjectFactory.create(
+            title="Bronze horse", title_en="Bronze horse", gallery_items=0
+        )
+
+        assert project.slug_fa == "bronze-horse"
+        assert project.slug_en == "bronze-horse"
+
+    def test_create_project_without_english_title_uses_default_title(self):
+        project = ProjectFactory.create(title="Bronze horse", gallery_items=0)
+
+        assert project.slug_en == "bronze-horse"
+
+    def test_create_project_numbers_duplicate_slug_with_one_query(self):
+        ProjectFactory.create_batch(3, title="Same title", gallery_items=0)
+
+        with CaptureQueriesContext(connection) as context:
+            project = ProjectFactory.create(title="Same title", gallery_items=0)
+
+        slug_lookups = [
+            query["sql"]
+            for query in context.captured_queries
+            if '"portfolio_project"."slug_fa" =' in query["sql"]
+        ]
+        assert project.slug_fa == "same-title-4"
+        assert len(slug_lookups) == 1
+
+    def test_change_title_keeps_slug(self):
+        blog = BlogFactory.create(title="First title", comments=0)
+
+        blog.title = "Second title"
+        blog.save()
+        blog.refresh_from_db()
+
+        assert blog.slug_fa == "first-title"
+        assert not SlugRedirect.objects.exists()
+
+    def test_change_slug_records_redirect(self):
+        blog = BlogFactory.create(title="First title", comments=0)
+
+        blog.slug_fa = "second-title"
+        blog.save()
+        blog.slug_fa = "third-title"
+        blog.save()
+
+        assert dict(
+            SlugRedirect.objects.filter(language="fa").values_list(
+                "old_slug", "new_slug"
+            )
+        ) == {"first-title": "third-title", "second-title": "third-title"}
+
+    def test_clear_slug_regenerates_it_from_title(self):
+        project = ProjectFactory.create(title="First title", gallery_items=0)
+
+        project.title = "Second title"
+        project.slug_fa = None
+        project.save()
+
+        assert project.slug_fa == "second-title"
+
+    def test_delete_blog_removes_redirects(self):
+        blog = BlogFactory.create(title="First title", comments=0)
+        blog.slug_fa = "second-title"
+        blog.save()
+
+        blog.delete()
+
+        assert not SlugRedirect.objects.exists()
+
+    def test_get_details_project_with_old_slug_redirects(self, api_client):
+        project = ProjectFactory.create(title="First title", gallery_items=0)
+        project.slug_fa = "second-title"
+        project.save()
+
+        response = api_client.get(
+            reverse("projects-detail", args=["first-title"]), {"a": "1"}
+        )
+
+        assert response.status_code == status.HTTP_301_MOVED_PERMANENTLY
+        assert response["Location"] == (
+            reverse("projects-detail", args=["second-title"]) + "?a=1"
+        )
+
+    def test_get_details_blog_with_unknown_slug_returns_404(self, api_client):
+        response = api_client.get(reverse("blogs-detail", args=["test-slug"]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_async_get_details_blog_with_old_slug_redirects(self):
+        blog = BlogFactory.create(title="First title", comments=0)
+        blog.slug_fa = "second-title"
+        blog.save()
+
+        request = AsyncRequestFactory().get(
+            reverse("blogs-detail", args=["first-title"])
+        )
+        response = async_to_sync(async_views.AsyncBlogRetrieveView.as_view())(
+            request, slug="first-title"
+        )
+
+        assert response.status_code == status.HTTP_301_MOVED_PERMANENTLY
+        assert response["Location"] == reverse("blogs-detail", args=["second-title"])
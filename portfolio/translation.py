@@ -11,11 +11,13 @@ class CategoryTranslationOptions(TranslationOptions):
 @register(Project)
 class ProjectTranslationOptions(TranslationOptions):
     fields = ["title", "description", "slug"]
+    empty_values = {"slug": None}
 
 
 @register(Blog)
 class BlogTranslationOptions(TranslationOptions):
     fields = ["title", "description", "summary", "body", "slug"]
+    empty_values = {"slug": None}
 
 
 @register(History)
@@ -1,6 +1,10 @@
+import re
+
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
-from ..models import ApplyApplication, Contact, Order
+from ..models import ApplyApplication, Contact, Order, ResumeUpload
+from ..validators import validate_resume_filename, validate_resume_size
 
 
 class ContactSerializer(serializers.ModelSerializer):
@@ -22,6 +26,12 @@ class OrderSerializer(serializers.ModelSerializer):
 
 
 class ApplyApplicationSerializer(serializers.ModelSerializer):
+    resume_upload = serializers.PrimaryKeyRelatedField(
+        queryset=ResumeUpload.objects.exclude(file=""),
+        write_only=True,
+        required=False,
+    )
+
     class Meta:
         model = ApplyApplication
         fields = [
@@ -32,5 +42,48 @@ class ApplyApplicationSerializer(serializers.ModelSerializer):
             "education_degree",
             "study_field",
             "resume",
+            "resume_upload",
             "cover_letter",
         ]
+        extra_kwargs = {"resume": {"required": False}}
+
+    def validate(self, attrs):
+        if ("resume" in attrs) == ("resume_upload" in attrs):
+            raise serializers.ValidationError(
+                _("یکی از فیلدهای resume یا resume_upload باید ارسال شود.")
+            )
+        return attrs
+
+    def create(self, validated_data):
+        upload = validated_data.pop("resume_upload", None)
+        if upload is not None:
+            validated_data["resume"] = upload.file.name
+
+        application = super().create(validated_data)
+        if upload is not None:
+            upload.delete()
+        return application
+
+
+class ResumeUploadSerializer(serializers.ModelSerializer):
+    completed = serializers.BooleanField(source="is_complete", read_only=True)
+
+    class Meta:
+        model = ResumeUpload
+        fields = ["id", "filename", "size", "sha256", "offset", "completed"]
+        read_only_fields = ["id", "offset"]
+
+    def validate_filename(self, value):
+        validate_resume_filename(value)
+        return value
+
+    def validate_size(self, value):
+        if value < 1:
+            raise serializers.ValidationError(_("فایل خالی است."))
+        validate_resume_size(value)
+        return value
+
+    def validate_sha256(self, value):
+        if not re.fullmatch(r"[0-9a-fA-F]{64}", value):
+            raise serializers.ValidationError(_("هش SHA-256 معتبر نیست."))
+        return value.lower()
@@ -14,4 +14,14 @@ urlpatterns = [
         views.ApplyApplicationViewSet.as_view({"post": "create"}),
         name="create-apply-application",
     ),
+    path(
+        "resume-upload/",
+        views.ResumeUploadViewSet.as_view({"post": "create"}),
+        name="create-resume-upload",
+    ),
+    path(
+        "resume-upload/<uuid:pk>/",
+        views.ResumeUploadViewSet.as_view({"get": "retrieve", "patch": "append"}),
+        name="resume-upload-detail",
+    ),
 ]
@@ -1,34 +1,166 @@
+from django.db import transaction
 from django.shortcuts import render
-from drf_spectacular.utils import extend_schema
-from rest_framework.mixins import CreateModelMixin
+from django.utils.translation import gettext as _
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from rest_framework.exceptions import ValidationError
+from rest_framework.mixins import CreateModelMixin, RetrieveModelMixin
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
-from .serializers import ApplyApplicationSerializer, ContactSerializer, OrderSerializer
+from ingestion.mixins import BufferedCreateMixin
+from jobs.queue import enqueue
+from throttling.throttles import ThrottledSubmissionMixin
+
+from ..models import ResumeUpload
+from ..tasks import notify_admins
+from ..upload_handlers import ResumeUploadHandler
+from ..uploads import append_chunk, receive_chunk, remove_file, start_upload
+from .serializers import (
+    ApplyApplicationSerializer,
+    ContactSerializer,
+    OrderSerializer,
+    ResumeUploadSerializer,
+)
+
+
+class PostProcessingMixin:
+    """
+    Save a submission and enqueue its post-processing jobs in one
+    transaction, leaving slow side effects to the job worker.
+    """
+
+    post_processing_tasks = [notify_admins]
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            instance = serializer.save()
+            for task in self.post_processing_tasks:
+                enqueue(task, model=instance._meta.label, pk=instance.pk)
 
 
 @extend_schema(
     tags=["Submissions"],
     summary="Create a contact",
 )
-class ContactViewSet(CreateModelMixin, GenericViewSet):
+class ContactViewSet(
+    ThrottledSubmissionMixin,
+    BufferedCreateMixin,
+    PostProcessingMixin,
+    CreateModelMixin,
+    GenericViewSet,
+):
     serializer_class = ContactSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "contact"
 
 
 @extend_schema(
     tags=["Submissions"],
     summary="Create an Order",
 )
-class OrderViewSet(CreateModelMixin, GenericViewSet):
+class OrderViewSet(
+    ThrottledSubmissionMixin,
+    BufferedCreateMixin,
+    PostProcessingMixin,
+    CreateModelMixin,
+    GenericViewSet,
+):
     serializer_class = OrderSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "order"
 
 
 @extend_schema(
     tags=["Submissions"],
     summary="Create an apply application",
 )
-class ApplyApplicationViewSet(CreateModelMixin, GenericViewSet):
+class ApplyApplicationViewSet(
+    ThrottledSubmissionMixin, PostProcessingMixin, CreateModelMixin, GenericViewSet
+):
     serializer_class = ApplyApplicationSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "apply-application"
+
+    def initialize_request(self, request, *args, **kwargs):
+        request.upload_handlers.insert(0, ResumeUploadHandler(request))
+        return super().initialize_request(request, *args, **kwargs)
+
+
+@extend_schema_view(
+    create=extend_schema(
+        tags=["Submissions"],
+        summary="Start a resumable resume upload",
+        description="Announce the file name, size and SHA-256 of a resume, then "
+        "send its bytes in order with PATCH requests.",
+    ),
+    retrieve=extend_schema(
+        tags=["Submissions"],
+        summary="Get the offset of a resume upload",
+        description="Return how many bytes were received, to resume an "
+        "interrupted upload.",
+    ),
+    append=extend_schema(
+        tags=["Submissions"],
+        summary="Append a chunk to a resume upload",
+        description="Send raw bytes starting at `Upload-Offset`. The upload is "
+        "completed and verified when the last byte arrives.",
+        request={"application/octet-stream": OpenApiTypes.BINARY},
+        parameters=[
+            OpenApiParameter(
+                "Upload-Offset",
+                OpenApiTypes.INT,
+                OpenApiParameter.HEADER,
+                required=True,
+                description="Offset of the chunk in the file.",
+            ),
+            OpenApiParameter(
+                "Upload-Checksum",
+                OpenApiTypes.STR,
+                OpenApiParameter.HEADER,
+                description="Hex SHA-256 of the chunk.",
+            ),
+        ],
+    ),
+)
+class ResumeUploadViewSet(
+    ThrottledSubmissionMixin, CreateModelMixin, RetrieveModelMixin, GenericViewSet
+):
+    queryset = ResumeUpload.objects.all()
+    serializer_class = ResumeUploadSerializer
+    permission_classes = [AllowAny]
+    throttle_scope = "resume-upload"
+
+    def get_throttles(self):
+        # Chunks only go to uploads that were throttled when created, and
+        # reading their raw body as ``request.data`` would consume it.
+        if self.action != "create":
+            return []
+        return super().get_throttles()
+
+    def perform_create(self, serializer):
+        start_upload(serializer.save())
+
+    def append(self, request, *args, **kwargs):
+        offset = request.headers.get("Upload-Offset", "")
+        length = request.headers.get("Content-Length", "")
+        if not offset.isdigit() or not length.isdigit():
+            raise ValidationError(
+                _("هدرهای Upload-Offset و Content-Length الزامی هستند.")
+            )
+
+        offset, length = int(offset), int(length)
+        upload = self.get_object()
+        part_path = receive_chunk(
+            upload,
+            request.stream,
+            offset,
+            length,
+            checksum=request.headers.get("Upload-Checksum"),
+        )
+        try:
+            upload = append_chunk(upload, part_path, offset, length)
+        finally:
+            remove_file(part_path)
+        return Response(self.get_serializer(upload).data)
@@ -0,0 +1,75 @@
+"""
+Streaming exports of submissions.
+
+Rows are read with ``values_list(...).iterator(chunk_size=...)`` and encoded
+one at a time, so memory use does not grow with the number of rows whether
+the output goes to a ``StreamingHttpResponse`` or a file.
+"""
+
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import ApplyApplication, Contact, Order
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_MODELS = {
+    "contact": Contact,
+    "order": Order,
+    "apply-application": ApplyApplication,
+}
+
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+
+
+class Echo:
+    """A file-like object whose ``write`` returns the written line."""
+
+    def write(self, value):
+        return value
+
+
+def get_export_fields(model) -> list:
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def filter_by_date(queryset, since=None, until=None):
+    """Keep rows created between the ``since`` and ``until`` dates, inclusive."""
+    if since is not None:
+        queryset = queryset.filter(created_at__date__gte=since)
+    if until is not None:
+        queryset = queryset.filter(created_at__date__lte=until)
+    return queryset
+
+
+def iter_rows(queryset, fields):
+    return queryset.values_list(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def iter_csv(queryset):
+    fields = get_export_fields(queryset.model)
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in iter_rows(queryset, fields):
+        yield writer.writerow(row)
+
+
+def iter_jsonl(queryset):
+    fields = get_export_fields(queryset.model)
+    for row in iter_rows(queryset, fields):
+        yield json.dumps(
+            dict(zip(fields, row)), cls=DjangoJSONEncoder, ensure_ascii=False
+        ) + "\n"
+
+
+def iter_export(queryset, format):
+    if format == "csv":
+        return iter_csv(queryset)
+    if format == "jsonl":
+        return iter_jsonl(queryset)
+    raise ValueError(f"Unknown export format {format}.")
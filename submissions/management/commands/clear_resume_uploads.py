@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ...models import ResumeUpload
+from ...uploads import discard_upload
+
+
+class Command(BaseCommand):
+    help = "Delete resume uploads that were abandoned or never attached."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=24,
+            help="Delete uploads started more than this many hours ago.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options["hours"])
+        count = 0
+        for upload in ResumeUpload.objects.filter(created_at__lt=cutoff).iterator():
+            discard_upload(upload)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {count} resume uploads."))
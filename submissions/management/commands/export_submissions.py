@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from ...exports import EXPORT_CONTENT_TYPES, EXPORT_MODELS, filter_by_date, iter_export
+
+
+def date_argument(value):
+    date = parse_date(value)
+    if date is None:
+        raise ValueError(value)
+    return date
+
+
+class Command(BaseCommand):
+    help = "Stream contacts, orders or apply applications as CSV or JSONL."
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=EXPORT_MODELS)
+        parser.add_argument(
+            "--format", choices=EXPORT_CONTENT_TYPES, default="csv", dest="format"
+        )
+        parser.add_argument(
+            "--since", type=date_argument, help="First creation date (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--until", type=date_argument, help="Last creation date (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--output", help="File to write to instead of the standard output."
+        )
+
+    def handle(self, *args, **options):
+        if (
+            options["since"]
+            and options["until"]
+            and options["since"] > options["until"]
+        ):
+            raise CommandError("--since must not be after --until.")
+
+        model = EXPORT_MODELS[options["model"]]
+        queryset = filter_by_date(
+            model.objects.order_by("pk"), options["since"], options["until"]
+        )
+        lines = iter_export(queryset, options["format"])
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as file:
+                file.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
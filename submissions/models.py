@@ -1,3 +1,7 @@
+import os
+import uuid
+
+from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -72,3 +76,33 @@ class ApplyApplication(models.Model):
 
     def __str__(self):
         return f"Resume from {self.first_name} {self.last_name}."
+
+
+class ResumeUpload(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    filename = models.CharField(verbose_name=_("نام فایل"), max_length=255)
+    size = models.PositiveBigIntegerField(verbose_name=_("حجم فایل"))
+    sha256 = models.CharField(verbose_name=_("هش SHA-256"), max_length=64)
+    offset = models.PositiveBigIntegerField(
+        verbose_name=_("بایت‌های دریافت شده"), default=0
+    )
+    file = models.FileField(
+        verbose_name=_("فایل رزومه"), upload_to="resumes/", blank=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("آپلود رزومه")
+        verbose_name_plural = _("آپلودهای رزومه")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Upload {self.id}: {self.filename}."
+
+    @property
+    def is_complete(self):
+        return bool(self.file)
+
+    @property
+    def temporary_path(self):
+        return os.path.join(settings.RESUME_UPLOAD_TEMP_DIR, str(self.id))
@@ -0,0 +1,18 @@
+from django.apps import apps
+from django.core.mail import mail_admins
+from django.utils.translation import gettext as _
+
+from jobs.queue import task
+
+
+@task
+def notify_admins(model: str, pk: int):
+    model_class = apps.get_model(model)
+    submission = model_class.objects.filter(pk=pk).first()
+    if submission is None:
+        return
+
+    mail_admins(
+        subject=_("درخواست جدید: %(type)s") % {"type": model_class._meta.verbose_name},
+        message=str(submission),
+    )
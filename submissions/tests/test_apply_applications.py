@@ -4,13 +4,26 @@ from django.urls import reverse
 from rest_framework import status
 
 
+def get_application_data(resume_file):
+    return {
+        "first_name": "test first name",
+        "last_name": "test last name",
+        "email": "test@email.com",
+        "phone_number": "test phone",
+        "education_degree": "test education degree",
+        "study_field": "test study field",
+        "resume": resume_file,
+        "cover_letter": "test cover letter",
+    }
+
+
 @pytest.mark.django_db
 class TestApplyApplicationCreation:
     url = reverse("create-apply-application")
 
     def test_if_data_valid_returns_201(self, api_client):
 
-        resume_content = b"Fake PDF content for testing"
+        resume_content = b"%PDF-1.4 Fake PDF content for testing"
         resume_file = SimpleUploadedFile(
             "test_resume.pdf", resume_content, content_type="application/pdf"
         )
@@ -57,3 +70,54 @@ class TestApplyApplicationCreation:
         response = api_client.post(self.url, invalid_data)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_if_resume_content_not_pdf_returns_400(self, api_client):
+        resume_file = SimpleUploadedFile(
+            "test_resume.pdf", b"Fake PDF content", content_type="application/pdf"
+        )
+
+        response = api_client.post(self.url, get_application_data(resume_file))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "resume" in response.data
+
+    def test_if_resume_too_large_returns_400(self, api_client, settings):
+        settings.RESUME_UPLOAD_MAX_SIZE = 1024
+        resume_file = SimpleUploadedFile(
+            "test_resume.pdf", b"%PDF-1.4" + b"0" * 2048, content_type="application/pdf"
+        )
+
+        response = api_client.post(self.url, get_application_data(resume_file))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "resume" in response.data
+
+    def test_if_request_too_large_returns_400_before_parsing(
+        self, api_client, settings
+    ):
+        settings.RESUME_UPLOAD_MAX_SIZE = 1024
+        resume_file = SimpleUploadedFile(
+            "test_resume.pdf",
+            b"%PDF-1.4" + b"0" * 128 * 1024,
+            content_type="application/pdf",
+        )
+
+        response = api_client.post(self.url, get_application_data(resume_file))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "resume" in response.data
+
+    def test_if_resume_has_too_many_pages_returns_400(self, api_client, settings):
+        settings.RESUME_MAX_PAGES = 2
+        resume_content = (
+            b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
+            b"2 0 obj\n<< /Kids [3 0 R 4 0 R 5 0 R] /Count 3 /Type /Pages >>\nendobj\n"
+        )
+        resume_file = SimpleUploadedFile(
+            "test_resume.pdf", resume_content, content_type="application/pdf"
+        )
+
+        response = api_client.post(self.url, get_application_data(resume_file))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "resume" in response.data
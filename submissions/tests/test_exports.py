@@ -0,0 +1,134 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from submissions.exports import filter_by_date, iter_export
+from submissions.models import Contact, Order
+
+
+def create_contacts(count):
+    return Contact.objects.bulk_create(
+        Contact(
+            first_name=f"name {index}",
+            last_name="last name",
+            email=f"contact{index}@email.com",
+            phone_number="phone",
+            message='پیام, با "ویرگول"',
+        )
+        for index in range(count)
+    )
+
+
+@pytest.mark.django_db
+class TestSubmissionExports:
+
+    def test_export_csv_streams_header_and_rows(self):
+        create_contacts(3)
+
+        lines = iter_export(Contact.objects.order_by("pk"), "csv")
+        rows = list(csv.reader(io.StringIO("".join(lines))))
+
+        assert rows[0][:3] == ["id", "first_name", "last_name"]
+        assert len(rows) == 4
+        assert rows[1][5] == 'پیام, با "ویرگول"'
+
+    def test_export_jsonl_writes_one_object_per_line(self):
+        create_contacts(2)
+
+        lines = list(iter_export(Contact.objects.order_by("pk"), "jsonl"))
+
+        assert len(lines) == 2
+        assert json.loads(lines[0])["email"] == "contact0@email.com"
+
+    def test_export_does_not_query_before_consumed(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            lines = iter_export(Contact.objects.all(), "csv")
+            next(lines)
+
+    def test_filter_by_date_is_inclusive(self):
+        contacts = create_contacts(3)
+        today = timezone.now()
+        for days, contact in enumerate(contacts):
+            Contact.objects.filter(pk=contact.pk).update(
+                created_at=today - timedelta(days=days)
+            )
+
+        queryset = filter_by_date(
+            Contact.objects.all(),
+            since=(today - timedelta(days=1)).date(),
+            until=today.date(),
+        )
+
+        assert queryset.count() == 2
+
+    def test_export_command_writes_file(self, tmp_path):
+        create_contacts(2)
+        output = tmp_path / "contacts.jsonl"
+
+        call_command(
+            "export_submissions",
+            "contact",
+            format="jsonl",
+            since=date(2000, 1, 1),
+            output=str(output),
+        )
+
+        assert len(output.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_export_command_writes_to_command_stdout(self):
+        create_contacts(2)
+        out = io.StringIO()
+
+        call_command("export_submissions", "contact", format="jsonl", stdout=out)
+
+        assert len(out.getvalue().splitlines()) == 2
+
+    def test_admin_date_range_filter_is_inclusive(self, admin_client):
+        contacts = create_contacts(3)
+        today = timezone.now()
+        for days, contact in enumerate(contacts):
+            Contact.objects.filter(pk=contact.pk).update(
+                created_at=today - timedelta(days=days)
+            )
+
+        response = admin_client.get(
+            reverse("admin:submissions_contact_changelist"),
+            {
+                "created_at__date__gte": (today - timedelta(days=1)).date(),
+                "created_at__date__lte": today.date(),
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.context["cl"].result_count == 2
+
+    def test_admin_export_action_returns_streaming_csv(self, admin_client):
+        Order.objects.create(
+            company_name="company",
+            activity_area="area",
+            email="order@email.com",
+            contact_number="number",
+            explanation="explanation",
+        )
+
+        response = admin_client.post(
+            reverse("admin:submissions_order_changelist"),
+            {
+                "action": "export_csv",
+                "select_across": "1",
+                ACTION_CHECKBOX_NAME: Order.objects.values_list("pk", flat=True),
+            },
+        )
+
+        content = b"".join(response.streaming_content).decode()
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        assert "order@email.com" in content
@@ -0,0 +1,39 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from jobs.models import Job
+from jobs.queue import run_pending_jobs
+
+
+@pytest.mark.django_db
+class TestSubmissionPostProcessing:
+    url = reverse("create-contact")
+    data = {
+        "first_name": "test first name",
+        "last_name": "test last name",
+        "email": "test@email.com",
+        "phone_number": "test phone",
+        "message": "test message",
+    }
+
+    def test_create_contact_enqueues_notification(self, api_client):
+        response = api_client.post(self.url, self.data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Job.objects.get().payload["model"] == "submissions.Contact"
+
+    def test_notification_job_mails_admins(self, api_client, settings, mailoutbox):
+        settings.ADMINS = [("Admin", "admin@example.com")]
+        api_client.post(self.url, self.data)
+
+        run_pending_jobs()
+
+        assert len(mailoutbox) == 1
+        assert "test@email.com" in mailoutbox[0].body
+
+    def test_invalid_submission_enqueues_nothing(self, api_client):
+        response = api_client.post(self.url, {})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Job.objects.exists()
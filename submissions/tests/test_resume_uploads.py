@@ -0,0 +1,189 @@
+import hashlib
+import os
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from submissions.models import ApplyApplication, ResumeUpload
+
+CONTENT = b"%PDF-1.4 resume content " * 100
+
+
+@pytest.fixture(autouse=True)
+def upload_settings(settings, tmp_path):
+    settings.RESUME_UPLOAD_TEMP_DIR = str(tmp_path)
+    settings.RESUME_UPLOAD_CHUNK_SIZE = 1000
+
+
+def start_upload(api_client, content=CONTENT, **data):
+    return api_client.post(
+        reverse("create-resume-upload"),
+        {
+            "filename": "resume.pdf",
+            "size": len(content),
+            "sha256": hashlib.sha256(content).hexdigest(),
+            **data,
+        },
+    )
+
+
+def send_chunk(api_client, upload_id, chunk, offset, **headers):
+    return api_client.patch(
+        reverse("resume-upload-detail", args=[upload_id]),
+        chunk,
+        content_type="application/octet-stream",
+        headers={"Upload-Offset": str(offset), **headers},
+    )
+
+
+def upload_file(api_client, content=CONTENT):
+    upload_id = start_upload(api_client, content).data["id"]
+    for offset in range(0, len(content), 1000):
+        end = offset + 1000
+        chunk = content[offset:end]
+        response = send_chunk(api_client, upload_id, chunk, offset)
+    return response
+
+
+@pytest.mark.django_db
+class TestResumeUploads:
+
+    def test_upload_in_chunks_assembles_file(self, api_client):
+        response = upload_file(api_client)
+
+        upload = ResumeUpload.objects.get()
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["completed"] is True
+        assert upload.offset == len(CONTENT)
+        assert upload.file.read() == CONTENT
+
+    def test_start_upload_over_ip_burst_returns_429(self, api_client, settings):
+        settings.THROTTLE_IP_BURST = 1
+        start_upload(api_client)
+
+        response = start_upload(api_client, filename="other.pdf")
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert ResumeUpload.objects.count() == 1
+
+    def test_chunks_are_not_throttled(self, api_client, settings):
+        settings.THROTTLE_IP_BURST = 1
+
+        response = upload_file(api_client)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["completed"]
+
+    def test_start_upload_with_invalid_file_returns_400(self, api_client):
+        response = start_upload(api_client, filename="resume.txt", sha256="x")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert {"filename", "sha256"} <= set(response.data)
+
+    def test_get_upload_returns_offset_to_resume_from(self, api_client):
+        upload_id = start_upload(api_client).data["id"]
+        send_chunk(api_client, upload_id, CONTENT[:1000], 0)
+
+        response = api_client.get(reverse("resume-upload-detail", args=[upload_id]))
+
+        assert response.data["offset"] == 1000
+        assert response.data["completed"] is False
+
+    def test_chunk_at_wrong_offset_returns_409(self, api_client):
+        upload_id = start_upload(api_client).data["id"]
+
+        response = send_chunk(api_client, upload_id, CONTENT[1000:2000], 1000)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_chunk_with_wrong_checksum_is_discarded(self, api_client, tmp_path):
+        upload_id = start_upload(api_client).data["id"]
+
+        response = send_chunk(
+            api_client, upload_id, CONTENT[:1000], 0, **{"Upload-Checksum": "0" * 64}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert ResumeUpload.objects.get().offset == 0
+        assert not list(tmp_path.glob("*.part"))
+
+    def test_chunk_after_temporary_file_was_removed_restarts_upload(self, api_client):
+        upload_id = start_upload(api_client).data["id"]
+        send_chunk(api_client, upload_id, CONTENT[:1000], 0)
+        os.remove(ResumeUpload.objects.get().temporary_path)
+
+        response = send_chunk(api_client, upload_id, CONTENT[1000:2000], 1000)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert ResumeUpload.objects.get().offset == 0
+        response = send_chunk(api_client, upload_id, CONTENT[:1000], 0)
+        assert response.data["offset"] == 1000
+
+    def test_file_with_wrong_hash_restarts_upload(self, api_client):
+        upload_id = start_upload(api_client, sha256="0" * 64).data["id"]
+
+        for offset in range(0, len(CONTENT), 1000):
+            end = offset + 1000
+            chunk = CONTENT[offset:end]
+            response = send_chunk(api_client, upload_id, chunk, offset)
+
+        upload = ResumeUpload.objects.get()
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert upload.offset == 0
+        assert not upload.is_complete
+
+    def test_create_apply_application_with_completed_upload(self, api_client):
+        upload_file(api_client)
+        upload = ResumeUpload.objects.get()
+
+        response = api_client.post(
+            reverse("create-apply-application"),
+            {
+                "first_name": "test first name",
+                "last_name": "test last name",
+                "email": "test@email.com",
+                "phone_number": "test phone",
+                "education_degree": "test education degree",
+                "study_field": "test study field",
+                "resume_upload": upload.id,
+                "cover_letter": "test cover letter",
+            },
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert ApplyApplication.objects.get().resume.name == upload.file.name
+        assert not ResumeUpload.objects.exists()
+
+    def test_create_apply_application_with_incomplete_upload_returns_400(
+        self, api_client
+    ):
+        upload_id = start_upload(api_client).data["id"]
+
+        response = api_client.post(
+            reverse("create-apply-application"),
+            {"resume_upload": upload_id},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "resume_upload" in response.data
+
+    def test_clear_resume_uploads_deletes_old_uploads(self, api_client):
+        start_upload(api_client)
+        ResumeUpload.objects.update(created_at=timezone.now() - timedelta(days=2))
+
+        call_command("clear_resume_uploads")
+
+        assert not ResumeUpload.objects.exists()
+
+    def test_first_chunk_without_pdf_header_returns_400(self, api_client):
+        content = b"not a pdf" * 200
+        upload_id = start_upload(api_client, content).data["id"]
+
+        response = send_chunk(api_client, upload_id, content[:1000], 0)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert ResumeUpload.objects.get().offset == 0
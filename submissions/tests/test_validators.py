@@ -0,0 +1,21 @@
+from submissions.validators import get_pdf_page_count
+
+
+class TestPdfPageCount:
+
+    def test_reads_count_of_page_tree_root(self):
+        data = (
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>"
+            b"<< /Count 12 /Kids [2 0 R 4 0 R] /Type /Pages >>"
+            b"<< /Type /Page /Parent 2 0 R >>"
+        )
+
+        assert get_pdf_page_count(data) == 12
+
+    def test_reads_count_of_linearized_file(self):
+        data = b"%PDF-1.5\n1 0 obj\n<< /Linearized 1 /L 4000 /N 4 /T 3800 >>"
+
+        assert get_pdf_page_count(data) == 4
+
+    def test_returns_none_without_page_tree(self):
+        assert get_pdf_page_count(b"%PDF-1.4\n<< /Type /Catalog >>") is None
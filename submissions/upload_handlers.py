@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.files.uploadhandler import FileUploadHandler
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+
+from .validators import PDF_MAGIC_OFFSET, validate_pdf_header, validate_resume_size
+
+
+class ResumeUploadHandler(FileUploadHandler):
+    """
+    Reject oversized or non-PDF resumes while the multipart body is parsed.
+
+    The announced ``Content-Length`` is checked before any byte is read, and
+    parsing stops at the first chunk without a PDF header or past the size
+    limit. Chunks are passed on unchanged to the next handlers.
+    """
+
+    resume_field = "resume"
+
+    # Room for the other fields of the form around the resume.
+    form_size = 64 * 1024
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        if content_length > settings.RESUME_UPLOAD_MAX_SIZE + self.form_size:
+            raise ValidationError(
+                {self.resume_field: _("حجم درخواست بیش از حد مجاز است.")}
+            )
+
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+        self.head = b""
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.field_name == self.resume_field:
+            self.received += len(raw_data)
+            self.head += raw_data[: PDF_MAGIC_OFFSET - len(self.head)]
+            self.validate(head_complete=len(self.head) >= PDF_MAGIC_OFFSET)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self.field_name == self.resume_field:
+            self.validate(head_complete=True)
+        return None
+
+    def validate(self, head_complete):
+        try:
+            validate_resume_size(self.received)
+            if head_complete:
+                validate_pdf_header(self.head)
+        except ValidationError as exc:
+            raise ValidationError({self.resume_field: exc.detail})
@@ -0,0 +1,178 @@
+"""
+Resumable chunked resume uploads.
+
+A client creates a :class:`ResumeUpload` with the final size and SHA-256 of
+the file, then sends the bytes in order as raw chunks, each at the offset
+the server has acknowledged. Each chunk is streamed into a part file
+before the upload row is locked, then appended to a temporary file. The
+file is only moved to storage once every byte arrived and the hash
+matches.
+"""
+
+import hashlib
+import os
+import shutil
+import uuid
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from .models import ResumeUpload
+from .validators import PDF_MAGIC_OFFSET, validate_pdf_file, validate_pdf_header
+
+READ_SIZE = 64 * 1024
+
+
+class UploadOffsetConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = _("آفست با بایت‌های دریافت شده مطابقت ندارد.")
+    default_code = "upload_offset_conflict"
+
+
+class UploadFileMissing(UploadOffsetConflict):
+    default_detail = _("فایل موقت آپلود پیدا نشد. آپلود را از ابتدا تکرار کنید.")
+    default_code = "upload_file_missing"
+
+
+def start_upload(upload: ResumeUpload):
+    os.makedirs(settings.RESUME_UPLOAD_TEMP_DIR, exist_ok=True)
+    open(upload.temporary_path, "wb").close()
+
+
+def get_file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for data in iter(lambda: file.read(READ_SIZE), b""):
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def check_chunk(upload: ResumeUpload, offset: int, length: int):
+    if upload.is_complete or offset != upload.offset:
+        raise UploadOffsetConflict()
+    if not 0 < length <= settings.RESUME_UPLOAD_CHUNK_SIZE:
+        raise ValidationError(
+            _("حجم هر بخش باید بین ۱ و %(size)s بایت باشد.")
+            % {"size": settings.RESUME_UPLOAD_CHUNK_SIZE}
+        )
+    if offset + length > upload.size:
+        raise ValidationError(_("حجم بخش‌ها از حجم فایل بیشتر است."))
+
+
+def write_chunk(path, stream, length: int, checksum=None):
+    """
+    Stream ``length`` bytes from ``stream`` into a new file at ``path``,
+    checking them against ``checksum``.
+    """
+    digest = hashlib.sha256()
+    written = 0
+
+    with open(path, "wb") as file:
+        while written < length:
+            data = stream.read(min(READ_SIZE, length - written))
+            if not data:
+                break
+            file.write(data)
+            digest.update(data)
+            written += len(data)
+
+    if written != length:
+        raise ValidationError(_("بخش ارسال شده ناقص است."))
+    if checksum and checksum.lower() != digest.hexdigest():
+        raise ValidationError(_("هش بخش ارسال شده مطابقت ندارد."))
+
+
+def receive_chunk(
+    upload: ResumeUpload, stream, offset: int, length: int, checksum=None
+) -> str:
+    """
+    Stream a chunk of ``upload`` into a part file of its own and return its
+    path, so no row lock or transaction is held while the client sends it.
+    The caller removes the part file.
+    """
+    check_chunk(upload, offset, length)
+    path = f"{upload.temporary_path}.{uuid.uuid4().hex}.part"
+    try:
+        write_chunk(path, stream, length, checksum)
+        if offset == 0:
+            with open(path, "rb") as file:
+                validate_pdf_header(file.read(PDF_MAGIC_OFFSET))
+    except BaseException:
+        remove_file(path)
+        raise
+    return path
+
+
+def append_chunk(
+    upload: ResumeUpload, part_path, offset: int, length: int
+) -> ResumeUpload:
+    """
+    Lock ``upload``, append a received chunk and assemble the file after the
+    last one, returning the updated upload.
+
+    When the temporary file is gone or the assembled file does not match
+    the announced SHA-256, the upload is reset to start over from offset
+    zero and the error is raised after the reset commits.
+    """
+    error = None
+    with transaction.atomic():
+        upload = ResumeUpload.objects.select_for_update().get(pk=upload.pk)
+        check_chunk(upload, offset, length)
+        try:
+            with open(upload.temporary_path, "r+b") as file, open(
+                part_path, "rb"
+            ) as part:
+                file.seek(offset)
+                shutil.copyfileobj(part, file, READ_SIZE)
+                file.truncate()
+        except FileNotFoundError:
+            error = UploadFileMissing()
+        else:
+            upload.offset += length
+            if upload.offset == upload.size:
+                error = assemble_upload(upload)
+
+        if error is None:
+            upload.save(update_fields=["offset", "file"])
+        else:
+            reset_upload(upload)
+
+    if error is not None:
+        raise error
+    return upload
+
+
+def assemble_upload(upload: ResumeUpload):
+    """Move the complete file to storage, or return why it cannot be."""
+    if get_file_sha256(upload.temporary_path) != upload.sha256:
+        return ValidationError(
+            {"sha256": _("هش فایل مطابقت ندارد. آپلود را از ابتدا تکرار کنید.")}
+        )
+
+    with open(upload.temporary_path, "rb") as file:
+        validate_pdf_file(file, upload.size)
+        upload.file.save(upload.filename, File(file), save=False)
+    os.remove(upload.temporary_path)
+    return None
+
+
+def reset_upload(upload: ResumeUpload):
+    start_upload(upload)
+    upload.offset = 0
+    upload.save(update_fields=["offset"])
+
+
+def remove_file(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def discard_upload(upload: ResumeUpload):
+    remove_file(upload.temporary_path)
+    if upload.file:
+        upload.file.delete(save=False)
+    upload.delete()
@@ -1,9 +1,83 @@
+import re
+
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from rest_framework.exceptions import ValidationError
 
+PDF_MAGIC = b"%PDF-"
 
-def validate_resume(file):
-    file_extension = file.name.split(".")[-1]
+# PDF readers accept the header anywhere in the first kilobyte.
+PDF_MAGIC_OFFSET = 1024
+
+PDF_DICTIONARY = re.compile(rb"<<(.*?)>>", re.S)
+PDF_PAGES_COUNT = re.compile(rb"/Type\s*/Pages(?![A-Za-z]).*?/Count\s+(\d+)", re.S)
+PDF_COUNT_PAGES = re.compile(rb"/Count\s+(\d+).*?/Type\s*/Pages(?![A-Za-z])", re.S)
+PDF_LINEARIZED_PAGES = re.compile(rb"/Linearized\b.*?/N\s+(\d+)", re.S)
+
+
+def validate_resume_filename(name):
+    file_extension = name.split(".")[-1]
 
     if file_extension != "pdf":
         raise ValidationError(_("فقط فرمت pdf مجاز است"))
+
+
+def validate_resume_size(size):
+    if size > settings.RESUME_UPLOAD_MAX_SIZE:
+        raise ValidationError(
+            _("حجم فایل باید حداکثر %(size)s بایت باشد.")
+            % {"size": settings.RESUME_UPLOAD_MAX_SIZE}
+        )
+
+
+def validate_pdf_header(head: bytes):
+    if PDF_MAGIC not in head[:PDF_MAGIC_OFFSET]:
+        raise ValidationError(_("محتوای فایل pdf معتبر نیست"))
+
+
+def get_pdf_page_count(data: bytes):
+    """
+    Return the page count declared in ``data`` by a linearization or page
+    tree dictionary, or ``None`` when neither is present in these bytes.
+    """
+    counts = []
+    for dictionary in PDF_DICTIONARY.finditer(data):
+        body = dictionary.group(1)
+        for pattern in (PDF_LINEARIZED_PAGES, PDF_PAGES_COUNT, PDF_COUNT_PAGES):
+            match = pattern.search(body)
+            if match:
+                counts.append(int(match.group(1)))
+                break
+    return max(counts, default=None)
+
+
+def validate_pdf_file(file, size):
+    """
+    Check a PDF by reading only ``RESUME_SNIFF_SIZE`` bytes from its start
+    and end: the header, and the page count when declared there.
+    """
+    sniff_size = settings.RESUME_SNIFF_SIZE
+
+    file.seek(0)
+    head = file.read(sniff_size)
+    validate_pdf_header(head)
+
+    tail = b""
+    if size > sniff_size:
+        file.seek(max(sniff_size, size - sniff_size))
+        tail = file.read(sniff_size)
+    file.seek(0)
+
+    page_counts = [get_pdf_page_count(data) for data in (head, tail)]
+    page_count = max(filter(None, page_counts), default=None)
+    if page_count and page_count > settings.RESUME_MAX_PAGES:
+        raise ValidationError(
+            _("رزومه باید حداکثر %(pages)s صفحه باشد.")
+            % {"pages": settings.RESUME_MAX_PAGES}
+        )
+
+
+def validate_resume(file):
+    validate_resume_filename(file.name)
+    validate_resume_size(file.size)
+    validate_pdf_file(file, file.size)
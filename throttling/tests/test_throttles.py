@@ -0,0 +1,177 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from submissions.models import Contact
+from throttling.throttles import TokenBucket
+
+
+def contact_data(**overrides):
+    return {
+        "first_name": "test first name",
+        "last_name": "test last name",
+        "email": "test@email.com",
+        "phone_number": "0993990",
+        "message": "message valid data",
+        **overrides,
+    }
+
+
+class TestTokenBucket:
+    def test_burst_is_allowed_then_refilled_at_rate(self):
+        bucket = TokenBucket("test-bucket", capacity=2, rate=1)
+
+        assert bucket.consume(now=100) == 0
+        assert bucket.consume(now=100) == 0
+        assert bucket.consume(now=100) == pytest.approx(1)
+        assert bucket.consume(now=100.5) == pytest.approx(0.5)
+        assert bucket.consume(now=101.5) == 0
+
+    def test_bucket_never_exceeds_capacity(self):
+        bucket = TokenBucket("test-bucket", capacity=1, rate=1)
+
+        assert bucket.consume(now=0) == 0
+        assert bucket.consume(now=1000) == 0
+        assert bucket.consume(now=1000) > 0
+
+    def test_concurrent_burst_cannot_share_tokens(self):
+        bucket = TokenBucket("test-bucket", capacity=3, rate=0.01)
+        cache_get = LocMemCache.get
+
+        def slow_get(*args, **kwargs):
+            value = cache_get(*args, **kwargs)
+            time.sleep(0.001)
+            return value
+
+        with mock.patch.object(LocMemCache, "get", slow_get):
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                waits = list(executor.map(lambda _: bucket.consume(), range(10)))
+
+        assert waits.count(0) == 3
+
+
+@pytest.mark.django_db
+class TestSubmissionThrottling:
+
+    url = reverse("create-contact")
+
+    def test_ip_over_burst_returns_429_without_queries(self, api_client, settings):
+        settings.THROTTLE_IP_BURST = 2
+        for index in range(2):
+            response = api_client.post(
+                self.url, contact_data(message=f"message {index}")
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(self.url, contact_data(message="third"))
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in response
+        assert len(queries) == 0
+        assert Contact.objects.count() == 2
+
+    def test_forwarded_for_header_does_not_bypass_ip_bucket(self, api_client, settings):
+        settings.THROTTLE_IP_BURST = 1
+        for index in range(3):
+            response = api_client.post(
+                self.url,
+                contact_data(email=f"user{index}@email.com"),
+                HTTP_X_FORWARDED_FOR=f"203.0.113.{index}",
+            )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert Contact.objects.count() == 1
+
+    def test_email_is_throttled_across_ips(self, api_client, settings):
+        settings.THROTTLE_EMAIL_BURST = 1
+        api_client.post(self.url, contact_data(), REMOTE_ADDR="10.0.0.1")
+
+        response = api_client.post(
+            self.url,
+            contact_data(email=" TEST@email.com", message="other"),
+            REMOTE_ADDR="10.0.0.2",
+        )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_buckets_are_per_endpoint(self, api_client, settings):
+        settings.THROTTLE_IP_BURST = 1
+        api_client.post(self.url, contact_data())
+
+        response = api_client.post(
+            reverse("create-order"),
+            {
+                "company_name": "company",
+                "activity_area": "it",
+                "email": "order@email.com",
+                "contact_number": "0990000000",
+                "explanation": "explanation",
+            },
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_duplicate_submission_returns_409(self, api_client):
+        api_client.post(self.url, contact_data(), REMOTE_ADDR="10.0.0.1")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(self.url, contact_data(), REMOTE_ADDR="10.0.0.2")
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert len(queries) == 0
+        assert Contact.objects.count() == 1
+
+    def test_throttled_request_is_not_remembered_as_duplicate(
+        self, api_client, settings
+    ):
+        settings.THROTTLE_IP_BURST = 1
+        api_client.post(self.url, contact_data(), REMOTE_ADDR="10.0.0.1")
+        api_client.post(self.url, contact_data(message="other"), REMOTE_ADDR="10.0.0.1")
+
+        response = api_client.post(
+            self.url, contact_data(message="other"), REMOTE_ADDR="10.0.0.2"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_duplicate_upload_is_detected_by_file(self, api_client):
+        def post(content):
+            return api_client.post(
+                reverse("create-apply-application"),
+                {
+                    "first_name": "first",
+                    "last_name": "last",
+                    "email": "apply@email.com",
+                    "phone_number": "0990000000",
+                    "education_degree": "BSc",
+                    "study_field": "Architecture",
+                    "cover_letter": "cover letter",
+                    "resume": SimpleUploadedFile(
+                        "resume.pdf", content, content_type="application/pdf"
+                    ),
+                },
+                format="multipart",
+            )
+
+        first = post(b"%PDF-1.4 first resume")
+        duplicate = post(b"%PDF-1.4 first resume")
+
+        assert first.status_code != status.HTTP_409_CONFLICT
+        assert duplicate.status_code == status.HTTP_409_CONFLICT
+
+    def test_disabled_throttling_allows_everything(self, api_client, settings):
+        settings.THROTTLE_ENABLED = False
+        settings.THROTTLE_IP_BURST = 1
+
+        for _ in range(3):
+            response = api_client.post(self.url, contact_data())
+            assert response.status_code == status.HTTP_201_CREATED
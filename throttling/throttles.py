@@ -0,0 +1,187 @@
+"""
+Throttles for the public write endpoints.
+
+Clients get a token bucket per IP and per submitted email, kept in the
+Django cache, and an identical submission is rejected for a while after it
+was first seen. All of it runs in ``APIView.initial``, before the serializer
+validates anything or the database is touched.
+
+A bucket is updated under a short lock taken with ``cache.add``, so the
+concurrent requests of a burst cannot all read the same full bucket. A
+request that cannot get the lock in time is throttled.
+"""
+
+import hashlib
+import json
+import math
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.throttling import BaseThrottle
+
+
+class DuplicateSubmission(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = _("این درخواست قبلا ثبت شده است.")
+    default_code = "duplicate_submission"
+
+
+LOCK_TIMEOUT = 1
+LOCK_ATTEMPTS = 20
+LOCK_RETRY_DELAY = 0.005
+
+
+@contextmanager
+def cache_lock(key):
+    """Hold ``key`` in the cache while the block runs and yield if it was."""
+    for attempt in range(LOCK_ATTEMPTS):
+        if cache.add(key, True, timeout=LOCK_TIMEOUT):
+            try:
+                yield True
+            finally:
+                cache.delete(key)
+            return
+        time.sleep(LOCK_RETRY_DELAY)
+    yield False
+
+
+class TokenBucket:
+    """
+    ``capacity`` tokens refilled at ``rate`` tokens per second, stored in the
+    cache under ``key`` as ``(tokens, updated_at)``.
+    """
+
+    def __init__(self, key, capacity, rate):
+        self.key = key
+        self.capacity = capacity
+        self.rate = rate
+
+    def consume(self, now=None) -> float:
+        """
+        Take a token and return 0, or return the seconds until one is
+        available.
+        """
+        with cache_lock(f"{self.key}:lock") as locked:
+            if not locked:
+                return 1 / self.rate
+
+            now = time.time() if now is None else now
+            tokens, updated_at = cache.get(self.key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated_at) * self.rate)
+
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+
+            timeout = math.ceil(self.capacity / self.rate)
+            cache.set(self.key, (tokens, now), timeout=timeout)
+            return wait
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Throttle by a token bucket per ``get_ident_key`` and view scope."""
+
+    kind = None
+
+    def __init__(self):
+        self.wait_time = None
+
+    def get_bucket_settings(self) -> tuple:
+        kind = self.kind.upper()
+        capacity = getattr(settings, f"THROTTLE_{kind}_BURST")
+        rate = getattr(settings, f"THROTTLE_{kind}_PER_MINUTE") / 60
+        return capacity, rate
+
+    def get_ident_key(self, request):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        if not settings.THROTTLE_ENABLED:
+            return True
+
+        ident = self.get_ident_key(request)
+        if ident is None:
+            return True
+
+        scope = getattr(view, "throttle_scope", view.__class__.__name__)
+        key = f"throttle:{scope}:{self.kind}:{ident}"
+        self.wait_time = TokenBucket(key, *self.get_bucket_settings()).consume()
+        return not self.wait_time
+
+    def wait(self):
+        return self.wait_time
+
+
+class IPRateThrottle(TokenBucketThrottle):
+    kind = "ip"
+
+    def get_ident_key(self, request):
+        return self.get_ident(request)
+
+
+class EmailRateThrottle(TokenBucketThrottle):
+    kind = "email"
+
+    def get_ident_key(self, request):
+        email = request.data.get("email")
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return hashlib.sha256(email.strip().lower().encode()).hexdigest()
+
+
+class DuplicateSubmissionThrottle(BaseThrottle):
+    """
+    Reject a submission whose path and content match one seen within
+    ``THROTTLE_DUPLICATE_WINDOW`` seconds. Uploaded files are compared by
+    name and size.
+    """
+
+    def allow_request(self, request, view):
+        if not settings.THROTTLE_ENABLED:
+            return True
+
+        key = f"throttle:duplicate:{get_content_hash(request)}"
+        if not cache.add(key, True, timeout=settings.THROTTLE_DUPLICATE_WINDOW):
+            raise DuplicateSubmission()
+        return True
+
+
+def get_content_hash(request) -> str:
+    content = {
+        name: [
+            (value.name, value.size) if hasattr(value, "read") else value
+            for value in values
+        ]
+        for name, values in get_data_lists(request).items()
+    }
+    payload = json.dumps([request.path, content], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_data_lists(request) -> dict:
+    data = request.data
+    if hasattr(data, "lists"):
+        return dict(data.lists())
+    return {name: [value] for name, value in data.items()}
+
+
+class ThrottledSubmissionMixin:
+    """
+    Throttle by IP, then by email, then reject duplicates, stopping at the
+    first throttle that refuses so a rejected request is not counted twice
+    or remembered as a duplicate.
+    """
+
+    throttle_classes = [IPRateThrottle, EmailRateThrottle, DuplicateSubmissionThrottle]
+
+    def check_throttles(self, request):
+        for throttle in self.get_throttles():
+            if not throttle.allow_request(request, self):
+                self.throttled(request, throttle.wait())